@@ -0,0 +1,167 @@
+"""
+Benchmark of the requests/s served by concurrent workers, with the default SQLite settings of Django
+(rollback journal, a new connection per request) versus the project ones (WAL mode, pragmas,
+busy timeout and persistent connections).
+
+Builds a throwaway SQLite database with synthetic events, then runs each configuration
+in its own process, where worker threads drive the WSGI application with a mix of list reads
+and (un-)registration writes for a fixed duration.
+
+Usage:
+    python benchmarks/bench_db_settings.py [--workers 8] [--duration 10] [--write-ratio 0.2]
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from wsgiref.util import setup_testing_defaults
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'event_manager.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+CONFIGS = {
+    'django defaults': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'CONN_MAX_AGE': 0,
+        'CONN_HEALTH_CHECKS': False,
+        'OPTIONS': {},
+    },
+    'project settings': {},
+}
+
+
+def seed(workers: int) -> None:
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+
+    from events.models import Event
+
+    users = User.objects.bulk_create(User(username=f'bench-{i}') for i in range(workers))
+    Event.objects.bulk_create(
+        Event(
+            title=f'event {i}',
+            place='somewhere',
+            organizer=random.choice(users),
+            timestamp=timezone.now() + timedelta(days=1, minutes=i),
+        )
+        for i in range(200)
+    )
+
+
+def run_workers(workers: int, duration: float, write_ratio: float) -> dict:
+    from django.contrib.auth.models import User
+    from django.core.wsgi import get_wsgi_application
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from events.models import Event
+
+    application = get_wsgi_application()
+    tokens = [str(RefreshToken.for_user(user).access_token) for user in User.objects.order_by('pk')[:workers]]
+    event_ids = list(Event.objects.values_list('pk', flat=True))
+
+    def request(method: str, path: str, token: str) -> int:
+        environ = {
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path,
+            'HTTP_HOST': 'localhost',
+            'HTTP_AUTHORIZATION': f'JWT {token}',
+            'wsgi.input': io.BytesIO(),
+        }
+        setup_testing_defaults(environ)
+        statuses = []
+        response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+        try:
+            b''.join(response)
+        finally:
+            response.close()
+        return int(statuses[0].split()[0])
+
+    timings, errors = [], []
+    deadline = time.perf_counter() + duration
+
+    def worker(token: str) -> None:
+        registered = set()
+        while time.perf_counter() < deadline:
+            if random.random() < write_ratio:
+                event_id = random.choice(event_ids)
+                action = 'un-register' if event_id in registered else 'register'
+                registered ^= {event_id}
+                method, path = 'POST', f'/api/v1/events/{event_id}/{action}/'
+            else:
+                method, path = 'GET', '/api/v1/events/'
+
+            start = time.perf_counter()
+            status = request(method, path, token)
+            timings.append(time.perf_counter() - start)
+            if status >= 500:
+                errors.append(status)
+
+    threads = [threading.Thread(target=worker, args=(token, )) for token in tokens]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return {
+        'requests_per_second': len(timings) / duration,
+        'p50_ms': statistics.median(timings) * 1000,
+        'p99_ms': statistics.quantiles(timings, n=100)[-1] * 1000,
+        'errors': len(errors),
+    }
+
+
+def run_config(name: str, args) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings.DATABASES['default'].update({'NAME': Path(tmp_dir) / 'bench.sqlite3', **CONFIGS[name]})
+        settings.EVENTS['LIST_CACHE_TIMEOUT'] = 0
+        settings.DEBUG = False
+        django.setup()
+
+        from django.core.management import call_command
+
+        call_command('migrate', verbosity=0)
+        seed(args.workers)
+        print(json.dumps(run_workers(args.workers, args.duration, args.write_ratio)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--config', choices=CONFIGS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.config:
+        run_config(args.config, args)
+        return
+
+    print(f'{"configuration":<20}{"req/s":>10}{"p50 (ms)":>10}{"p99 (ms)":>10}{"errors":>8}')
+    for name in CONFIGS:
+        # A process per configuration, as database settings are read once
+        output = subprocess.run(
+            [sys.executable, __file__, '--config', name, *sys.argv[1:]],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f'{name:<20}{result["requests_per_second"]:>10.1f}{result["p50_ms"]:>10.1f}'
+            f'{result["p99_ms"]:>10.1f}{result["errors"]:>8}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark of the events list latency, without and with the indexes of `Event.Meta.indexes`.
+
+Builds a throwaway SQLite database with synthetic events, then times the list endpoint
+for the common filters, first after dropping the indexes and then after re-creating them.
+
+Usage:
+    python benchmarks/bench_list_indexes.py [--events 1000000] [--repeat 10]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'event_manager.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+SCENARIOS = (
+    ('default ordering', {}),
+    ('only_future + PUBLISHED', {'only_future': 'true', 'status': 'PUBLISHED'}),
+    ('status=HIDDEN', {'status': 'HIDDEN'}),
+    ('organizer', {'organizer': '1'}),
+    ('only_mine', {'only_mine': 'true'}),
+    ('cursor pagination', {'pagination': 'cursor'}),
+)
+
+
+def seed(events_count: int) -> None:
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+
+    from events.models import Event
+
+    users = User.objects.bulk_create(User(username=f'bench-{i}') for i in range(1000))
+    now = timezone.now()
+    batch_size = 10_000
+    for offset in range(0, events_count, batch_size):
+        Event.objects.bulk_create(
+            Event(
+                title=f'event {i}',
+                place='somewhere',
+                organizer=random.choice(users),
+                status=Event.Status.PUBLISHED if random.random() < 0.9 else Event.Status.HIDDEN,
+                timestamp=now + timedelta(minutes=random.randint(-1_000_000, 1_000_000)),
+            )
+            for i in range(offset, min(offset + batch_size, events_count))
+        )
+
+
+def measure(repeat: int) -> dict[str, float]:
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from events.views import EventViewSet
+
+    view = EventViewSet.as_view({'get': 'list'})
+    factory = APIRequestFactory()
+    user = User.objects.get(pk=1)
+
+    results = {}
+    for name, params in SCENARIOS:
+        timings = []
+        for _ in range(repeat):
+            request = factory.get('/api/v1/events/', params, HTTP_HOST='localhost')
+            force_authenticate(request, user=user)
+            start = time.perf_counter()
+            response = view(request)
+            response.render()
+            timings.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.data
+        results[name] = statistics.median(timings)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings.DATABASES['default']['NAME'] = Path(tmp_dir) / 'bench.sqlite3'
+        django.setup()
+
+        from django.core.management import call_command
+        from django.db import connection
+
+        from events.models import Event
+
+        call_command('migrate', verbosity=0)
+        print(f'Seeding {args.events} events...')
+        seed(args.events)
+
+        with connection.schema_editor() as schema_editor:
+            for index in Event._meta.indexes:
+                schema_editor.remove_index(Event, index)
+        connection.cursor().execute('ANALYZE')
+        before = measure(args.repeat)
+
+        with connection.schema_editor() as schema_editor:
+            for index in Event._meta.indexes:
+                schema_editor.add_index(Event, index)
+        connection.cursor().execute('ANALYZE')
+        after = measure(args.repeat)
+
+    print(f'{"scenario":<28}{"before (ms)":>14}{"after (ms)":>14}')
+    for name, _ in SCENARIOS:
+        print(f'{name:<28}{before[name]:>14.1f}{after[name]:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+"""
+Performance regression suite of the events API, on a synthetic production-scale dataset.
+
+Builds a throwaway SQLite database seeded by `manage.py seed_events` (with a fixed random seed),
+then times `EventViewSet.list` (with each filter, search and ordering), `register`, `un_register`
+and `EventSerializer`, recording their query counts and p50/p99 latencies.
+Results are compared against the stored baseline (`benchmarks/baseline.json`): a scenario
+running more queries than its baseline, or slower beyond the tolerance, fails the suite (exit code 1).
+Latencies depend on the machine, so refresh the baseline (`--update-baseline`) on the machine
+running the comparisons, from a known-good revision.
+
+Usage:
+    python benchmarks/bench_suite.py [--events 200000] [--repeat 30] [--tolerance 0.25] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'event_manager.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / 'baseline.json'
+
+LIST_SCENARIOS = (
+    ('list', {}),
+    ('list status=HIDDEN', {'status': 'HIDDEN'}),
+    ('list organizer', {'organizer': '{organizer}'}),
+    ('list categories', {'categories': '{category}'}),
+    ('list timestamp range', {'timestamp__gte': '{now}', 'timestamp__lte': '{next_week}'}),
+    ('list only_mine', {'only_mine': 'true'}),
+    ('list only_future', {'only_future': 'true'}),
+    ('list only_past', {'only_past': 'true'}),
+    ('list search', {'search': 'jazz'}),
+    ('list search + only_future', {'search': 'python workshop', 'only_future': 'true'}),
+    ('list ordering title', {'ordering': 'title'}),
+    ('list ordering -attendees_count', {'ordering': '-attendees_count'}),
+    ('list ordering capacity', {'ordering': 'capacity'}),
+    ('list cursor pagination', {'pagination': 'cursor'}),
+    ('list page 100', {'page': '100'}),
+)
+
+
+def seed(args) -> None:
+    from django.core.management import call_command
+
+    call_command(
+        'seed_events',
+        events=args.events,
+        users=args.users,
+        categories=args.categories,
+        seed=args.seed,
+        verbosity=0,
+    )
+
+
+def time_calls(call, repeat: int, before=None) -> dict:
+    """
+    Returns the (highest) query count and the p50/p99 latencies of the call, after a warm-up one.
+    `before` runs ahead of each call, untimed.
+    """
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    timings, query_counts = [], []
+    for _ in range(repeat + 1):
+        if before is not None:
+            before()
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - start) * 1000)
+        query_counts.append(len(queries))
+
+    return {
+        'queries': max(query_counts[1:]),
+        'p50_ms': round(statistics.median(timings[1:]), 3),
+        'p99_ms': round(statistics.quantiles(timings[1:], n=100, method='inclusive')[-1], 3),
+    }
+
+
+def measure(repeat: int) -> dict[str, dict]:
+    from datetime import timedelta
+
+    from django.contrib.auth.models import User
+    from django.db.models import Count
+    from django.utils import timezone
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from events.models import Event
+    from events.serializers import EventSerializer
+    from events.views import EventViewSet
+
+    factory = APIRequestFactory()
+    # The busiest organizer and category, as the worst cases of their filters
+    organizer = User.objects.annotate(events_count=Count('event')).order_by('-events_count').first()
+    category_id = Event.categories.through.objects.values('category_id').annotate(
+        events_count=Count('event_id'),
+    ).order_by('-events_count').values_list('category_id', flat=True).first()
+    now = timezone.now()
+    placeholders = {
+        'organizer': organizer.pk,
+        'category': category_id,
+        'now': now.isoformat(),
+        'next_week': (now + timedelta(days=7)).isoformat(),
+    }
+
+    def call_view(actions: dict, method: str, path: str, params: dict = None, user=organizer, check=True, **kwargs):
+        request = getattr(factory, method)(path, params or {}, HTTP_HOST='localhost')
+        force_authenticate(request, user=user)
+        response = EventViewSet.as_view(actions)(request, **kwargs)
+        response.render()
+        assert not check or response.status_code < 400, (path, params, response.data)
+        return response
+
+    results = {}
+    for name, params in LIST_SCENARIOS:
+        params = {key: value.format(**placeholders) for key, value in params.items()}
+        results[name] = time_calls(lambda: call_view({'get': 'list'}, 'get', '/api/v1/events/', params), repeat)
+
+    # (Un-)registering a user without registrations to an unlimited future event, back and forth
+    event = Event.objects.filter(
+        status=Event.Status.PUBLISHED, capacity__isnull=True, timestamp__gt=now + timedelta(days=1),
+    ).order_by('-attendees_count').first()
+    user = User.objects.create(username='bench-suite')
+    path = f'/api/v1/events/{event.pk}/'
+
+    def register(check: bool = True):
+        return call_view({'post': 'register'}, 'post', path, user=user, check=check, pk=event.pk)
+
+    def un_register(check: bool = True):
+        return call_view({'post': 'un_register'}, 'post', path, user=user, check=check, pk=event.pk)
+
+    results['register'] = time_calls(register, repeat, before=lambda: un_register(check=False))
+    results['un_register'] = time_calls(un_register, repeat, before=lambda: register(check=False))
+
+    events = list(Event.objects.order_by('-timestamp').prefetch_related('categories')[:25])
+    results['EventSerializer (page of 25)'] = time_calls(lambda: EventSerializer(events, many=True).data, repeat)
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float, slack_ms: float) -> list[str]:
+    """
+    Returns the regressions of the results against the baseline: more queries, or latencies
+    above the baseline ones by more than the (relative) tolerance and the (absolute) slack.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result['queries'] > expected['queries']:
+            regressions.append(f'{name}: {result["queries"]} queries (baseline {expected["queries"]})')
+        for metric in ('p50_ms', 'p99_ms'):
+            limit = max(expected[metric] * (1 + tolerance), expected[metric] + slack_ms)
+            if result[metric] > limit:
+                regressions.append(
+                    f'{name}: {metric} {result[metric]:.1f} > {limit:.1f} (baseline {expected[metric]:.1f})'
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=200_000)
+    parser.add_argument('--users', type=int, default=20_000)
+    parser.add_argument('--categories', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative slowdown of latencies')
+    parser.add_argument('--slack-ms', type=float, default=2, help='Allowed absolute slowdown of latencies (ms)')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help='Store the results as the new baseline')
+    args = parser.parse_args()
+
+    dataset = {'events': args.events, 'users': args.users, 'categories': args.categories, 'seed': args.seed}
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    if baseline is not None and baseline['dataset'] != dataset and not args.update_baseline:
+        sys.exit(f'The baseline was recorded on another dataset ({baseline["dataset"]}), run with the same options')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings.DATABASES['default']['NAME'] = Path(tmp_dir) / 'bench.sqlite3'
+        # Measuring the views, not the response cache of the list
+        settings.EVENTS['LIST_CACHE_TIMEOUT'] = 0
+        settings.DEBUG = False
+        django.setup()
+
+        from django.core.management import call_command
+
+        call_command('migrate', verbosity=0)
+        print(f'Seeding {args.events} events...')
+        seed(args)
+        results = measure(args.repeat)
+
+    expected = baseline['scenarios'] if baseline is not None else {}
+    print(f'{"scenario":<34}{"queries":>8}{"p50 (ms)":>10}{"p99 (ms)":>10}{"base p50":>10}{"base p99":>10}')
+    for name, result in results.items():
+        base = expected.get(name, {})
+        print(
+            f'{name:<34}{result["queries"]:>8}{result["p50_ms"]:>10.1f}{result["p99_ms"]:>10.1f}'
+            f'{base.get("p50_ms", float("nan")):>10.1f}{base.get("p99_ms", float("nan")):>10.1f}'
+        )
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps({'dataset': dataset, 'scenarios': results}, indent=2) + '\n')
+        print(f'Baseline stored in {args.baseline}')
+        return
+
+    regressions = compare(results, expected, args.tolerance, args.slack_ms)
+    if regressions:
+        print('\nREGRESSIONS:', *regressions, sep='\n  ')
+        sys.exit(1)
+    print('\nNo regression against the baseline' if baseline is not None else '\nNo baseline to compare against')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Load benchmark of the events read paths, WSGI (DRF views, one thread per concurrent client)
+versus ASGI (async views, concurrent clients as tasks of a single event loop).
+
+Builds a throwaway SQLite database with synthetic events, then drives the list and detail
+endpoints in-process through the WSGI and ASGI handlers, with the same number of concurrent clients,
+and reports the throughput (requests/s) and the median latency of each.
+In-process, the figures compare the cost of the handlers and views; the gain of ASGI on slow clients
+(connections held open without holding a worker thread) shows behind a real server (e.g. uvicorn).
+
+Usage:
+    python benchmarks/bench_wsgi_asgi.py [--events 10000] [--concurrency 50] [--requests 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'event_manager.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+SCENARIOS = (
+    ('list', '/api/v1/events/', '/api/v1/async/events/', {}),
+    ('list only_future', '/api/v1/events/', '/api/v1/async/events/', {'only_future': 'true'}),
+    ('detail', '/api/v1/events/{pk}/', '/api/v1/async/events/{pk}/', {}),
+)
+
+
+def seed(events_count: int) -> tuple[str, list[int]]:
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from events.models import Event
+
+    users = User.objects.bulk_create(User(username=f'bench-{i}') for i in range(100))
+    now = timezone.now()
+    events = Event.objects.bulk_create(
+        Event(
+            title=f'event {i}',
+            place='somewhere',
+            organizer=random.choice(users),
+            timestamp=now + timedelta(minutes=random.randint(-100_000, 100_000)),
+        )
+        for i in range(events_count)
+    )
+    return str(RefreshToken.for_user(users[0]).access_token), [event.pk for event in events]
+
+
+def run_wsgi(path: str, params: dict, token: str, event_ids: list[int], concurrency: int, requests: int):
+    from django.test import Client
+
+    def client_loop(count: int) -> list[float]:
+        client = Client(HTTP_AUTHORIZATION=f'JWT {token}')
+        timings = []
+        for _ in range(count):
+            start = time.perf_counter()
+            response = client.get(path.format(pk=random.choice(event_ids)), params)
+            timings.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.content
+        return timings
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(client_loop, [requests // concurrency] * concurrency))
+    return time.perf_counter() - start, [timing for timings in results for timing in timings]
+
+
+def run_asgi(path: str, params: dict, token: str, event_ids: list[int], concurrency: int, requests: int):
+    from django.test import AsyncClient
+
+    async def client_loop(count: int) -> list[float]:
+        client = AsyncClient()
+        timings = []
+        for _ in range(count):
+            start = time.perf_counter()
+            response = await client.get(
+                path.format(pk=random.choice(event_ids)), params, headers={'authorization': f'JWT {token}'},
+            )
+            timings.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.content
+        return timings
+
+    async def run():
+        return await asyncio.gather(*(client_loop(requests // concurrency) for _ in range(concurrency)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    return time.perf_counter() - start, [timing for timings in results for timing in timings]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=10_000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings.DATABASES['default']['NAME'] = Path(tmp_dir) / 'bench.sqlite3'
+        # Measuring the views, not the response cache of the (sync) list
+        settings.EVENTS['LIST_CACHE_TIMEOUT'] = 0
+        settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+        django.setup()
+
+        from django.core.management import call_command
+
+        call_command('migrate', verbosity=0)
+        print(f'Seeding {args.events} events...')
+        token, event_ids = seed(args.events)
+
+        print(f'{"scenario":<20}{"WSGI (req/s)":>14}{"ASGI (req/s)":>14}{"WSGI p50 (ms)":>15}{"ASGI p50 (ms)":>15}')
+        for name, wsgi_path, asgi_path, params in SCENARIOS:
+            wsgi_elapsed, wsgi_timings = run_wsgi(
+                wsgi_path, params, token, event_ids, args.concurrency, args.requests,
+            )
+            asgi_elapsed, asgi_timings = run_asgi(
+                asgi_path, params, token, event_ids, args.concurrency, args.requests,
+            )
+            print(
+                f'{name:<20}'
+                f'{len(wsgi_timings) / wsgi_elapsed:>14.1f}'
+                f'{len(asgi_timings) / asgi_elapsed:>14.1f}'
+                f'{statistics.median(wsgi_timings) * 1000:>15.1f}'
+                f'{statistics.median(asgi_timings) * 1000:>15.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
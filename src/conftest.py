@@ -0,0 +1,12 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Isolating tests from the responses/counters cached by previous ones.
+    """
+
+    cache.clear()
+    yield
@@ -34,6 +34,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, to time the whole stack (removed unless `EVENTS['METRICS_ENABLED']`)
+    'events.middleware.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -67,12 +69,80 @@ WSGI_APPLICATION = 'event_manager.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
-DATABASES = {
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'event_manager'),
+            'USER': os.environ.get('DB_USER', ''),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', ''),
+            'PORT': os.environ.get('DB_PORT', ''),
+            # Persistent connections (per worker thread), checked before reuse
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+            # Behind a transaction pooler (e.g. PgBouncer), cursors do not outlive transactions
+            'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DB_POOLER') == 'pgbouncer',
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            # SQLite backend applying `OPTIONS['pragmas']`
+            'ENGINE': 'event_manager.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                # Seconds to wait for the lock of the database (busy timeout)
+                'timeout': int(os.environ.get('DB_TIMEOUT', 20)),
+                'pragmas': {
+                    # Readers do not block the writer (and vice versa)
+                    'journal_mode': 'WAL',
+                    # Durable at checkpoints only, safe from corruption in WAL mode
+                    'synchronous': 'NORMAL',
+                    'foreign_keys': 'ON',
+                    'temp_store': 'MEMORY',
+                    # 64 MiB of page cache and memory mapped I/O
+                    'cache_size': -64 * 1024,
+                    'mmap_size': 64 * 1024 * 1024,
+                },
+            },
+            # File based test database, so that concurrent connections wait on locks like in production
+            'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
+        }
+    }
+
+# Read replicas of the default database, as comma separated SQLite files (kept in sync out of Django)
+# or PostgreSQL hosts (`host[:port]`), sharing the configuration of the default database
+for index, replica in enumerate(filter(None, os.environ.get('DB_REPLICAS', '').split(',')), start=1):
+    if DB_ENGINE == 'postgresql':
+        host, _, port = replica.partition(':')
+        location = {'HOST': host, 'PORT': port}
+    else:
+        location = {'NAME': replica}
+    DATABASES[f'replica_{index}'] = {**DATABASES['default'], **location, 'TEST': {'MIRROR': 'default'}}
+
+DATABASE_ROUTERS = [
+    'events.replicas.ReplicaRouter',
+]
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
+if os.environ.get('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+    }
 
 
 # Password validation
@@ -117,6 +187,27 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# # Project apps settings
+
+# events
+EVENTS = {
+    'LIST_CACHE_TIMEOUT': int(os.environ.get('EVENTS_LIST_CACHE_TIMEOUT', 30)),
+    'READ_REPLICAS': [alias for alias in DATABASES if alias != 'default'],
+    'REPLICA_STICKINESS': int(os.environ.get('EVENTS_REPLICA_STICKINESS', 5)),
+    'CALENDAR_CACHE_TIMEOUT': int(os.environ.get('EVENTS_CALENDAR_CACHE_TIMEOUT', 3600)),
+    'AUTH_USER_CACHE_TIMEOUT': int(os.environ.get('EVENTS_AUTH_USER_CACHE_TIMEOUT', 60)),
+    'AUTH_STATELESS_READS': bool(int(os.environ.get('EVENTS_AUTH_STATELESS_READS', 0))),
+    'REGISTRATION_STATE_CACHE_TIMEOUT': int(os.environ.get('EVENTS_REGISTRATION_STATE_CACHE_TIMEOUT', 5)),
+    'METRICS_ENABLED': bool(int(os.environ.get('EVENTS_METRICS_ENABLED', 0))),
+    'METRICS_TOKEN': os.environ.get('EVENTS_METRICS_TOKEN') or None,
+}
+if os.environ.get('EVENTS_ARCHIVE_AFTER_DAYS'):
+    EVENTS['ARCHIVE_AFTER_DAYS'] = int(os.environ['EVENTS_ARCHIVE_AFTER_DAYS'])
+if os.environ.get('REDIS_URL'):
+    EVENTS['BROKER'] = 'events.broker.redis_broker.RedisBroker'
+    EVENTS['BROKER_URL'] = os.environ['REDIS_URL']
+
+
 # # External libraries settings
 
 # djoser
@@ -135,11 +226,16 @@ SIMPLE_JWT = {
 # djangorestframework (drf)
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'events.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_RENDERER_CLASSES': (
         'rest_framework.renderers.JSONRenderer',
     ),
+    # Token buckets of the (un-)registrations (see `events.throttling`), unlimited when empty
+    'DEFAULT_THROTTLE_RATES': {
+        'registration_user': os.environ.get('EVENTS_REGISTRATION_USER_RATE', '30/min') or None,
+        'registration_event': os.environ.get('EVENTS_REGISTRATION_EVENT_RATE', '1000/s') or None,
+    },
 }
 
 # Django settings for debug mode
@@ -4,10 +4,21 @@ from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from rest_framework.routers import DefaultRouter
 
-from events.views import EventViewSet
+from events.views import (
+    AsyncEventDetailView,
+    AsyncEventListView,
+    AsyncEventRegisterView,
+    AsyncEventSeatsView,
+    CategoryCalendarFeedView,
+    EventsCalendarFeedView,
+    EventViewSet,
+    MeEventViewSet,
+    MetricsView,
+)
 
 drf_router_v1 = DefaultRouter()
 drf_router_v1.register(r'events', EventViewSet, basename='events')
+drf_router_v1.register(r'me/events', MeEventViewSet, basename='me-events')
 
 urlpatterns = [
     # Admin
@@ -16,6 +27,27 @@ urlpatterns = [
     # API views
     path('api/v1/', include(drf_router_v1.urls)),
 
+    # Async (ASGI native) API views of the events read paths and registration
+    path('api/v1/async/events/', AsyncEventListView.as_view(), name='async-events-list'),
+    path('api/v1/async/events/seats/', AsyncEventSeatsView.as_view(), name='async-events-seats'),
+    path('api/v1/async/events/<int:pk>/', AsyncEventDetailView.as_view(), name='async-events-detail'),
+    path(
+        'api/v1/async/events/<int:pk>/register/',
+        AsyncEventRegisterView.as_view(),
+        name='async-events-register',
+    ),
+
+    # iCalendar feeds (authenticated by the signed token of the user)
+    path('api/v1/calendar/<str:token>/events.ics', EventsCalendarFeedView.as_view(), name='calendar-events'),
+    path(
+        'api/v1/calendar/<str:token>/categories/<int:pk>.ics',
+        CategoryCalendarFeedView.as_view(),
+        name='calendar-category',
+    ),
+
+    # Prometheus metrics of the instrumentation middleware
+    path('metrics', MetricsView.as_view(), name='metrics'),
+
     # Djoser (register + login/refresh/validate token endpoints)
     path('api/v1/', include('djoser.urls')),
     path('api/v1/', include('djoser.urls.jwt')),
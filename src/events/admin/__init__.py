@@ -1,2 +1,4 @@
+from events.admin.archived_event_admin import ArchivedEventAdmin
 from events.admin.category_admin import CategoryAdmin
 from events.admin.event_admin import EventAdmin
+from events.admin.waitlist_entry_admin import WaitlistEntryAdmin
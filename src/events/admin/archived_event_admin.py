@@ -0,0 +1,41 @@
+from django.contrib import admin
+
+from events.models import ArchivedEvent
+
+
+@admin.register(ArchivedEvent)
+class ArchivedEventAdmin(admin.ModelAdmin):
+    """
+    Read only admin of the archived events (moved by the `archive_events` command)
+    """
+
+    list_display = (
+        'title',
+        'place',
+        'timestamp',
+        'organizer',
+        'status',
+        'attendees_count',
+        'archived_at',
+    )
+
+    search_fields = (
+        'title',
+        'place',
+        'description',
+    )
+    list_filter = (
+        'timestamp',
+        'archived_at',
+        'status',
+    )
+    sortable_by = (
+        'timestamp',
+        'archived_at',
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
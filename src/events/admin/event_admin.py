@@ -11,10 +11,12 @@ class EventAdmin(admin.ModelAdmin):
         'timestamp',
         'organizer',
         'status',
+        'attendees_count',
         'created_at',
         'updated_at',
     )
     readonly_fields = (
+        'attendees_count',
         'created_at',
         'updated_at',
     )
@@ -0,0 +1,27 @@
+from django.contrib import admin
+
+from events.models import WaitlistEntry
+
+
+@admin.register(WaitlistEntry)
+class WaitlistEntryAdmin(admin.ModelAdmin):
+    list_display = (
+        'event',
+        'user',
+        'created_at',
+    )
+    readonly_fields = (
+        'created_at',
+    )
+
+    raw_id_fields = (
+        'event',
+        'user',
+    )
+
+    list_filter = (
+        'created_at',
+    )
+    sortable_by = (
+        'created_at',
+    )
@@ -0,0 +1,46 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from events.conf import get_setting
+
+REGISTRATION_STATE_KEY = 'events:registration:state:{event_id}'
+
+
+def get_registration_state(event_id) -> dict | None:
+    """
+    Returns the cached registration state of the event (`timestamp`, `status` and `is_full`),
+    if any, for the (un-)registrations to reject without touching the database.
+    """
+
+    if not get_setting('REGISTRATION_STATE_CACHE_TIMEOUT'):
+        return None
+    return cache.get(REGISTRATION_STATE_KEY.format(event_id=event_id))
+
+
+def set_registration_state(event, is_full: bool = False) -> None:
+    """
+    Caches the registration state of the event for `EVENTS['REGISTRATION_STATE_CACHE_TIMEOUT']` seconds,
+    once it rejected an (un-)registration (past, not published or full event).
+    """
+
+    cache_timeout = get_setting('REGISTRATION_STATE_CACHE_TIMEOUT')
+    if not cache_timeout:
+        return
+
+    cache.set(
+        REGISTRATION_STATE_KEY.format(event_id=event.pk),
+        {'timestamp': event.timestamp, 'status': event.status, 'is_full': is_full},
+        cache_timeout,
+    )
+
+
+def invalidate_registration_state(event_ids: list, using: str = None) -> None:
+    """
+    Drops the cached registration state of the events, now and once the transaction commits
+    (not to cache it again in between). A state cached from a read racing with the change
+    lasts until its timeout at most.
+    """
+
+    keys = [REGISTRATION_STATE_KEY.format(event_id=event_id) for event_id in event_ids]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys), using=using)
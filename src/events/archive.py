@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from events.models import ArchivedEvent, Event
+
+DEFAULT_BATCH_SIZE = 500
+
+# Fields copied as they are from the events table to the archive one
+EVENT_FIELDS = (
+    'id',
+    'title',
+    'organizer',
+    'status',
+    'place',
+    'timestamp',
+    'description',
+    'capacity',
+    'attendees_count',
+    'created_at',
+    'updated_at',
+    'details_updated_at',
+)
+
+
+def _columns(model, field_names) -> list[str]:
+    return [model._meta.get_field(field_name).column for field_name in field_names]
+
+
+def _copy_relation(cursor, quote_name, field_name: str, placeholders: str, event_ids: list[int]) -> None:
+    """
+    Copies the rows of a many-to-many (join) table of the events to its archive counterpart,
+    with a single INSERT ... SELECT.
+    """
+
+    source = Event._meta.get_field(field_name)
+    target = ArchivedEvent._meta.get_field(field_name)
+    source_columns = _columns(source.remote_field.through, (source.m2m_field_name(), source.m2m_reverse_field_name()))
+    target_columns = _columns(target.remote_field.through, (target.m2m_field_name(), target.m2m_reverse_field_name()))
+
+    cursor.execute(
+        f'INSERT INTO {quote_name(target.m2m_db_table())} ({", ".join(map(quote_name, target_columns))}) '
+        f'SELECT {", ".join(map(quote_name, source_columns))} FROM {quote_name(source.m2m_db_table())} '
+        f'WHERE {quote_name(source_columns[0])} IN ({placeholders})',
+        event_ids,
+    )
+
+
+def _copy_events(event_ids: list[int], using: str) -> None:
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(event_ids))
+
+    source_columns = _columns(Event, EVENT_FIELDS)
+    target_columns = [*_columns(ArchivedEvent, EVENT_FIELDS), ArchivedEvent._meta.get_field('archived_at').column]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {quote_name(ArchivedEvent._meta.db_table)} ({", ".join(map(quote_name, target_columns))}) '
+            f'SELECT {", ".join(map(quote_name, source_columns))}, %s FROM {quote_name(Event._meta.db_table)} '
+            f'WHERE {quote_name(source_columns[0])} IN ({placeholders})',
+            [timezone.now(), *event_ids],
+        )
+        _copy_relation(cursor, quote_name, 'categories', placeholders, event_ids)
+        _copy_relation(cursor, quote_name, 'attendees', placeholders, event_ids)
+
+
+def archive_events(before: datetime, batch_size: int = DEFAULT_BATCH_SIZE, using: str = DEFAULT_DB_ALIAS) -> int:
+    """
+    Moves the events older than `before`, with their attendees and categories, to the archive tables,
+    in batches of `batch_size` events (each in its own transaction, copying each table
+    with a single INSERT ... SELECT), returning the number of events archived.
+    The events are then deleted through the ORM, so that their search index entries,
+    waitlists and cached responses are dropped as on any deletion.
+    """
+
+    archived = 0
+    while True:
+        with transaction.atomic(using=using):
+            # Locking the batch, not to archive an event while it is postponed
+            event_ids = list(
+                Event.objects.using(using).select_for_update().filter(
+                    timestamp__lt=before,
+                ).order_by('timestamp', 'id').values_list('pk', flat=True)[:batch_size]
+            )
+            if not event_ids:
+                return archived
+
+            _copy_events(event_ids, using)
+            Event.objects.using(using).filter(pk__in=event_ids).delete()
+
+        archived += len(event_ids)
@@ -0,0 +1,57 @@
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from events.conf import get_setting
+
+USER_CACHE_KEY = 'events:auth:user:{user_id}'
+
+
+def invalidate_cached_user(user_id) -> None:
+    cache.delete(USER_CACHE_KEY.format(user_id=user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication resolving the user of the token from the cache, for `EVENTS['AUTH_USER_CACHE_TIMEOUT']`
+    seconds, instead of querying it on every request. Cached users are invalidated when saved or deleted
+    (e.g. deactivated or on password change), and the usual active/revoked checks apply to them.
+    """
+
+    def get_user(self, validated_token: Token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from e
+
+        cache_timeout = get_setting('AUTH_USER_CACHE_TIMEOUT')
+        cache_key = USER_CACHE_KEY.format(user_id=user_id)
+        user = cache.get(cache_key) if cache_timeout else None
+        if user is None:
+            try:
+                user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed(_('User not found'), code='user_not_found') from e
+            if cache_timeout:
+                cache.set(cache_key, user, cache_timeout)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+
+        return user
+
+
+class StatelessJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    JWT authentication trusting the claims of the token, without resolving the user at all
+    (the user is a `TokenUser`), for read only endpoints when `EVENTS['AUTH_STATELESS_READS']` is on.
+    Deactivated users keep access until their access token expires.
+    """
@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+from django.utils.module_loading import import_string
+
+from events.broker.base import BaseBroker, Subscription
+from events.conf import get_setting
+
+
+def get_broker() -> BaseBroker:
+    """
+    Returns the (process wide) configured broker (`EVENTS['BROKER']`).
+    """
+
+    return _get_broker(get_setting('BROKER'))
+
+
+@lru_cache
+def _get_broker(backend_path: str) -> BaseBroker:
+    return import_string(backend_path)()
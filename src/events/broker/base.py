@@ -0,0 +1,69 @@
+import asyncio
+import threading
+from typing import Optional
+
+
+class Subscription:
+    """
+    Local feed of the messages published on a broker, from its creation until closed.
+    Holds at most `max_pending` messages, dropping the oldest ones for slow consumers.
+    """
+
+    def __init__(self, broker: 'BaseBroker', max_pending: int = 1000):
+        self.broker = broker
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_pending)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        Returns the next message, or `None` when none arrives within the timeout.
+        """
+
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def put(self, message: dict) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class BaseBroker:
+    """
+    Interface of the fan-out brokers of live events changes.
+    `publish` is called from sync code (any thread), `subscribe` from async code (an event loop).
+    Messages are fanned out locally to the subscriptions of the process,
+    so that all the viewers of a process share a single upstream feed.
+    """
+
+    def __init__(self):
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+
+    def publish(self, message: dict) -> None:
+        raise NotImplementedError
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def fan_out(self, message: dict) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, message)
+            except RuntimeError:
+                # The event loop of the subscription is closed
+                self.unsubscribe(subscription)
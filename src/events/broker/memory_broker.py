@@ -0,0 +1,11 @@
+from events.broker.base import BaseBroker
+
+
+class InMemoryBroker(BaseBroker):
+    """
+    Broker delivering messages to the subscriptions of the current process only
+    (development, tests and single process deployments).
+    """
+
+    def publish(self, message: dict) -> None:
+        self.fan_out(message)
@@ -0,0 +1,41 @@
+import asyncio
+import json
+
+from events.broker.base import BaseBroker, Subscription
+from events.conf import get_setting
+
+
+class RedisBroker(BaseBroker):
+    """
+    Broker on a Redis pub/sub channel (`EVENTS['BROKER_URL']`), delivering messages to every process.
+    Each process keeps a single Redis subscription, whatever the number of its local subscriptions.
+    Requires the `redis` package.
+    """
+
+    channel = 'events:seats'
+
+    def __init__(self):
+        import redis
+
+        super().__init__()
+        self.url = get_setting('BROKER_URL')
+        self._client = redis.Redis.from_url(self.url)
+        self._listener = None
+
+    def publish(self, message: dict) -> None:
+        self._client.publish(self.channel, json.dumps(message))
+
+    def subscribe(self) -> Subscription:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self.listen())
+        return super().subscribe()
+
+    async def listen(self) -> None:
+        import redis.asyncio
+
+        client = redis.asyncio.Redis.from_url(self.url)
+        async with client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(self.channel)
+            async for message in pubsub.listen():
+                if message['type'] == 'message':
+                    self.fan_out(json.loads(message['data']))
@@ -0,0 +1,4 @@
+from events.bulk.exporter import export_events
+from events.bulk.ical import ICAL_CONTENT_TYPE, export_calendar
+from events.bulk.importer import ImportResult, import_events
+from events.bulk.readers import CONTENT_TYPES, CSV, FORMATS, NDJSON, read_rows
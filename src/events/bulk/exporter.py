@@ -0,0 +1,68 @@
+import csv
+import json
+from typing import Iterator
+
+from django.db.models import Prefetch, QuerySet
+from rest_framework.utils.encoders import JSONEncoder
+
+from events.bulk.readers import CSV, CSV_LIST_SEPARATOR
+from events.models import Category, Event
+
+EXPORT_FIELDS = (
+    'id',
+    'title',
+    'organizer',
+    'status',
+    'place',
+    'timestamp',
+    'description',
+    'capacity',
+    'attendees_count',
+    'categories',
+)
+EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """
+    File-like object returning what is written, for streaming the CSV writer output
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _iter_rows(queryset: QuerySet[Event]) -> Iterator[dict]:
+    queryset = queryset.order_by('pk').prefetch_related(
+        Prefetch('categories', queryset=Category.objects.only('id')),
+    )
+    for event in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield {
+            'id': event.pk,
+            'title': event.title,
+            'organizer': event.organizer_id,
+            'status': event.status,
+            'place': event.place,
+            'timestamp': event.timestamp.isoformat(),
+            'description': event.description,
+            'capacity': event.capacity,
+            'attendees_count': event.attendees_count,
+            'categories': [category.pk for category in event.categories.all()],
+        }
+
+
+def export_events(queryset: QuerySet[Event], file_format: str) -> Iterator[str]:
+    """
+    Yields the events of the queryset as CSV (with header) or NDJSON lines,
+    reading them in chunks from the database, so that memory use stays constant.
+    """
+
+    if file_format == CSV:
+        writer = csv.writer(_Echo())
+        yield writer.writerow(EXPORT_FIELDS)
+        for row in _iter_rows(queryset):
+            row['categories'] = CSV_LIST_SEPARATOR.join(str(category_id) for category_id in row['categories'])
+            yield writer.writerow(row.values())
+    else:
+        for row in _iter_rows(queryset):
+            yield json.dumps(row, cls=JSONEncoder) + '\n'
@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+from typing import Iterator
+
+from django.db.models import QuerySet
+
+from events.bulk.exporter import EXPORT_CHUNK_SIZE
+from events.models import Event
+
+ICAL_CONTENT_TYPE = 'text/calendar; charset=utf-8'
+ICAL_FIELDS = (
+    'id',
+    'title',
+    'place',
+    'timestamp',
+    'description',
+    'details_updated_at',
+)
+# Maximum length of content lines, in octets (RFC 5545, 3.1)
+LINE_LENGTH = 75
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def _format_datetime(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _fold(line: str) -> str:
+    """
+    Returns the content line, folded in lines of at most 75 octets, without splitting UTF-8 characters.
+    """
+
+    encoded = line.encode()
+    if len(encoded) <= LINE_LENGTH:
+        return line + '\r\n'
+
+    lines, start = [], 0
+    while start < len(encoded):
+        # Continuation lines start with a space, counted in their length
+        end = min(start + (LINE_LENGTH if not lines else LINE_LENGTH - 1), len(encoded))
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        lines.append(encoded[start:end].decode())
+        start = end
+    return '\r\n '.join(lines) + '\r\n'
+
+
+def export_calendar(queryset: QuerySet[Event], name: str, host: str) -> Iterator[str]:
+    """
+    Yields the events of the queryset as an iCalendar (RFC 5545) feed, an event per chunk,
+    reading them in chunks from the database, so that memory use stays constant.
+    `host` qualifies the UIDs of the events, stable across feeds and updates.
+    """
+
+    yield ''.join(_fold(line) for line in (
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//event-manager//events//EN',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{_escape(name)}',
+    ))
+
+    for event in queryset.only(*ICAL_FIELDS).order_by('timestamp', 'pk').iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        lines = [
+            'BEGIN:VEVENT',
+            f'UID:event-{event.pk}@{host}',
+            f'DTSTAMP:{_format_datetime(event.details_updated_at or event.timestamp)}',
+            f'DTSTART:{_format_datetime(event.timestamp)}',
+            f'SUMMARY:{_escape(event.title)}',
+        ]
+        if event.place:
+            lines.append(f'LOCATION:{_escape(event.place)}')
+        if event.description:
+            lines.append(f'DESCRIPTION:{_escape(event.description)}')
+        lines.append('END:VEVENT')
+        yield ''.join(_fold(line) for line in lines)
+
+    yield _fold('END:VCALENDAR')
@@ -0,0 +1,82 @@
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from events.bulk.readers import InvalidRow
+from events.cache import bump_list_version
+from events.models import Category, Event
+from events.search import get_search_backend
+from events.serializers import EventImportSerializer
+
+DEFAULT_CHUNK_SIZE = 1000
+# Maximum number of row errors reported back
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, row_number: int, errors: dict) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row_number, 'errors': errors})
+
+
+def _chunks(rows: Iterable[dict], chunk_size: int) -> Iterator[list[dict]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def import_events(rows: Iterable[dict], organizer: User, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ImportResult:
+    """
+    Creates events (organized by the given user) from a stream of rows, in chunks:
+    each chunk is validated without queries, then written in one transaction with
+    one `bulk_create` for the events and one for their categories (through table).
+    Invalid rows are skipped and reported (with their 1-based row number).
+    """
+
+    result = ImportResult()
+    category_ids = set(Category.objects.values_list('pk', flat=True))
+    search_backend = get_search_backend()
+    row_number = 0
+
+    for chunk in _chunks(rows, chunk_size):
+        events, events_categories = [], []
+        for row in chunk:
+            row_number += 1
+            if isinstance(row, InvalidRow):
+                result.add_error(row_number, dict(row))
+                continue
+
+            serializer = EventImportSerializer(data=row, context={'category_ids': category_ids})
+            if not serializer.is_valid():
+                result.add_error(row_number, dict(serializer.errors))
+                continue
+
+            validated_data = dict(serializer.validated_data)
+            events_categories.append(validated_data.pop('categories'))
+            events.append(Event(**validated_data, organizer=organizer))
+
+        if not events:
+            continue
+
+        with transaction.atomic():
+            Event.objects.bulk_create(events)
+            Event.categories.through.objects.bulk_create(
+                Event.categories.through(event_id=event.pk, category_id=category_id)
+                for event, event_category_ids in zip(events, events_categories)
+                for category_id in event_category_ids
+            )
+            search_backend.index_many(events)
+        result.created += len(events)
+
+    if result.created:
+        bump_list_version()
+    return result
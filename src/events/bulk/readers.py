@@ -0,0 +1,59 @@
+import csv
+import json
+from typing import Iterable, Iterator
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+FORMATS = (CSV, NDJSON, )
+
+CONTENT_TYPES = {
+    CSV: 'text/csv',
+    NDJSON: 'application/x-ndjson',
+}
+
+# Separator of the category ids in a CSV cell
+CSV_LIST_SEPARATOR = '|'
+
+
+class InvalidRow(dict):
+    """
+    Row that could not be parsed, holding its errors
+    """
+
+
+def read_csv_rows(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Yields the rows of a CSV (with header) as dicts, one at a time,
+    skipping empty cells and splitting the categories cell into ids.
+    """
+
+    for row in csv.DictReader(lines):
+        row = {key: value for key, value in row.items() if key and value not in ('', None)}
+        if 'categories' in row:
+            row['categories'] = [
+                category_id.strip() for category_id in row['categories'].split(CSV_LIST_SEPARATOR) if category_id.strip()
+            ]
+        yield row
+
+
+def read_ndjson_rows(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Yields the objects of a newline delimited JSON, one at a time, skipping blank lines.
+    """
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield InvalidRow({'non_field_errors': [f'Invalid JSON: {exc}']})
+            continue
+        if not isinstance(row, dict):
+            yield InvalidRow({'non_field_errors': ['Expected a JSON object']})
+            continue
+        yield row
+
+
+def read_rows(lines: Iterable[str], file_format: str) -> Iterator[dict]:
+    return read_csv_rows(lines) if file_format == CSV else read_ndjson_rows(lines)
@@ -0,0 +1,92 @@
+import hashlib
+import threading
+from collections import Counter
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+LIST_VERSION_KEY = 'events:list:version'
+LIST_MODIFIED_KEY = 'events:list:modified'
+
+# Query params whose result depends on the requester user
+USER_DEPENDENT_PARAMS = (
+    'only_mine',
+)
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_list_version() -> int:
+    version = cache.get(LIST_VERSION_KEY)
+    if version is None:
+        cache.add(LIST_VERSION_KEY, 1, timeout=None)
+        version = cache.get(LIST_VERSION_KEY, 1)
+    return version
+
+
+def get_list_last_modified() -> datetime:
+    """
+    Returns the time of the last change of the events lists (the last version bump).
+    """
+
+    last_modified = cache.get(LIST_MODIFIED_KEY)
+    if last_modified is None:
+        cache.add(LIST_MODIFIED_KEY, timezone.now(), timeout=None)
+        last_modified = cache.get(LIST_MODIFIED_KEY, timezone.now())
+    return last_modified
+
+
+def bump_list_version() -> None:
+    """
+    Invalidates all cached list responses (once the current transaction commits),
+    by moving to a new version of their keys.
+    """
+
+    def bump():
+        try:
+            cache.incr(LIST_VERSION_KEY)
+        except ValueError:
+            cache.add(LIST_VERSION_KEY, 1, timeout=None)
+        cache.set(LIST_MODIFIED_KEY, timezone.now(), timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def get_request_fingerprint(request, *extra_fragments) -> str:
+    """
+    Returns a digest of the normalized request (host, path and sorted non empty query params),
+    adding the requester user only for the user dependent query params.
+    """
+
+    params = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+        if value != ''
+    )
+    fragments = [request.get_host(), request.path, repr(params), *extra_fragments]
+    if any(request.query_params.get(param) == 'true' for param in USER_DEPENDENT_PARAMS):
+        fragments.append(f'user:{request.user.pk}')
+
+    return hashlib.sha256('|'.join(str(fragment) for fragment in fragments).encode()).hexdigest()
+
+
+def get_list_cache_key(request, *extra_fragments) -> str:
+    return f'events:list:{get_list_version()}:{get_request_fingerprint(request, *extra_fragments)}'
+
+
+def record_list_cache(hit: bool) -> None:
+    with _stats_lock:
+        _stats['hits' if hit else 'misses'] += 1
+
+
+def get_list_cache_stats() -> dict[str, int]:
+    """
+    Returns the (in-process) hits/misses counters of the list cache.
+    """
+
+    with _stats_lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses']}
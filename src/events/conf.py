@@ -0,0 +1,44 @@
+from django.conf import settings
+
+DEFAULTS = {
+    # Dotted path of the events search backend class (`None` picks one by database vendor)
+    'SEARCH_BACKEND': None,
+    # Seconds to cache list responses for (`0` disables the cache)
+    'LIST_CACHE_TIMEOUT': 0,
+    # Whether list responses carry validators (ETag/Last-Modified), which needs a cache shared by the workers
+    # (`None` enables them unless the default cache is process local)
+    'LIST_VALIDATORS': None,
+    # Dotted path of the fan-out broker class of the live seats stream
+    'BROKER': 'events.broker.memory_broker.InMemoryBroker',
+    # URL of the broker server, when needed by the broker class
+    'BROKER_URL': None,
+    # Database aliases of the read replicas, serving the safe requests of the events API
+    'READ_REPLICAS': (),
+    # Seconds to send the reads of a user to the primary database after it writes
+    'REPLICA_STICKINESS': 5,
+    # Seconds to cache the users resolved from JWT tokens (`0` disables the cache)
+    'AUTH_USER_CACHE_TIMEOUT': 0,
+    # Seconds to cache the iCalendar feeds for (`0` disables the cache)
+    'CALENDAR_CACHE_TIMEOUT': 0,
+    # Whether read only endpoints trust the claims of JWT tokens, without resolving their user
+    'AUTH_STATELESS_READS': False,
+    # Seconds to answer the (un-)registrations of a past, non published or full event from the cache
+    # (`0` disables the fast rejections). An app setting as the others, while the rate limits
+    # of the (un-)registrations are the `registration_*` throttle rates of `REST_FRAMEWORK`
+    'REGISTRATION_STATE_CACHE_TIMEOUT': 0,
+    # Whether the instrumentation middleware records metrics, exposed on the metrics endpoint
+    'METRICS_ENABLED': False,
+    # Bearer token required by the metrics endpoint (`None` serves it to anyone)
+    'METRICS_TOKEN': None,
+    # Days after which past events are moved to the archive tables by the `archive_events` command,
+    # the events API then reading the archive for `only_past` and missing detail lookups (`None` disables both)
+    'ARCHIVE_AFTER_DAYS': None,
+}
+
+
+def get_setting(name: str):
+    """
+    Returns the value of an events app setting, from the `EVENTS` project setting or the defaults.
+    """
+
+    return getattr(settings, 'EVENTS', {}).get(name, DEFAULTS[name])
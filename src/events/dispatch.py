@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent when attendees of an event change without going through the many-to-many
+# related managers (e.g. registration), with the `event`, `user_ids` and `action` arguments
+attendees_changed = Signal()
@@ -0,0 +1 @@
+from events.filters.event_search_filter import EventSearchFilter
@@ -0,0 +1,25 @@
+from rest_framework.filters import SearchFilter
+
+from events.models import Event
+from events.search import get_search_backend
+from events.search.icontains_backend import IContainsSearchBackend
+
+
+class EventSearchFilter(SearchFilter):
+    """
+    Search filter delegating to the events full-text search backend.
+    Results are ranked by relevance, unless an explicit ordering is requested.
+    The archived events, missing from the index, are searched with the (unindexed) fallback backend
+    (as the other events of the `only_past` lists, read along with them).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        backend = get_search_backend() if queryset.model is Event else IContainsSearchBackend()
+        queryset = backend.search(queryset, ' '.join(search_terms))
+        if request.query_params.get('ordering'):
+            return queryset
+        return queryset.order_by('-search_rank', *(queryset.query.order_by or queryset.model._meta.ordering))
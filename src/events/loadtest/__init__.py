@@ -0,0 +1,2 @@
+from events.loadtest.runner import DEFAULT_MIX, SCENARIOS, LoadTestReport, parse_mix, run_loadtest
+from events.loadtest.transports import ASGITransport, AsyncHTTPTransport, HTTPTransport, WSGITransport
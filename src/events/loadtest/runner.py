@@ -0,0 +1,236 @@
+import asyncio
+import json
+import random
+import re
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import accumulate
+
+from django.db import OperationalError
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+
+SCENARIOS = ('list', 'search', 'register', 'create', 'update', )
+DEFAULT_MIX = {'list': 40, 'search': 10, 'register': 30, 'create': 10, 'update': 10}
+SEARCH_TERMS = ('jazz', 'python', 'workshop', 'meetup', 'night', 'festival')
+
+# Errors of the databases when waiting for (or giving up on) a lock
+LOCK_ERROR_PATTERN = re.compile(r'locked|deadlock|lock timeout|could not obtain lock|busy', re.IGNORECASE)
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """
+    Parses a mix of scenarios with their weights, e.g. `list=40,register=60`.
+    """
+
+    mix = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f'Unknown scenario "{name}", expected one of {", ".join(SCENARIOS)}')
+        try:
+            mix[name] = int(weight)
+        except ValueError:
+            raise ValueError(f'Invalid weight "{weight}" of scenario "{name}"')
+    if sum(mix.values()) <= 0:
+        raise ValueError('The weights of the mix sum up to 0')
+    return mix
+
+
+class LockMonitor:
+    """
+    Database `execute_wrapper` timing the statements taking locks (writes and `SELECT ... FOR UPDATE`)
+    and counting the lock errors, on every connection opened while installed (the connections
+    are per thread, and opened by the threads serving the virtual users).
+    Only sees the queries of the current process.
+    """
+
+    def __init__(self):
+        self.timings = []
+        self.errors = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        if not sql.lstrip().upper().startswith(WRITE_STATEMENTS) and 'FOR UPDATE' not in sql:
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        except OperationalError as exc:
+            if LOCK_ERROR_PATTERN.search(str(exc)):
+                self.errors += 1
+            raise
+        finally:
+            self.timings.append(time.perf_counter() - start)
+
+    def _install(self, sender, connection, **kwargs) -> None:
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+    def __enter__(self):
+        connection_created.connect(self._install, dispatch_uid='events_loadtest_lock_monitor')
+        return self
+
+    def __exit__(self, *exc_info):
+        connection_created.disconnect(dispatch_uid='events_loadtest_lock_monitor')
+
+
+class VirtualUser:
+    """
+    Picks the requests of a user of the API by the weights of the mix:
+        - list: a page among the first ones of the events list
+        - search: a full-text search of the events
+        - register: registration to the hot event, or un-registration once registered (a storm on one row)
+        - create: a new event, organized by the user
+        - update: a full update of one of the events of the user (a creation until it has one)
+    """
+
+    def __init__(self, token: str, hot_event_id: int, mix: dict[str, int], rng: random.Random):
+        self.token = token
+        self.hot_event_id = hot_event_id
+        self.rng = rng
+        self.scenarios = list(mix)
+        self.cum_weights = list(accumulate(mix.values()))
+        self.registered = False
+        self.event_ids = []
+
+    def _event_payload(self) -> bytes:
+        return json.dumps({
+            'title': f'Load test event {self.rng.randrange(1_000_000)}',
+            'place': 'Load test',
+            'timestamp': (timezone.now() + timedelta(days=self.rng.randint(1, 365))).isoformat(),
+            'capacity': self.rng.choice((None, 50, 100)),
+        }).encode()
+
+    def next_request(self) -> tuple[str, str, str, bytes | None]:
+        """
+        Returns the operation, method, path (with query string) and JSON body of the next request.
+        """
+
+        scenario = self.rng.choices(self.scenarios, cum_weights=self.cum_weights)[0]
+        if scenario == 'list':
+            return 'list', 'GET', f'/api/v1/events/?page={self.rng.randint(1, 5)}', None
+        if scenario == 'search':
+            return 'search', 'GET', f'/api/v1/events/?search={self.rng.choice(SEARCH_TERMS)}', None
+        if scenario == 'register':
+            action = 'un-register' if self.registered else 'register'
+            return action, 'POST', f'/api/v1/events/{self.hot_event_id}/{action}/', None
+        if scenario == 'update' and self.event_ids:
+            return 'update', 'PUT', f'/api/v1/events/{self.rng.choice(self.event_ids)}/', self._event_payload()
+        return 'create', 'POST', '/api/v1/events/', self._event_payload()
+
+    def on_response(self, operation: str, status: int, content: bytes) -> None:
+        if operation in ('register', 'un-register') and status < 300:
+            self.registered = operation == 'register'
+        elif operation == 'create' and status == 201:
+            try:
+                self.event_ids.append(json.loads(content)['id'])
+            except (ValueError, KeyError):
+                pass
+
+
+@dataclass
+class LoadTestReport:
+    duration: float
+    # Operation => list of (status, seconds), status 0 for transport errors
+    samples: dict[str, list[tuple[int, float]]] = field(default_factory=dict)
+    lock_timings: list[float] = field(default_factory=list)
+    lock_errors: int = 0
+
+    def add(self, operation: str, status: int, elapsed: float) -> None:
+        self.samples.setdefault(operation, []).append((status, elapsed))
+
+    @staticmethod
+    def summarize(samples: list[tuple[int, float]], duration: float) -> dict:
+        timings = sorted(elapsed * 1000 for _, elapsed in samples)
+        quantiles = statistics.quantiles(timings, n=100, method='inclusive') if len(timings) > 1 else timings * 99
+        return {
+            'requests': len(samples),
+            'throughput': len(samples) / duration,
+            'p50_ms': statistics.median(timings),
+            'p95_ms': quantiles[94],
+            'p99_ms': quantiles[98],
+            'errors': sum(1 for status, _ in samples if status == 0 or status >= 500),
+            'rejected': sum(1 for status, _ in samples if 400 <= status < 500),
+        }
+
+    def rows(self) -> list[tuple[str, dict]]:
+        rows = [(operation, self.summarize(samples, self.duration)) for operation, samples in self.samples.items()]
+        all_samples = [sample for samples in self.samples.values() for sample in samples]
+        if all_samples:
+            rows.append(('total', self.summarize(all_samples, self.duration)))
+        return rows
+
+
+def run_loadtest(
+    transport,
+    tokens: list[str],
+    hot_event_id: int,
+    mix: dict[str, int],
+    duration: float,
+    think_time: float = 0,
+    seed: int = None,
+) -> LoadTestReport:
+    """
+    Drives the API through the transport with a virtual user per token for the duration,
+    as threads (sync transports) or tasks of an event loop (async transports).
+    """
+
+    rng = random.Random(seed)
+    users = [VirtualUser(token, hot_event_id, mix, random.Random(rng.random())) for token in tokens]
+    report = LoadTestReport(duration=duration)
+
+    with LockMonitor() as lock_monitor:
+        start = time.perf_counter()
+        deadline = start + duration
+        if transport.is_async:
+            asyncio.run(_run_tasks(transport, users, deadline, think_time, report))
+        else:
+            _run_threads(transport, users, deadline, think_time, report)
+        report.duration = time.perf_counter() - start
+
+    report.lock_timings = lock_monitor.timings
+    report.lock_errors = lock_monitor.errors
+    return report
+
+
+def _run_threads(transport, users: list[VirtualUser], deadline: float, think_time: float, report: LoadTestReport):
+    def run_user(user: VirtualUser) -> None:
+        while time.perf_counter() < deadline:
+            operation, method, path, body = user.next_request()
+            start = time.perf_counter()
+            try:
+                status, content = transport.request(method, path, user.token, body)
+            except Exception:
+                status, content = 0, b''
+            report.add(operation, status, time.perf_counter() - start)
+            user.on_response(operation, status, content)
+            if think_time:
+                time.sleep(think_time)
+
+    threads = [threading.Thread(target=run_user, args=(user, )) for user in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+async def _run_tasks(transport, users: list[VirtualUser], deadline: float, think_time: float, report: LoadTestReport):
+    async def run_user(user: VirtualUser) -> None:
+        while time.perf_counter() < deadline:
+            operation, method, path, body = user.next_request()
+            start = time.perf_counter()
+            try:
+                status, content = await transport.request(method, path, user.token, body)
+            except Exception:
+                status, content = 0, b''
+            report.add(operation, status, time.perf_counter() - start)
+            user.on_response(operation, status, content)
+            await asyncio.sleep(think_time)
+
+    await asyncio.gather(*(run_user(user) for user in users))
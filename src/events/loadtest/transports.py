@@ -0,0 +1,176 @@
+import asyncio
+import http.client
+import io
+import threading
+from urllib.parse import urlsplit
+
+from django.core.asgi import get_asgi_application
+from django.core.wsgi import get_wsgi_application
+
+HOST = 'localhost'
+
+
+def _split_path(path: str) -> tuple[str, str]:
+    path, _, query_string = path.partition('?')
+    return path, query_string
+
+
+def _headers(token: str, body: bytes | None) -> dict[str, str]:
+    headers = {'Authorization': f'JWT {token}'}
+    if body is not None:
+        headers.update({'Content-Type': 'application/json', 'Content-Length': str(len(body))})
+    return headers
+
+
+class WSGITransport:
+    """
+    Calls the WSGI application of the project in-process, from the calling thread,
+    through the whole stack (middleware chain included) but the network.
+    """
+
+    is_async = False
+
+    def __init__(self):
+        self.application = get_wsgi_application()
+
+    def request(self, method: str, path: str, token: str, body: bytes = None) -> tuple[int, bytes]:
+        path, query_string = _split_path(path)
+        environ = {
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path,
+            'QUERY_STRING': query_string,
+            'SERVER_NAME': HOST,
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'HTTP_HOST': HOST,
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': io.BytesIO(body or b''),
+            'wsgi.errors': io.StringIO(),
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for name, value in _headers(token, body).items():
+            key = name.upper().replace('-', '_')
+            environ[key if key in ('CONTENT_TYPE', 'CONTENT_LENGTH') else f'HTTP_{key}'] = value
+
+        statuses = []
+        response = self.application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+        try:
+            content = b''.join(response)
+        finally:
+            if hasattr(response, 'close'):
+                response.close()
+        return int(statuses[0].split()[0]), content
+
+
+class ASGITransport:
+    """
+    Calls the ASGI application of the project in-process, from the running event loop.
+    """
+
+    is_async = True
+
+    def __init__(self):
+        self.application = get_asgi_application()
+
+    async def request(self, method: str, path: str, token: str, body: bytes = None) -> tuple[int, bytes]:
+        path, query_string = _split_path(path)
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': query_string.encode(),
+            'root_path': '',
+            'headers': [
+                (b'host', HOST.encode()),
+                *((name.lower().encode(), value.encode()) for name, value in _headers(token, body).items()),
+            ],
+            'client': ('127.0.0.1', 0),
+            'server': (HOST, 80),
+        }
+        messages = [{'type': 'http.request', 'body': body or b'', 'more_body': False}]
+        disconnected = asyncio.Event()
+        status, content = None, []
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            elif message['type'] == 'http.response.body':
+                content.append(message.get('body', b''))
+
+        try:
+            await self.application(scope, receive, send)
+        finally:
+            disconnected.set()
+        return status, b''.join(content)
+
+
+class HTTPTransport:
+    """
+    Sends the requests to a running server, over a keep-alive connection per thread.
+    """
+
+    is_async = False
+
+    def __init__(self, url: str):
+        self.url = urlsplit(url)
+        self.local = threading.local()
+
+    def request(self, method: str, path: str, token: str, body: bytes = None) -> tuple[int, bytes]:
+        if not hasattr(self.local, 'connection'):
+            connection_class = http.client.HTTPSConnection if self.url.scheme == 'https' else http.client.HTTPConnection
+            self.local.connection = connection_class(self.url.hostname, self.url.port, timeout=30)
+
+        try:
+            self.local.connection.request(method, self.url.path.rstrip('/') + path, body, _headers(token, body))
+            response = self.local.connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            # Reconnecting on the next request
+            self.local.connection.close()
+            del self.local.connection
+            raise
+
+
+class AsyncHTTPTransport:
+    """
+    Sends the requests to a running server from the event loop, over a new connection per request
+    (HTTP/1.1 with `Connection: close`, with the standard library only).
+    """
+
+    is_async = True
+
+    def __init__(self, url: str):
+        self.url = urlsplit(url)
+
+    async def request(self, method: str, path: str, token: str, body: bytes = None) -> tuple[int, bytes]:
+        https = self.url.scheme == 'https'
+        port = self.url.port or (443 if https else 80)
+        reader, writer = await asyncio.open_connection(self.url.hostname, port, ssl=https or None)
+        try:
+            headers = {'Host': self.url.netloc, 'Connection': 'close', **_headers(token, body)}
+            head = f'{method} {self.url.path.rstrip("/") + path} HTTP/1.1\r\n' + ''.join(
+                f'{name}: {value}\r\n' for name, value in headers.items()
+            )
+            writer.write(head.encode('latin-1') + b'\r\n' + (body or b''))
+            await writer.drain()
+
+            response = await reader.read()
+        finally:
+            writer.close()
+
+        head, _, content = response.partition(b'\r\n\r\n')
+        return int(head.split(b' ', 2)[1]), content
@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from events.archive import DEFAULT_BATCH_SIZE, archive_events
+from events.conf import get_setting
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves the events older than the archive horizon, with their attendees and categories, '
+        'to the archive tables (to be scheduled, e.g. daily)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            default=get_setting('ARCHIVE_AFTER_DAYS'),
+            help="Archive horizon, in days before now (defaults to EVENTS['ARCHIVE_AFTER_DAYS'])",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Number of events moved per transaction',
+        )
+
+    def handle(self, *args, **options):
+        days = options['older_than_days']
+        if days is None:
+            raise CommandError("Archiving is disabled: set EVENTS['ARCHIVE_AFTER_DAYS'] or --older-than-days")
+        if days < 0 or options['batch_size'] <= 0:
+            raise CommandError('--older-than-days should not be negative, and --batch-size should be positive')
+
+        before = timezone.now() - timedelta(days=days)
+        archived = archive_events(before, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} event(s) older than {before.isoformat()}'))
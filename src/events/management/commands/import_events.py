@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from events.bulk import CSV, FORMATS, NDJSON, import_events, read_rows
+from events.bulk.importer import DEFAULT_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Imports events from a CSV (with header) or NDJSON file, streaming it in chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path of the file to import (`-` for stdin)')
+        parser.add_argument('--organizer', required=True, help='Username of the organizer of the imported events')
+        parser.add_argument(
+            '--format',
+            dest='file_format',
+            choices=FORMATS,
+            help='Format of the file (defaults to the file extension, or NDJSON for stdin)',
+        )
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            organizer = User.objects.get(username=options['organizer'])
+        except User.DoesNotExist:
+            raise CommandError(f'User "{options["organizer"]}" does not exist')
+
+        path = options['path']
+        file_format = options['file_format'] or (CSV if path.lower().endswith('.csv') else NDJSON)
+
+        if path == '-':
+            result = import_events(read_rows(sys.stdin, file_format), organizer, options['chunk_size'])
+        else:
+            with Path(path).open(encoding='utf-8-sig', newline='') as file:
+                result = import_events(read_rows(file, file_format), organizer, options['chunk_size'])
+
+        for error in result.errors:
+            self.stderr.write(f'Row {error["row"]}: {error["errors"]}')
+        self.stdout.write(self.style.SUCCESS(f'Imported {result.created} event(s), {result.failed} failed'))
@@ -0,0 +1,160 @@
+import secrets
+import statistics
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.loadtest import (
+    DEFAULT_MIX,
+    ASGITransport,
+    AsyncHTTPTransport,
+    HTTPTransport,
+    LoadTestReport,
+    WSGITransport,
+    parse_mix,
+    run_loadtest,
+)
+from events.models import Event
+
+THREADS = 'threads'
+ASYNCIO = 'asyncio'
+
+
+class Command(BaseCommand):
+    help = (
+        'Load tests the events API end to end (JWT authentication, middleware, views and database) '
+        'with concurrent virtual users, in-process (WSGI/ASGI application) or against a running server, '
+        'reporting throughput, latency percentiles, error rates and lock contention'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target',
+            choices=('wsgi', 'asgi'),
+            default='wsgi',
+            help='Application driven in-process (ignored with --url)',
+        )
+        parser.add_argument(
+            '--url',
+            help='Base URL of a running server to drive instead (e.g. http://localhost:8000), using this database',
+        )
+        parser.add_argument(
+            '--model',
+            choices=(THREADS, ASYNCIO),
+            help='Virtual users as threads or as tasks of an event loop '
+                 '(defaults to asyncio for the ASGI target, threads otherwise)',
+        )
+        parser.add_argument('--users', type=int, default=20, help='Number of concurrent virtual users')
+        parser.add_argument('--duration', type=float, default=30, help='Seconds to run for')
+        parser.add_argument(
+            '--mix',
+            default=','.join(f'{name}={weight}' for name, weight in DEFAULT_MIX.items()),
+            help='Weights of the scenarios of the virtual users (default: %(default)s)',
+        )
+        parser.add_argument(
+            '--hot-capacity',
+            type=int,
+            help='Capacity of the hot event of the registration storm (unlimited by default)',
+        )
+        parser.add_argument('--think-time', type=float, default=0, help='Seconds of pause between requests')
+        parser.add_argument('--seed', type=int, help='Seed of the random choices of the virtual users')
+        parser.add_argument('--keep-data', action='store_true', help='Keep the users and events created by the run')
+
+    def handle(self, *args, **options):
+        try:
+            mix = parse_mix(options['mix'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        if options['users'] < 1:
+            raise CommandError('At least one virtual user is required')
+
+        transport = self.get_transport(options)
+        if settings.DEBUG and not options['url']:
+            self.stderr.write('DEBUG is on: queries are recorded in memory, figures are pessimistic')
+
+        prefix = f'loadtest-{secrets.token_hex(4)}-'
+        password = make_password(None)
+        User.objects.bulk_create(
+            User(username=f'{prefix}{i}', password=password) for i in range(options['users'])
+        )
+        users = list(User.objects.filter(username__startswith=prefix).order_by('pk'))
+        hot_event = Event.objects.create(
+            title='Load test hot event',
+            place='Load test',
+            organizer=users[0],
+            timestamp=timezone.now() + timedelta(days=30),
+            capacity=options['hot_capacity'],
+        )
+        tokens = [str(RefreshToken.for_user(user).access_token) for user in users]
+
+        self.stdout.write(
+            f'Running {options["users"]} virtual user(s) on {options["url"] or options["target"].upper()} '
+            f'({type(transport).__name__}) for {options["duration"]}s...'
+        )
+        try:
+            report = run_loadtest(
+                transport,
+                tokens,
+                hot_event.pk,
+                mix,
+                options['duration'],
+                think_time=options['think_time'],
+                seed=options['seed'],
+            )
+            self.write_report(report, hot_event, in_process=not options['url'])
+        finally:
+            if not options['keep_data']:
+                Event.objects.filter(organizer__username__startswith=prefix).delete()
+                User.objects.filter(username__startswith=prefix).delete()
+
+    @staticmethod
+    def get_transport(options: dict):
+        url = options['url']
+        model = options['model'] or (ASYNCIO if not url and options['target'] == 'asgi' else THREADS)
+        if url:
+            return AsyncHTTPTransport(url) if model == ASYNCIO else HTTPTransport(url)
+        if options['target'] == 'wsgi' and model == ASYNCIO:
+            raise CommandError('The WSGI application is driven from threads, use --model threads')
+        if options['target'] == 'asgi' and model == THREADS:
+            raise CommandError('The ASGI application is driven from an event loop, use --model asyncio')
+        return WSGITransport() if options['target'] == 'wsgi' else ASGITransport()
+
+    def write_report(self, report: LoadTestReport, hot_event: Event, in_process: bool) -> None:
+        self.stdout.write(
+            f'\n{"operation":<14}{"requests":>10}{"req/s":>10}{"p50 (ms)":>10}{"p95 (ms)":>10}'
+            f'{"p99 (ms)":>10}{"errors":>9}{"rejected":>10}'
+        )
+        for operation, row in report.rows():
+            self.stdout.write(
+                f'{operation:<14}{row["requests"]:>10}{row["throughput"]:>10.1f}{row["p50_ms"]:>10.1f}'
+                f'{row["p95_ms"]:>10.1f}{row["p99_ms"]:>10.1f}'
+                f'{row["errors"] / row["requests"]:>9.1%}{row["rejected"] / row["requests"]:>10.1%}'
+            )
+
+        if in_process and report.lock_timings:
+            timings = sorted(timing * 1000 for timing in report.lock_timings)
+            p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+            self.stdout.write(
+                f'\nLock contention: {len(timings)} locking statement(s) (writes and SELECT ... FOR UPDATE), '
+                f'p50 {statistics.median(timings):.1f} ms, p99 {p99:.1f} ms, '
+                f'max {timings[-1]:.1f} ms, {report.lock_errors} lock error(s)'
+            )
+        elif not in_process:
+            self.stdout.write('\nLock contention: not measured (the queries run in the server process)')
+
+        hot_event = Event.objects.annotate(attendees_total=Count('attendees')).get(pk=hot_event.pk)
+        consistent = hot_event.attendees_count == hot_event.attendees_total and (
+            hot_event.capacity is None or hot_event.attendees_count <= hot_event.capacity
+        )
+        style = self.style.SUCCESS if consistent else self.style.ERROR
+        self.stdout.write(style(
+            f'Hot event: {hot_event.attendees_count} attendee(s) counted, {hot_event.attendees_total} registered'
+            f'{"" if hot_event.capacity is None else f" (capacity {hot_event.capacity})"}'
+            f' - {"consistent" if consistent else "INCONSISTENT"}'
+        ))
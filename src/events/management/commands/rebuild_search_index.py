@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from events.cache import bump_list_version
+from events.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the events full-text search index from the events table'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        backend.rebuild()
+        bump_list_version()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt search index with {type(backend).__name__}'))
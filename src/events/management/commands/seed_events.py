@@ -0,0 +1,211 @@
+import itertools
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from events.cache import bump_list_version
+from events.models import Category, Event
+from events.search import get_search_backend
+
+ADJECTIVES = (
+    'Advanced', 'Beginner', 'Open', 'Weekly', 'Annual', 'Late night', 'Community', 'Charity', 'Outdoor',
+    'Virtual', 'Summer', 'Winter', 'Acoustic', 'Hands-on', 'Family', 'Speed', 'Silent', 'Local',
+)
+TOPICS = (
+    'Python', 'jazz', 'yoga', 'chess', 'photography', 'wine', 'startup', 'poetry', 'cooking', 'running',
+    'salsa', 'design', 'robotics', 'gardening', 'comedy', 'film', 'knitting', 'climbing', 'data', 'vinyl',
+)
+KINDS = (
+    'meetup', 'workshop', 'night', 'festival', 'conference', 'class', 'tournament', 'tasting', 'walk',
+    'hackathon', 'jam session', 'talk', 'fair', 'screening', 'retreat',
+)
+PLACES = (
+    'Athens', 'Berlin', 'Lisbon', 'Madrid', 'Paris', 'Rome', 'Vienna', 'Prague', 'Dublin', 'Amsterdam',
+    'Warsaw', 'Oslo', 'Helsinki', 'Brussels', 'Zurich', 'Copenhagen', 'Budapest', 'Thessaloniki',
+)
+VENUES = ('Town Hall', 'Central Park', 'Public Library', 'Old Harbour', 'Community Center', 'Main Square', 'Online')
+# Capacities (`None` for unlimited) with their weights
+CAPACITIES = ((None, 40), (10, 8), (20, 12), (30, 10), (50, 12), (100, 9), (200, 5), (500, 3), (1000, 1))
+# Weights of the hours of the day the events start at, peaking in the evening
+HOUR_WEIGHTS = (0, 0, 0, 0, 0, 0, 0, 1, 2, 4, 5, 4, 4, 3, 4, 4, 5, 7, 10, 12, 10, 6, 3, 1)
+# Weights of the number of categories per event
+CATEGORIES_PER_EVENT_WEIGHTS = (10, 50, 30, 10)
+
+
+def _zipf_cum_weights(count: int, exponent: float = 1.1) -> list[float]:
+    """
+    Returns the cumulative weights of a Zipf distribution over `count` items,
+    the first items being the most popular ones.
+    """
+
+    return list(itertools.accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates a synthetic dataset of events, categories, users and attendees with realistic distributions '
+        '(few popular organizers, categories and events, evening starts, long tail of attendees), '
+        'with bulk inserts'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=1_000_000, help='Number of events to generate')
+        parser.add_argument('--users', type=int, default=100_000, help='Number of users to generate')
+        parser.add_argument('--categories', type=int, default=200, help='Number of categories to generate')
+        parser.add_argument(
+            '--attendees',
+            type=float,
+            default=12,
+            help='Median number of attendees per event (the distribution is log-normal, bounded by capacities)',
+        )
+        parser.add_argument('--past-days', type=int, default=730, help='Days in the past of the oldest events')
+        parser.add_argument('--future-days', type=int, default=365, help='Days in the future of the latest events')
+        parser.add_argument('--seed', type=int, help='Seed of the random generator, for reproducible datasets')
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--username-prefix', default='seed-', help='Prefix of the usernames of generated users')
+        parser.add_argument(
+            '--skip-search-index',
+            action='store_true',
+            help='Do not rebuild the full-text search index afterwards',
+        )
+
+    def handle(self, *args, **options):
+        if options['users'] < 1 or options['categories'] < 1:
+            raise CommandError('At least one user and one category are required')
+
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.using = router.db_for_write(Event)
+
+        user_ids = self.create_users(options['users'], options['username_prefix'])
+        category_ids = self.create_categories(options['categories'])
+        events_count, attendees_count = self.create_events(options, user_ids, category_ids)
+
+        # Bulk inserts skip the signals keeping the search index and the list cache in sync
+        if not options['skip_search_index']:
+            get_search_backend().rebuild()
+        bump_list_version()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(user_ids)} user(s), {len(category_ids)} categories, '
+            f'{events_count} event(s) and {attendees_count} attendee(s)'
+        ))
+
+    def create_users(self, count: int, prefix: str) -> list[int]:
+        if User.objects.filter(username__startswith=prefix).exists():
+            raise CommandError(f'Users prefixed with "{prefix}" exist already, pick another --username-prefix')
+
+        # Seeded users cannot log in (unusable password), hashing once instead of per user
+        password = make_password(None)
+        user_ids = []
+        for offset in range(0, count, self.batch_size):
+            users = User.objects.bulk_create(
+                User(username=f'{prefix}{i}', password=password)
+                for i in range(offset, min(offset + self.batch_size, count))
+            )
+            user_ids += [user.pk for user in users]
+        self.rng.shuffle(user_ids)
+        return user_ids
+
+    def create_categories(self, count: int) -> list[int]:
+        names = [' '.join(words) for words in itertools.product(TOPICS, KINDS)]
+        categories = Category.objects.bulk_create(
+            Category(name=names[i % len(names)] + (f' {i // len(names) + 1}' if i >= len(names) else ''))
+            for i in range(count)
+        )
+        return [category.pk for category in categories]
+
+    def create_events(self, options: dict, user_ids: list[int], category_ids: list[int]) -> tuple[int, int]:
+        rng = self.rng
+        now = timezone.now().replace(minute=0, second=0, microsecond=0)
+        capacities, capacity_weights = zip(*CAPACITIES)
+        capacity_weights = list(itertools.accumulate(capacity_weights))
+        hour_weights = list(itertools.accumulate(HOUR_WEIGHTS))
+        categories_per_event = range(len(CATEGORIES_PER_EVENT_WEIGHTS))
+        categories_per_event_weights = list(itertools.accumulate(CATEGORIES_PER_EVENT_WEIGHTS))
+        # Few organizers, categories and attendees account for most of the events and registrations
+        organizer_weights = _zipf_cum_weights(len(user_ids))
+        category_weights = _zipf_cum_weights(len(category_ids))
+        attendee_weights = _zipf_cum_weights(len(user_ids), exponent=0.8)
+        max_attendees = min(len(user_ids), 2000)
+
+        events_count = attendees_count = 0
+        for offset in range(0, options['events'], self.batch_size):
+            size = min(self.batch_size, options['events'] - offset)
+            events, event_attendees = [], []
+            for _ in range(size):
+                # Denser around today, as the events of a growing platform
+                days = rng.triangular(-options['past_days'], options['future_days'], 0)
+                timestamp = now.replace(hour=0) + timedelta(
+                    days=int(days),
+                    hours=rng.choices(range(24), cum_weights=hour_weights)[0],
+                    minutes=rng.choice((0, 15, 30, 45)),
+                )
+                capacity = rng.choices(capacities, cum_weights=capacity_weights)[0]
+                wanted = min(int(rng.lognormvariate(0, 1.2) * options['attendees']), capacity or max_attendees)
+                attendees = set(rng.choices(user_ids, cum_weights=attendee_weights, k=wanted))
+                adjective, topic, kind = rng.choice(ADJECTIVES), rng.choice(TOPICS), rng.choice(KINDS)
+
+                events.append(Event(
+                    title=f'{adjective} {topic} {kind}',
+                    place=f'{rng.choice(VENUES)}, {rng.choice(PLACES)}',
+                    description=(
+                        '' if rng.random() < 0.3
+                        else f'A {kind} for {topic} lovers, {rng.choice(ADJECTIVES).lower()} edition.'
+                    ),
+                    organizer_id=rng.choices(user_ids, cum_weights=organizer_weights)[0],
+                    status=Event.Status.PUBLISHED if rng.random() < 0.9 else Event.Status.HIDDEN,
+                    timestamp=timestamp,
+                    capacity=capacity,
+                    attendees_count=len(attendees),
+                ))
+                event_attendees.append(attendees)
+
+            with transaction.atomic(using=self.using):
+                events = Event.objects.using(self.using).bulk_create(events)
+                self.insert_rows(
+                    Event.categories.through,
+                    ('event_id', 'category_id'),
+                    [
+                        (event.pk, category_id)
+                        for event in events
+                        for category_id in set(rng.choices(
+                            category_ids,
+                            cum_weights=category_weights,
+                            k=rng.choices(categories_per_event, cum_weights=categories_per_event_weights)[0],
+                        ))
+                    ],
+                )
+                self.insert_rows(
+                    Event.attendees.through,
+                    ('event_id', 'user_id'),
+                    [(event.pk, user_id) for event, attendees in zip(events, event_attendees) for user_id in attendees],
+                )
+
+            events_count += size
+            attendees_count += sum(len(attendees) for attendees in event_attendees)
+            if options['verbosity'] > 1:
+                self.stdout.write(f'{events_count}/{options["events"]} events')
+
+        return events_count, attendees_count
+
+    def insert_rows(self, model, columns: tuple[str, ...], rows: list[tuple]) -> None:
+        """
+        Inserts the rows of a (join) table with raw batched statements,
+        skipping the instantiation of millions of model instances by `bulk_create`.
+        """
+
+        connection = connections[self.using]
+        quote_name = connection.ops.quote_name
+        sql = (
+            f'INSERT INTO {quote_name(model._meta.db_table)} ({", ".join(quote_name(column) for column in columns)}) '
+            f'VALUES ({", ".join(["%s"] * len(columns))})'
+        )
+        with connection.cursor() as cursor:
+            for offset in range(0, len(rows), self.batch_size):
+                cursor.executemany(sql, rows[offset:offset + self.batch_size])
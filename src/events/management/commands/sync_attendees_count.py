@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from events.cache import bump_list_version
+from events.models import Event
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the denormalized attendees counter of events from the attendees table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'event_ids',
+            nargs='*',
+            type=int,
+            help='Ids of the events to repair (defaults to all events)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Event.objects.all()
+        if options['event_ids']:
+            queryset = queryset.filter(pk__in=options['event_ids'])
+
+        updated = queryset.sync_attendees_count()
+        bump_list_version()
+        self.stdout.write(self.style.SUCCESS(f'Synced attendees count of {updated} event(s)'))
@@ -0,0 +1,144 @@
+import bisect
+import threading
+from collections import defaultdict
+
+from events.cache import get_list_cache_stats
+
+# Upper bounds of the histogram buckets, per unit
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERIES_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels.items()
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+class Counter:
+    """
+    Cumulative counter, per set of label values.
+    """
+
+    type = 'counter'
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] += amount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            values = dict(self._values)
+        return [
+            f'{self.name}{_format_labels(dict(zip(self.label_names, label_values)))} {value}'
+            for label_values, value in sorted(values.items())
+        ]
+
+
+class Histogram(Counter):
+    """
+    Distribution of observed values in cumulative buckets, with their sum and count, per set of label values.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...], buckets: tuple[float, ...]):
+        super().__init__(name, documentation, label_names)
+        self.buckets = buckets
+        # Label values => [count per bucket (the last one for +Inf), sum]
+        self._values = defaultdict(lambda: [[0] * (len(buckets) + 1), 0.0])
+
+    def observe(self, *label_values, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            bucket_counts, _ = state = self._values[label_values]
+            bucket_counts[index] += 1
+            state[1] += value
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            values = {label_values: (list(counts), total) for label_values, (counts, total) in self._values.items()}
+
+        lines = []
+        for label_values, (counts, total) in sorted(values.items()):
+            labels = dict(zip(self.label_names, label_values))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, '+Inf'), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{_format_labels({**labels, "le": bound})} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {total}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {cumulative}')
+        return lines
+
+
+REQUEST_LABELS = ('route', 'method', )
+
+requests_total = Counter(
+    'http_requests_total', 'Requests, by route, method and status code', (*REQUEST_LABELS, 'status'),
+)
+request_duration = Histogram(
+    'http_request_duration_seconds', 'Latency of requests, by route', REQUEST_LABELS, SECONDS_BUCKETS,
+)
+response_size = Histogram(
+    'http_response_size_bytes', 'Size of (non streaming) responses, by route', REQUEST_LABELS, BYTES_BUCKETS,
+)
+request_queries = Histogram(
+    'db_queries_per_request', 'Database queries per request, by route', REQUEST_LABELS, QUERIES_BUCKETS,
+)
+request_queries_duration = Histogram(
+    'db_query_duration_seconds_per_request', 'Time spent in database queries per request, by route',
+    REQUEST_LABELS, SECONDS_BUCKETS,
+)
+
+METRICS = (
+    requests_total,
+    request_duration,
+    response_size,
+    request_queries,
+    request_queries_duration,
+)
+
+
+def reset_metrics() -> None:
+    for metric in METRICS:
+        metric.clear()
+
+
+def render_metrics() -> str:
+    """
+    Returns the (in-process) metrics in the Prometheus text exposition format.
+    """
+
+    lines = []
+    for metric in METRICS:
+        lines += [f'# HELP {metric.name} {metric.documentation}', f'# TYPE {metric.name} {metric.type}']
+        lines += metric.collect()
+
+    cache_stats = get_list_cache_stats()
+    lookups = cache_stats['hits'] + cache_stats['misses']
+    lines += [
+        '# HELP events_list_cache_requests_total Lookups of the events list cache, by result',
+        '# TYPE events_list_cache_requests_total counter',
+        f'events_list_cache_requests_total{{result="hit"}} {cache_stats["hits"]}',
+        f'events_list_cache_requests_total{{result="miss"}} {cache_stats["misses"]}',
+        '# HELP events_list_cache_hit_ratio Ratio of the events list cache lookups that hit',
+        '# TYPE events_list_cache_hit_ratio gauge',
+        f'events_list_cache_hit_ratio {cache_stats["hits"] / lookups if lookups else 0}',
+    ]
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,109 @@
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from events import metrics
+from events.conf import get_setting
+
+
+class QueryCounter:
+    """
+    Count and duration of the database queries (of any alias) run by a request.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+# Counter of the current request, context local so that it follows the queries run in threads by async views
+_query_counter: ContextVar[QueryCounter | None] = ContextVar('events_query_counter', default=None)
+
+
+def count_queries(execute, sql, params, many, context):
+    """
+    Database `execute_wrapper` (installed on every connection, see `events.signals`)
+    recording the queries into the counter of the current request, if any.
+    """
+
+    query_counter = _query_counter.get()
+    if query_counter is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        query_counter.duration += time.perf_counter() - start
+        query_counter.count += 1
+
+
+def _get_route(request: HttpRequest) -> str:
+    """
+    Returns the URL name of the resolved view (e.g. `events-register`), bounding the labels
+    of the metrics whatever the requested paths.
+    """
+
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is None:
+        return 'unmatched'
+    return resolver_match.view_name or resolver_match._func_path
+
+
+class InstrumentationMiddleware:
+    """
+    Records, per route, the latency of requests, their database queries (count and duration)
+    and the size of their responses, as exposed on the metrics endpoint (see `events.metrics`).
+    Opt-in with `EVENTS['METRICS_ENABLED']`, removed from the stack otherwise.
+    Supports both sync and async requests, so that async views keep running on the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not get_setting('METRICS_ENABLED'):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        query_counter = QueryCounter()
+        token = _query_counter.set(query_counter)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _query_counter.reset(token)
+        self.record(request, response, time.perf_counter() - start, query_counter)
+        return response
+
+    async def __acall__(self, request: HttpRequest):
+        query_counter = QueryCounter()
+        token = _query_counter.set(query_counter)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _query_counter.reset(token)
+        self.record(request, response, time.perf_counter() - start, query_counter)
+        return response
+
+    @staticmethod
+    def record(request: HttpRequest, response: HttpResponse, duration: float, query_counter: QueryCounter) -> None:
+        # The duration of streaming responses is the time to their first byte
+        labels = (_get_route(request), request.method)
+        metrics.requests_total.inc(*labels, response.status_code)
+        metrics.request_duration.observe(*labels, value=duration)
+        metrics.request_queries.observe(*labels, value=query_counter.count)
+        metrics.request_queries_duration.observe(*labels, value=query_counter.duration)
+        if not response.streaming:
+            metrics.response_size.observe(*labels, value=len(response.content))
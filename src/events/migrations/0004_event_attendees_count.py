@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:53
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_attendees_count(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventAttendees = Event.attendees.through
+
+    attendees_count_subquery = EventAttendees.objects.filter(
+        event_id=models.OuterRef('pk'),
+    ).order_by().values('event_id').annotate(
+        count=models.Count('pk'),
+    ).values('count')
+
+    Event.objects.update(attendees_count=Coalesce(models.Subquery(attendees_count_subquery), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_category_event_categories'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='category',
+            options={'ordering': ('-id',), 'verbose_name_plural': 'categories'},
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='attendees_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='attendees_count'),
+        ),
+        migrations.RunPython(populate_attendees_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+SQLITE_FORWARD = (
+    "CREATE VIRTUAL TABLE events_event_fts USING fts5("
+    "title, place, description, tokenize = 'unicode61 remove_diacritics 2')",
+    "INSERT INTO events_event_fts (rowid, title, place, description) "
+    "SELECT id, title, place, description FROM events_event",
+)
+SQLITE_BACKWARD = (
+    "DROP TABLE events_event_fts",
+)
+
+POSTGRES_FORWARD = (
+    "ALTER TABLE events_event ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(place, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+    ") STORED",
+    "CREATE INDEX event_search_vector_idx ON events_event USING GIN (search_vector)",
+)
+POSTGRES_BACKWARD = (
+    "DROP INDEX event_search_vector_idx",
+    "ALTER TABLE events_event DROP COLUMN search_vector",
+)
+
+
+def _run_vendor_statements(schema_editor, statements_by_vendor):
+    for statement in statements_by_vendor.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    _run_vendor_statements(schema_editor, {'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD})
+
+
+def drop_search_index(apps, schema_editor):
+    _run_vendor_statements(schema_editor, {'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_event_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
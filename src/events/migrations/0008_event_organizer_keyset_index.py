@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_waitlistentry'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='event',
+            name='event_organizer_timestamp_idx',
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['organizer', '-timestamp', '-id'], name='event_organizer_ts_id_idx'),
+        ),
+    ]
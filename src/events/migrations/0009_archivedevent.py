@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('events', '0008_event_organizer_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedEvent',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='id')),
+                ('title', models.CharField(max_length=255, verbose_name='title')),
+                ('status', models.CharField(choices=[('PUBLISHED', 'Published'), ('HIDDEN', 'Hidden')], default='PUBLISHED', max_length=9, verbose_name='status')),
+                ('place', models.CharField(max_length=255, verbose_name='place')),
+                ('timestamp', models.DateTimeField(verbose_name='timestamp')),
+                ('description', models.TextField(blank=True, default='', verbose_name='description')),
+                ('capacity', models.IntegerField(blank=True, null=True, verbose_name='capacity')),
+                ('attendees_count', models.PositiveIntegerField(default=0, verbose_name='attendees_count')),
+                ('created_at', models.DateTimeField(blank=True, null=True, verbose_name='created_at')),
+                ('updated_at', models.DateTimeField(blank=True, null=True, verbose_name='updated_at')),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='archived_at')),
+                ('attendees', models.ManyToManyField(blank=True, related_name='archived_events', to=settings.AUTH_USER_MODEL)),
+                ('categories', models.ManyToManyField(blank=True, related_name='archived_events', to='events.category', verbose_name='categories')),
+                ('organizer', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='archived_events_organized', to=settings.AUTH_USER_MODEL, verbose_name='organizer')),
+            ],
+            options={
+                'ordering': ('-timestamp',),
+                'indexes': [models.Index(fields=['-timestamp', '-id'], name='archived_event_ts_id_idx'), models.Index(fields=['status', '-timestamp'], name='archived_event_status_ts_idx'), models.Index(fields=['organizer', '-timestamp', '-id'], name='archived_event_org_ts_id_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:03
+
+from django.db import migrations, models
+
+
+def populate_details_updated_at(apps, schema_editor):
+    for model_name in ('Event', 'ArchivedEvent'):
+        apps.get_model('events', model_name).objects.update(details_updated_at=models.F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_calendartoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedevent',
+            name='details_updated_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='details_updated_at'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='details_updated_at',
+            field=models.DateTimeField(auto_now=True, null=True, verbose_name='details_updated_at'),
+        ),
+        migrations.RunPython(populate_details_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:08
+
+from django.db import migrations, models
+
+
+EVENT_COLUMNS = (
+    '"id", "title", "organizer_id", "status", "place", "timestamp", "description", "capacity", "attendees_count", '
+    '"created_at", "updated_at", "details_updated_at"'
+)
+
+CREATE_VIEWS = (
+    f'''
+    CREATE VIEW "events_combinedevent" AS
+    SELECT {EVENT_COLUMNS} FROM "events_event"
+    UNION ALL
+    SELECT {EVENT_COLUMNS} FROM "events_archivedevent"
+    ''',
+    '''
+    CREATE VIEW "events_combinedevent_categories" AS
+    SELECT "id", "event_id", "category_id" FROM "events_event_categories"
+    UNION ALL
+    SELECT "id", "archivedevent_id" AS "event_id", "category_id" FROM "events_archivedevent_categories"
+    ''',
+    '''
+    CREATE VIEW "events_combinedevent_attendees" AS
+    SELECT "id", "event_id", "user_id" FROM "events_event_attendees"
+    UNION ALL
+    SELECT "id", "archivedevent_id" AS "event_id", "user_id" FROM "events_archivedevent_attendees"
+    ''',
+)
+
+DROP_VIEWS = (
+    'DROP VIEW "events_combinedevent_attendees"',
+    'DROP VIEW "events_combinedevent_categories"',
+    'DROP VIEW "events_combinedevent"',
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_event_details_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CombinedEvent',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='id')),
+                ('title', models.CharField(max_length=255, verbose_name='title')),
+                ('status', models.CharField(choices=[('PUBLISHED', 'Published'), ('HIDDEN', 'Hidden')], max_length=9, verbose_name='status')),
+                ('place', models.CharField(max_length=255, verbose_name='place')),
+                ('timestamp', models.DateTimeField(verbose_name='timestamp')),
+                ('description', models.TextField(blank=True, verbose_name='description')),
+                ('capacity', models.IntegerField(null=True, verbose_name='capacity')),
+                ('attendees_count', models.PositiveIntegerField(verbose_name='attendees_count')),
+                ('created_at', models.DateTimeField(null=True, verbose_name='created_at')),
+                ('updated_at', models.DateTimeField(null=True, verbose_name='updated_at')),
+                ('details_updated_at', models.DateTimeField(null=True, verbose_name='details_updated_at')),
+            ],
+            options={
+                'db_table': 'events_combinedevent',
+                'ordering': ('-timestamp',),
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='CombinedEventAttendee',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='id')),
+            ],
+            options={
+                'db_table': 'events_combinedevent_attendees',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='CombinedEventCategory',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='id')),
+            ],
+            options={
+                'db_table': 'events_combinedevent_categories',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_VIEWS, DROP_VIEWS),
+    ]
@@ -1,2 +1,6 @@
+from events.models.archived_event import ArchivedEvent
+from events.models.calendar_token import CalendarToken
 from events.models.category import Category
+from events.models.combined_event import CombinedEvent
 from events.models.event import Event
+from events.models.waitlist_entry import WaitlistEntry
@@ -0,0 +1,63 @@
+from django.contrib.auth.models import User
+from django.db import models
+from django.utils import timezone
+
+from events.models.event import Event
+
+
+class ArchivedEvent(models.Model):
+    """
+    Past event moved out of the (hot) events table by the `archive_events` command,
+    along with its attendees and categories, keeping its id and fields as they were.
+    Archived events are read only: the events API serves them to the `only_past` lists (see `CombinedEvent`)
+    and to the detail lookups missing from the events table.
+    """
+
+    id = models.BigIntegerField('id', primary_key=True)
+    title = models.CharField('title', max_length=255, null=False, blank=False)
+    organizer = models.ForeignKey(
+        User,
+        verbose_name='organizer',
+        related_name='archived_events_organized',
+        null=True,
+        blank=False,
+        on_delete=models.PROTECT,
+        db_index=True,
+    )
+    status = models.CharField(
+        'status',
+        max_length=9,
+        null=False,
+        blank=False,
+        choices=Event.Status.choices,
+        default=Event.Status.PUBLISHED,
+    )
+    place = models.CharField('place', max_length=255, null=False, blank=False)
+    timestamp = models.DateTimeField('timestamp', null=False, blank=False)
+    description = models.TextField('description', null=False, blank=True, default='')
+
+    categories = models.ManyToManyField(
+        'events.Category', verbose_name='categories', related_name='archived_events', blank=True,
+    )
+
+    capacity = models.IntegerField('capacity', null=True, blank=True)
+    attendees = models.ManyToManyField(User, related_name='archived_events', blank=True)
+    attendees_count = models.PositiveIntegerField('attendees_count', null=False, blank=False, default=0)
+
+    # Copied from the event (not `auto_now`), so that the validators of conditional requests stay the same
+    created_at = models.DateTimeField('created_at', blank=True, null=True)
+    updated_at = models.DateTimeField('updated_at', blank=True, null=True)
+    details_updated_at = models.DateTimeField('details_updated_at', blank=True, null=True)
+    archived_at = models.DateTimeField('archived_at', default=timezone.now)
+
+    def __str__(self) -> str:
+        return f'{self.title}'
+
+    class Meta:
+        ordering = ('-timestamp', )
+        indexes = (
+            # Default ordering of the `only_past` list, with the id tie-breaker of the keyset pagination
+            models.Index(fields=('-timestamp', '-id'), name='archived_event_ts_id_idx'),
+            models.Index(fields=('status', '-timestamp'), name='archived_event_status_ts_idx'),
+            models.Index(fields=('organizer', '-timestamp', '-id'), name='archived_event_org_ts_id_idx'),
+        )
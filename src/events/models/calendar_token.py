@@ -0,0 +1,22 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class CalendarToken(models.Model):
+    """
+    Version of the calendar feed tokens of a user (see `events.views.calendar_views`):
+    bumping it revokes every feed URL handed out so far.
+    """
+
+    user = models.OneToOneField(
+        User,
+        verbose_name='user',
+        related_name='calendar_token',
+        on_delete=models.CASCADE,
+    )
+    version = models.PositiveIntegerField('version', default=1)
+
+    updated_at = models.DateTimeField('updated_at', blank=True, null=True, auto_now=True)
+
+    def __str__(self) -> str:
+        return f'{self.user_id}: {self.version}'
@@ -0,0 +1,77 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+from events.models.event import Event
+
+
+class CombinedEvent(models.Model):
+    """
+    Read only union of the events and the archived events (database views, see the migrations),
+    for the `only_past` lists to cover the past events whether archived or not.
+    The views list the columns of both tables: they have to be recreated along with the changes of these columns.
+    """
+
+    id = models.BigIntegerField('id', primary_key=True)
+    title = models.CharField('title', max_length=255)
+    organizer = models.ForeignKey(
+        User,
+        verbose_name='organizer',
+        related_name='+',
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+    )
+    status = models.CharField('status', max_length=9, choices=Event.Status.choices)
+    place = models.CharField('place', max_length=255)
+    timestamp = models.DateTimeField('timestamp')
+    description = models.TextField('description', blank=True)
+
+    categories = models.ManyToManyField(
+        'events.Category', verbose_name='categories', through='CombinedEventCategory', related_name='+',
+    )
+
+    capacity = models.IntegerField('capacity', null=True)
+    attendees = models.ManyToManyField(User, through='CombinedEventAttendee', related_name='+')
+    attendees_count = models.PositiveIntegerField('attendees_count')
+
+    created_at = models.DateTimeField('created_at', null=True)
+    updated_at = models.DateTimeField('updated_at', null=True)
+    details_updated_at = models.DateTimeField('details_updated_at', null=True)
+
+    def __str__(self) -> str:
+        return f'{self.title}'
+
+    class Meta:
+        managed = False
+        db_table = 'events_combinedevent'
+        ordering = ('-timestamp', )
+
+
+class CombinedEventCategory(models.Model):
+    """
+    Union of the categories of the events and of the archived events.
+    """
+
+    id = models.BigIntegerField('id', primary_key=True)
+    event = models.ForeignKey(CombinedEvent, related_name='+', on_delete=models.DO_NOTHING, db_constraint=False)
+    category = models.ForeignKey(
+        'events.Category', related_name='+', on_delete=models.DO_NOTHING, db_constraint=False,
+    )
+
+    class Meta:
+        managed = False
+        db_table = 'events_combinedevent_categories'
+
+
+class CombinedEventAttendee(models.Model):
+    """
+    Union of the attendees of the events and of the archived events.
+    """
+
+    id = models.BigIntegerField('id', primary_key=True)
+    event = models.ForeignKey(CombinedEvent, related_name='+', on_delete=models.DO_NOTHING, db_constraint=False)
+    user = models.ForeignKey(User, related_name='+', on_delete=models.DO_NOTHING, db_constraint=False)
+
+    class Meta:
+        managed = False
+        db_table = 'events_combinedevent_attendees'
@@ -1,6 +1,44 @@
+from typing import Optional
+
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from events.dispatch import attendees_changed
+from events.models.waitlist_entry import WaitlistEntry
+
+
+class EventQuerySet(models.QuerySet):
+    def sync_attendees_count(self, touch: bool = False) -> int:
+        """
+        Recomputes the denormalized attendees counter of the selected events
+        from the attendees (join) table, in a single UPDATE statement
+        (also setting `updated_at` to now, when `touch` is requested).
+        Returns the number of events updated.
+        """
+
+        attendees_count_subquery = Event.attendees.through.objects.filter(
+            event_id=models.OuterRef('pk'),
+        ).order_by().values('event_id').annotate(
+            count=models.Count('pk'),
+        ).values('count')
+
+        extra_fields = {'updated_at': timezone.now()} if touch else {}
+        return self.update(
+            attendees_count=Coalesce(models.Subquery(attendees_count_subquery), 0),
+            **extra_fields,
+        )
+
+    def touch(self) -> int:
+        """
+        Sets `updated_at` and `details_updated_at` of the selected events to now,
+        for changes of their details that do not go through `Event.save` (e.g. their categories).
+        """
+
+        now = timezone.now()
+        return self.update(updated_at=now, details_updated_at=now)
 
 
 class Event(models.Model):
@@ -8,6 +46,34 @@ class Event(models.Model):
         PUBLISHED = 'PUBLISHED', 'Published'
         HIDDEN = 'HIDDEN', 'Hidden'
 
+    class AlreadyRegistered(Exception):
+        pass
+
+    class NotRegistered(Exception):
+        pass
+
+    class IsFull(Exception):
+        pass
+
+    class AlreadyWaitlisted(Exception):
+        pass
+
+    class NotWaitlisted(Exception):
+        pass
+
+    class BulkRegistrationFailed(Exception):
+        def __init__(self, outcomes: dict[int, str]):
+            super().__init__(outcomes)
+            self.outcomes = outcomes
+
+    class RegistrationOutcome(models.TextChoices):
+        REGISTERED = 'REGISTERED', 'Registered'
+        UN_REGISTERED = 'UN_REGISTERED', 'Un-registered'
+        ALREADY_REGISTERED = 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT', 'Was already registered'
+        NOT_REGISTERED = 'WAS_NOT_REGISTERED_TO_THIS_EVENT', 'Was not registered'
+        IS_FULL = 'EVENT_IS_FULL', 'Event is full'
+        USER_DOES_NOT_EXIST = 'USER_DOES_NOT_EXIST', 'User does not exist'
+
     title = models.CharField('title', max_length=255, null=False, blank=False)
     organizer = models.ForeignKey(
         User,
@@ -40,16 +106,262 @@ class Event(models.Model):
         blank=True,
     )
     attendees = models.ManyToManyField(User, related_name='events', blank=True)
+    # Denormalized number of attendees, kept in sync by the `m2m_changed` receiver
+    # of `events.signals` and repairable with the `sync_attendees_count` command.
+    attendees_count = models.PositiveIntegerField('attendees_count', null=False, blank=False, default=0)
 
     created_at = models.DateTimeField('created_at', blank=True, null=True, auto_now_add=True)
     updated_at = models.DateTimeField('updated_at', blank=True, null=True, auto_now=True)
+    # Last change of the details of the event (all but its attendees, which registrations update in place)
+    details_updated_at = models.DateTimeField('details_updated_at', blank=True, null=True, auto_now=True)
+
+    objects = EventQuerySet.as_manager()
+
+    def register_attendee(self, user: User) -> None:
+        """
+        Registers user to the event atomically, without any pre-reads:
+            - the conditional counter increment detects a full event
+              (and locks the event row until the transaction ends, so concurrent
+              registrations cannot exceed the capacity)
+            - the unique insert into the attendees table detects an existing registration
+        Raises `Event.AlreadyRegistered` or `Event.IsFull`, leaving no changes behind.
+        """
+
+        with transaction.atomic():
+            has_seat = Event.objects.filter(
+                models.Q(capacity__isnull=True) | models.Q(attendees_count__lt=models.F('capacity')),
+                pk=self.pk,
+            ).update(attendees_count=models.F('attendees_count') + 1, updated_at=timezone.now())
+            if not has_seat:
+                if Event.attendees.through.objects.filter(event_id=self.pk, user_id=user.pk).exists():
+                    raise Event.AlreadyRegistered()
+                raise Event.IsFull()
+
+            try:
+                with transaction.atomic():
+                    Event.attendees.through.objects.create(event_id=self.pk, user_id=user.pk)
+            except IntegrityError:
+                # Rolls back the counter increment above
+                raise Event.AlreadyRegistered()
+
+            attendees_changed.send(sender=Event, event=self, user_ids=[user.pk], action='register')
+
+    def register_attendees(self, user_ids: list[int], allow_partial: bool = False) -> dict[int, str]:
+        """
+        Registers many users to the event at once, with a single insert into the attendees table.
+        The event row is locked first, so that the capacity is checked once for the whole batch.
+        Returns the `Event.RegistrationOutcome` of each user.
+        Unless `allow_partial` is requested, registers either all users or none of them,
+        raising `Event.BulkRegistrationFailed` with the outcomes of the users that failed.
+        """
+
+        user_ids = list(dict.fromkeys(user_ids))
+
+        with transaction.atomic():
+            capacity, attendees_count = self._lock_for_registration()
+
+            existing_user_ids = set(User.objects.filter(pk__in=user_ids).values_list('pk', flat=True))
+            registered_user_ids = set(
+                Event.attendees.through.objects.filter(
+                    event_id=self.pk,
+                    user_id__in=user_ids,
+                ).values_list('user_id', flat=True)
+            )
+            seats = len(user_ids) if capacity is None else max(capacity - attendees_count, 0)
+
+            outcomes = {}
+            for user_id in user_ids:
+                if user_id not in existing_user_ids:
+                    outcomes[user_id] = Event.RegistrationOutcome.USER_DOES_NOT_EXIST
+                elif user_id in registered_user_ids:
+                    outcomes[user_id] = Event.RegistrationOutcome.ALREADY_REGISTERED
+                elif seats > 0:
+                    outcomes[user_id] = Event.RegistrationOutcome.REGISTERED
+                    seats -= 1
+                else:
+                    outcomes[user_id] = Event.RegistrationOutcome.IS_FULL
+
+            added_user_ids = [
+                user_id for user_id, outcome in outcomes.items() if outcome == Event.RegistrationOutcome.REGISTERED
+            ]
+            if not allow_partial and len(added_user_ids) < len(user_ids):
+                raise Event.BulkRegistrationFailed({
+                    user_id: outcome
+                    for user_id, outcome in outcomes.items() if outcome != Event.RegistrationOutcome.REGISTERED
+                })
+
+            if added_user_ids:
+                Event.attendees.through.objects.bulk_create(
+                    Event.attendees.through(event_id=self.pk, user_id=user_id) for user_id in added_user_ids
+                )
+                Event.objects.filter(pk=self.pk).update(
+                    attendees_count=models.F('attendees_count') + len(added_user_ids),
+                )
+                attendees_changed.send(sender=Event, event=self, user_ids=added_user_ids, action='register')
+
+        return outcomes
+
+    def un_register_attendee(self, user: User) -> None:
+        """
+        Un-registers user from the event atomically, without any pre-reads.
+        Raises `Event.NotRegistered` when user was not registered to the event.
+        """
+
+        with transaction.atomic():
+            deleted, _ = Event.attendees.through.objects.filter(event_id=self.pk, user_id=user.pk).delete()
+            if not deleted:
+                raise Event.NotRegistered()
+
+            Event.objects.filter(pk=self.pk).update(
+                attendees_count=models.F('attendees_count') - 1,
+                updated_at=timezone.now(),
+            )
+
+            attendees_changed.send(sender=Event, event=self, user_ids=[user.pk], action='un_register')
+            self.promote_waitlist()
+
+    def un_register_attendees(self, user_ids: list[int], allow_partial: bool = False) -> dict[int, str]:
+        """
+        Un-registers many users from the event at once, with a single delete from the attendees table.
+        Returns the `Event.RegistrationOutcome` of each user.
+        Unless `allow_partial` is requested, un-registers either all users or none of them,
+        raising `Event.BulkRegistrationFailed` with the outcomes of the users that failed.
+        """
+
+        user_ids = list(dict.fromkeys(user_ids))
+
+        with transaction.atomic():
+            self._lock_for_registration()
+
+            registered_user_ids = set(
+                Event.attendees.through.objects.filter(
+                    event_id=self.pk,
+                    user_id__in=user_ids,
+                ).values_list('user_id', flat=True)
+            )
+            outcomes = {
+                user_id: (
+                    Event.RegistrationOutcome.UN_REGISTERED
+                    if user_id in registered_user_ids else Event.RegistrationOutcome.NOT_REGISTERED
+                )
+                for user_id in user_ids
+            }
+
+            if not allow_partial and len(registered_user_ids) < len(user_ids):
+                raise Event.BulkRegistrationFailed({
+                    user_id: outcome
+                    for user_id, outcome in outcomes.items() if outcome != Event.RegistrationOutcome.UN_REGISTERED
+                })
+
+            if registered_user_ids:
+                Event.attendees.through.objects.filter(event_id=self.pk, user_id__in=registered_user_ids).delete()
+                Event.objects.filter(pk=self.pk).update(
+                    attendees_count=models.F('attendees_count') - len(registered_user_ids),
+                )
+                attendees_changed.send(
+                    sender=Event, event=self, user_ids=list(registered_user_ids), action='un_register',
+                )
+                self.promote_waitlist()
+
+        return outcomes
+
+    def join_waitlist(self, user: User) -> Optional[int]:
+        """
+        Registers user to the event if there is a free seat, otherwise queues user
+        in the (FIFO) waitlist of the event, returning the position in it.
+        Raises `Event.AlreadyRegistered` or `Event.AlreadyWaitlisted`.
+        """
+
+        with transaction.atomic():
+            capacity, attendees_count = self._lock_for_registration()
+            if capacity is None or attendees_count < capacity:
+                self.register_attendee(user)
+                return None
+
+            if Event.attendees.through.objects.filter(event_id=self.pk, user_id=user.pk).exists():
+                raise Event.AlreadyRegistered()
+
+            try:
+                with transaction.atomic():
+                    entry = WaitlistEntry.objects.create(event_id=self.pk, user_id=user.pk)
+            except IntegrityError:
+                raise Event.AlreadyWaitlisted()
+
+        return entry.position
+
+    def leave_waitlist(self, user: User) -> None:
+        """
+        Removes user from the waitlist of the event.
+        Raises `Event.NotWaitlisted` when user was not in it.
+        """
+
+        deleted, _ = WaitlistEntry.objects.filter(event_id=self.pk, user_id=user.pk).delete()
+        if not deleted:
+            raise Event.NotWaitlisted()
+
+    def promote_waitlist(self) -> list[int]:
+        """
+        Registers the first users of the waitlist to the free seats of the event
+        (within the current transaction, under the event row lock), returning their ids.
+        Drops the entries of users registered meanwhile, not to hold places in the waitlist.
+        """
+
+        with transaction.atomic():
+            capacity, attendees_count = self._lock_for_registration()
+
+            WaitlistEntry.objects.filter(
+                event_id=self.pk,
+                user_id__in=Event.attendees.through.objects.filter(event_id=self.pk).values('user_id'),
+            ).delete()
+
+            entries = WaitlistEntry.objects.filter(event_id=self.pk).order_by('id')
+            if capacity is not None:
+                seats = capacity - attendees_count
+                if seats <= 0:
+                    return []
+                entries = entries[:seats]
+
+            promoted = list(entries.values_list('id', 'user_id'))
+            if not promoted:
+                return []
+
+            promoted_user_ids = [user_id for _, user_id in promoted]
+            Event.attendees.through.objects.bulk_create(
+                Event.attendees.through(event_id=self.pk, user_id=user_id) for user_id in promoted_user_ids
+            )
+            WaitlistEntry.objects.filter(id__in=[entry_id for entry_id, _ in promoted]).delete()
+            Event.objects.filter(pk=self.pk).update(
+                attendees_count=models.F('attendees_count') + len(promoted_user_ids),
+            )
+            attendees_changed.send(sender=Event, event=self, user_ids=promoted_user_ids, action='promote')
+
+        return promoted_user_ids
+
+    def _lock_for_registration(self) -> tuple[Optional[int], int]:
+        """
+        Locks the event row (with a write, so that SQLite serializes concurrent registrations as well)
+        until the end of the current transaction, returning the current capacity and attendees count.
+        """
 
-    @property
-    def attendees_count(self) -> int:
-        return self.attendees.count()
+        Event.objects.filter(pk=self.pk).update(updated_at=timezone.now())
+        return Event.objects.filter(pk=self.pk).values_list('capacity', 'attendees_count').get()
 
     def __str__(self) -> str:
         return f'{self.title}'
 
     class Meta:
         ordering = ('-timestamp', )
+        indexes = (
+            # Default ordering of the list, with the id tie-breaker of the keyset pagination
+            models.Index(fields=('-timestamp', '-id'), name='event_timestamp_id_idx'),
+            # `status`/`organizer` filters (and `only_mine`), sorted by the default ordering
+            models.Index(fields=('status', '-timestamp'), name='event_status_timestamp_idx'),
+            # Also the keyset pagination of the events organized by a user (`/me/events/organized/`)
+            models.Index(fields=('organizer', '-timestamp', '-id'), name='event_organizer_ts_id_idx'),
+            # Published events browsing (mostly with `only_future`), skipped on backends without partial indexes
+            models.Index(
+                fields=('-timestamp', ),
+                condition=models.Q(status='PUBLISHED'),
+                name='event_published_timestamp_idx',
+            ),
+        )
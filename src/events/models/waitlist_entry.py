@@ -0,0 +1,41 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class WaitlistEntry(models.Model):
+    event = models.ForeignKey(
+        'events.Event',
+        verbose_name='event',
+        related_name='waitlist_entries',
+        on_delete=models.CASCADE,
+    )
+    user = models.ForeignKey(
+        User,
+        verbose_name='user',
+        related_name='waitlist_entries',
+        on_delete=models.CASCADE,
+    )
+
+    created_at = models.DateTimeField('created_at', blank=True, null=True, auto_now_add=True)
+
+    @property
+    def position(self) -> int:
+        """
+        1-based position of the entry in the (FIFO) waitlist of its event
+        """
+
+        return WaitlistEntry.objects.filter(event_id=self.event_id, id__lte=self.id).count()
+
+    def __str__(self) -> str:
+        return f'{self.event_id}: {self.user_id}'
+
+    class Meta:
+        # FIFO order
+        ordering = ('id', )
+        verbose_name_plural = 'waitlist entries'
+        constraints = (
+            models.UniqueConstraint(fields=('event', 'user'), name='waitlist_entry_event_user_unique'),
+        )
+        indexes = (
+            models.Index(fields=('event', 'id'), name='waitlist_entry_event_id_idx'),
+        )
@@ -0,0 +1,59 @@
+import random
+from contextvars import ContextVar
+from typing import Optional
+
+from django.core.cache import cache
+
+from events.conf import get_setting
+
+PINNED_KEY = 'events:replicas:pinned:{user_id}'
+
+# Alias of the replica serving the reads of the current request (or task), if any
+replica_reads = ContextVar('replica_reads', default=None)
+
+
+def pin_to_primary(user) -> None:
+    """
+    Sends the reads of the user to the primary database for `EVENTS['REPLICA_STICKINESS']` seconds,
+    so that the user reads its own writes while the replicas catch up.
+    """
+
+    if user.is_authenticated and get_setting('READ_REPLICAS'):
+        cache.set(PINNED_KEY.format(user_id=user.pk), True, get_setting('REPLICA_STICKINESS'))
+
+
+def is_pinned_to_primary(user) -> bool:
+    return user.is_authenticated and cache.get(PINNED_KEY.format(user_id=user.pk), False)
+
+
+def choose_replica() -> Optional[str]:
+    """
+    Returns the alias of a random replica among `EVENTS['READ_REPLICAS']`, if any,
+    to serve all the reads of a request (so that they are consistent with each other).
+    """
+
+    replicas = get_setting('READ_REPLICAS')
+    return random.choice(replicas) if replicas else None
+
+
+class ReplicaRouter:
+    """
+    Database router sending reads to the replica chosen for the current request (see `replica_reads`),
+    if any, and everything else to the primary.
+    """
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        alias = replica_reads.get()
+        if alias is not None and alias in get_setting('READ_REPLICAS'):
+            return alias
+        return None
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # Replicas hold the same data as the primary
+        databases = {'default', *get_setting('READ_REPLICAS')}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
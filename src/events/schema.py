@@ -0,0 +1,9 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """
+    OpenAPI security scheme of `CachedJWTAuthentication`, same as the simplejwt one.
+    """
+
+    target_class = 'events.authentication.CachedJWTAuthentication'
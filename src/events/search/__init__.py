@@ -0,0 +1,25 @@
+from django.db import connections, router
+from django.utils.module_loading import import_string
+
+from events.conf import get_setting
+from events.models import Event
+from events.search.base import BaseSearchBackend
+
+VENDOR_SEARCH_BACKENDS = {
+    'sqlite': 'events.search.sqlite_backend.SqliteSearchBackend',
+    'postgresql': 'events.search.postgres_backend.PostgresSearchBackend',
+}
+DEFAULT_SEARCH_BACKEND = 'events.search.icontains_backend.IContainsSearchBackend'
+
+
+def get_search_backend() -> BaseSearchBackend:
+    """
+    Returns the configured (`EVENTS['SEARCH_BACKEND']`) search backend,
+    or the full-text one matching the vendor of the events database.
+    """
+
+    backend_path = get_setting('SEARCH_BACKEND')
+    if backend_path is None:
+        vendor = connections[router.db_for_read(Event)].vendor
+        backend_path = VENDOR_SEARCH_BACKENDS.get(vendor, DEFAULT_SEARCH_BACKEND)
+    return import_string(backend_path)()
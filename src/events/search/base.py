@@ -0,0 +1,33 @@
+from django.db.models import QuerySet
+
+from events.models import Event
+
+
+class BaseSearchBackend:
+    """
+    Interface of the events full-text search backends.
+    `search` filters by the query and annotates a `search_rank` (the higher the better),
+    `index`/`index_many`/`remove`/`rebuild` keep the backend's index in sync with the events table.
+    """
+
+    search_fields = (
+        'title',
+        'place',
+        'description',
+    )
+
+    def search(self, queryset: QuerySet[Event], query: str) -> QuerySet[Event]:
+        raise NotImplementedError
+
+    def index(self, event: Event) -> None:
+        pass
+
+    def index_many(self, events: list[Event]) -> None:
+        for event in events:
+            self.index(event)
+
+    def remove(self, event: Event) -> None:
+        pass
+
+    def rebuild(self) -> None:
+        pass
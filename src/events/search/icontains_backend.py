@@ -0,0 +1,22 @@
+import operator
+from functools import reduce
+
+from django.db.models import IntegerField, Q, QuerySet, Value
+
+from events.models import Event
+from events.search.base import BaseSearchBackend
+
+
+class IContainsSearchBackend(BaseSearchBackend):
+    """
+    Fallback search backend, for databases without full-text search support:
+    each term should be contained (case insensitive) in any of the search fields.
+    Does not keep any index, neither ranks the results.
+    """
+
+    def search(self, queryset: QuerySet[Event], query: str) -> QuerySet[Event]:
+        for term in query.split():
+            queryset = queryset.filter(
+                reduce(operator.or_, (Q(**{f'{field}__icontains': term}) for field in self.search_fields)),
+            )
+        return queryset.annotate(search_rank=Value(0, output_field=IntegerField()))
@@ -0,0 +1,31 @@
+from django.db.models import BooleanField, FloatField, QuerySet
+from django.db.models.expressions import RawSQL
+
+from events.models import Event
+from events.search.base import BaseSearchBackend
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Search backend on the PostgreSQL `search_vector` column of events (see migration 0006),
+    a weighted tsvector generated by the database and indexed with GIN, so it needs no syncing.
+    Queries are parsed with `websearch_to_tsquery` and ranked with `ts_rank_cd`.
+    """
+
+    config = 'english'
+
+    def search(self, queryset: QuerySet[Event], query: str) -> QuerySet[Event]:
+        table = Event._meta.db_table
+        return queryset.filter(
+            RawSQL(
+                f'{table}.search_vector @@ websearch_to_tsquery(%s, %s)',
+                [self.config, query],
+                output_field=BooleanField(),
+            ),
+        ).annotate(
+            search_rank=RawSQL(
+                f'ts_rank_cd({table}.search_vector, websearch_to_tsquery(%s, %s))',
+                [self.config, query],
+                output_field=FloatField(),
+            ),
+        )
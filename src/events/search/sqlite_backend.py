@@ -0,0 +1,75 @@
+import re
+
+from django.db import connections, router
+from django.db.models import FloatField, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+from events.models import Event
+from events.search.base import BaseSearchBackend
+
+
+class SqliteSearchBackend(BaseSearchBackend):
+    """
+    Search backend on a SQLite FTS5 inverted index (`events_event_fts` table, see migration 0006),
+    ranked with BM25 weighting title over place over description.
+    Terms are matched as prefixes and all of them should be present.
+    """
+
+    table = 'events_event_fts'
+    weights = (10.0, 5.0, 1.0, )
+
+    @staticmethod
+    def to_match_expression(query: str) -> str:
+        return ' '.join(f'"{term}"*' for term in re.findall(r'\w+', query))
+
+    def search(self, queryset: QuerySet[Event], query: str) -> QuerySet[Event]:
+        match_expression = self.to_match_expression(query)
+        if not match_expression:
+            return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+        weights = ', '.join(str(weight) for weight in self.weights)
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s', [match_expression]),
+        ).annotate(
+            search_rank=RawSQL(
+                f'SELECT -bm25({self.table}, {weights}) FROM {self.table} '
+                f'WHERE {self.table} MATCH %s AND rowid = {Event._meta.db_table}.id',
+                [match_expression],
+                output_field=FloatField(),
+            ),
+        )
+
+    def index(self, event: Event) -> None:
+        columns = ', '.join(self.search_fields)
+        with self._cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [event.pk])
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, {columns}) VALUES (%s, %s, %s, %s)',
+                [event.pk, *(getattr(event, field) for field in self.search_fields)],
+            )
+
+    def index_many(self, events: list[Event]) -> None:
+        columns = ', '.join(self.search_fields)
+        with self._cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {self.table} WHERE rowid = %s', [[event.pk] for event in events])
+            cursor.executemany(
+                f'INSERT INTO {self.table} (rowid, {columns}) VALUES (%s, %s, %s, %s)',
+                [[event.pk, *(getattr(event, field) for field in self.search_fields)] for event in events],
+            )
+
+    def remove(self, event: Event) -> None:
+        with self._cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [event.pk])
+
+    def rebuild(self) -> None:
+        columns = ', '.join(self.search_fields)
+        with self._cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, {columns}) '
+                f'SELECT id, {columns} FROM {Event._meta.db_table}'
+            )
+
+    @staticmethod
+    def _cursor():
+        return connections[router.db_for_write(Event)].cursor()
@@ -0,0 +1,40 @@
+from django.db import transaction
+
+from events.admission import invalidate_registration_state
+from events.broker import get_broker
+from events.models import Event
+
+SEATS_FIELDS = (
+    'id',
+    'capacity',
+    'attendees_count',
+)
+
+
+def get_seats(values: dict) -> dict:
+    """
+    Returns the seats availability message of an event, from the values of `SEATS_FIELDS`.
+    """
+
+    capacity = values['capacity']
+    return {
+        **values,
+        'seats_left': None if capacity is None else max(capacity - values['attendees_count'], 0),
+    }
+
+
+def publish_seats(event_ids: list[int], using: str = None) -> None:
+    """
+    Publishes the seats availability of the given events (once the current transaction commits),
+    read back from the database so that concurrent changes are published in their final state.
+    Drops their cached registration state as well, which may say they are full.
+    """
+
+    invalidate_registration_state(event_ids, using=using)
+
+    def publish():
+        broker = get_broker()
+        for values in Event.objects.using(using).filter(pk__in=event_ids).values(*SEATS_FIELDS):
+            broker.publish(get_seats(values))
+
+    transaction.on_commit(publish, using=using)
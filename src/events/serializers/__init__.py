@@ -1 +1,15 @@
+from events.serializers.event_async_list_serializer import EventAsyncListSerializer
+from events.serializers.event_attendee_serializer import EventAttendeeSerializer
+from events.serializers.event_bulk_registration_serializer import (
+    EventBulkRegistrationResultSerializer,
+    EventBulkRegistrationSerializer,
+)
+from events.serializers.event_compact_serializer import EventCompactSerializer
+from events.serializers.event_facets_serializer import (
+    EventCategoryFacetSerializer,
+    EventFacetsSerializer,
+    EventValueFacetSerializer,
+)
+from events.serializers.event_import_serializer import EventImportSerializer
+from events.serializers.event_list_serializer import EventListSerializer
 from events.serializers.event_serializer import EventSerializer
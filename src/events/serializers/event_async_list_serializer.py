@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from events.serializers.event_list_serializer import EventListSerializer
+
+
+class EventAsyncListSerializer(EventListSerializer):
+    """
+    Compact read only serializer for listing events from async views.
+    Reads the categories ids from the `category_ids` attribute set by the view,
+    since a related manager cannot be queried (lazily) from the event loop.
+    """
+
+    categories = serializers.ListField(child=serializers.IntegerField(), source='category_ids', read_only=True)
@@ -0,0 +1,15 @@
+from django.contrib.auth.models import User
+from rest_framework import serializers
+
+
+class EventAttendeeSerializer(serializers.ModelSerializer):
+    """
+    Read only serializer for listing the attendees of an event
+    """
+
+    class Meta:
+        model = User
+        fields = (
+            'id',
+        )
+        read_only_fields = fields
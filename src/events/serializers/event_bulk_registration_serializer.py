@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+
+class EventBulkRegistrationSerializer(serializers.Serializer):
+    """
+    Request serializer for bulk registering/un-registering users to an event
+    """
+
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=1000,
+    )
+    allow_partial = serializers.BooleanField(
+        default=False,
+        help_text='Process the users that can be processed, instead of all or none of them',
+    )
+
+
+class EventBulkRegistrationResultSerializer(serializers.Serializer):
+    """
+    Response serializer of the outcome of bulk registering/un-registering a user to an event
+    """
+
+    user_id = serializers.IntegerField()
+    detail = serializers.CharField()
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from events.models import Event
+
+
+class EventCompactSerializer(serializers.ModelSerializer):
+    """
+    Minimal read only serializer for the events of a user (mobile screens),
+    with the fields needed to render a row only.
+    """
+
+    class Meta:
+        model = Event
+        fields = (
+            'id',
+            'title',
+            'status',
+            'place',
+            'timestamp',
+            'capacity',
+            'attendees_count',
+        )
+        read_only_fields = fields
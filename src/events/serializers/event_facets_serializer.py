@@ -0,0 +1,33 @@
+from rest_framework import serializers
+
+
+class EventCategoryFacetSerializer(serializers.Serializer):
+    """
+    Response serializer of the count of events of a category
+    """
+
+    id = serializers.IntegerField()
+    count = serializers.IntegerField()
+
+
+class EventValueFacetSerializer(serializers.Serializer):
+    """
+    Response serializer of the count of events of a status/time bucket
+    """
+
+    value = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class EventFacetsSerializer(serializers.Serializer):
+    """
+    Response serializer of the facet counts of the (filtered) events
+    """
+
+    count = serializers.IntegerField()
+    categories = EventCategoryFacetSerializer(many=True)
+    status = EventValueFacetSerializer(many=True)
+    timestamp = EventValueFacetSerializer(
+        many=True,
+        help_text='Disjoint time buckets: `past`, `next_week` (7 days), `next_month` (30 days) and `later`',
+    )
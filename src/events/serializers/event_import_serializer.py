@@ -0,0 +1,31 @@
+from rest_framework import serializers
+
+from events.models import Event
+
+
+class EventImportSerializer(serializers.ModelSerializer):
+    """
+    Serializer validating a row of a bulk events import.
+    Categories are plain ids, checked against the `category_ids` set of the context,
+    so that validating a chunk of rows costs no queries.
+    """
+
+    categories = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+
+    def validate_categories(self, value: list[int]) -> list[int]:
+        unknown_ids = set(value) - self.context['category_ids']
+        if unknown_ids:
+            raise serializers.ValidationError(f'Invalid category ids: {sorted(unknown_ids)}')
+        return list(dict.fromkeys(value))
+
+    class Meta:
+        model = Event
+        fields = (
+            'title',
+            'status',
+            'place',
+            'timestamp',
+            'description',
+            'capacity',
+            'categories',
+        )
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+
+from events.models import Event
+
+
+class EventListSerializer(serializers.ModelSerializer):
+    """
+    Compact read only serializer for listing events.
+    Exposes the attendees count instead of the attendees ids,
+    so that the payload size does not grow with registrations.
+    The `is_registered` flag of the requester user is filled in by the view.
+    """
+
+    is_registered = serializers.BooleanField(read_only=True, default=False)
+
+    class Meta:
+        model = Event
+        fields = (
+            'id',
+            'title',
+            'organizer',
+            'status',
+            'place',
+            'timestamp',
+            'description',
+            'capacity',
+            'attendees_count',
+            'is_registered',
+            'categories',
+            'created_at',
+            'updated_at',
+        )
+        read_only_fields = fields
@@ -24,11 +24,13 @@ class EventSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Event
-        fields = '__all__'
+        # `details_updated_at` only serves the validators of the calendar feeds
+        exclude = ('details_updated_at', )
         read_only_fields = (
             'id',
             'organizer',
             'attendees',
+            'attendees_count',
             'created_at',
             'updated_at',
         )
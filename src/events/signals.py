@@ -0,0 +1,201 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from events.admission import invalidate_registration_state
+from events.authentication import invalidate_cached_user
+from events.cache import bump_list_version
+from events.dispatch import attendees_changed
+from events.middleware import count_queries
+from events.models import Category, Event
+from events.search import get_search_backend
+from events.seats import publish_seats
+
+
+@receiver(m2m_changed, sender=Event.attendees.through, dispatch_uid='events_sync_attendees_count')
+def sync_attendees_count(sender, instance, action, reverse, pk_set, using, **kwargs) -> None:
+    """
+    Keeps `Event.attendees_count` (and `updated_at`) in sync with the attendees (join) table,
+    for every change made through the related managers
+    (`event.attendees` and `user.events`), including admin edits.
+    """
+
+    if action == 'pre_clear' and reverse:
+        # Rows are about to be deleted, so the affected events must be collected beforehand
+        instance._cleared_event_ids = list(
+            Event.attendees.through.objects.using(using).filter(user_id=instance.pk).values_list('event_id', flat=True)
+        )
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        if action == 'post_clear':
+            event_ids = instance.__dict__.pop('_cleared_event_ids', [])
+        else:
+            event_ids = pk_set
+        if not event_ids:
+            return
+        queryset = Event.objects.using(using).filter(pk__in=event_ids)
+    else:
+        queryset = Event.objects.using(using).filter(pk=instance.pk)
+
+    if action == 'post_add':
+        # On add, `pk_set` holds only the rows that were actually inserted
+        if not pk_set:
+            return
+        queryset.update(
+            attendees_count=F('attendees_count') + (1 if reverse else len(pk_set)),
+            updated_at=timezone.now(),
+        )
+    else:
+        queryset.sync_attendees_count(touch=True)
+
+    if not reverse:
+        instance.refresh_from_db(using=using, fields=['attendees_count', 'updated_at'])
+
+
+@receiver(m2m_changed, sender=Event.categories.through, dispatch_uid='events_touch_on_categories')
+def touch_event_on_categories_change(sender, instance, action, reverse, pk_set, using, **kwargs) -> None:
+    """
+    Sets `Event.updated_at` when categories of events change,
+    so that it reflects every change of the event representation.
+    """
+
+    if action == 'pre_clear' and reverse:
+        instance._cleared_event_ids = list(instance.events.using(using).values_list('pk', flat=True))
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        Event.objects.using(using).filter(pk=instance.pk).touch()
+        instance.refresh_from_db(using=using, fields=['updated_at'])
+        return
+
+    event_ids = instance.__dict__.pop('_cleared_event_ids', []) if action == 'post_clear' else pk_set
+    if event_ids:
+        Event.objects.using(using).filter(pk__in=event_ids).touch()
+
+
+@receiver(pre_delete, sender=Category, dispatch_uid='events_touch_on_category_delete')
+def touch_events_on_category_delete(sender, instance, using, **kwargs) -> None:
+    Event.objects.using(using).filter(categories=instance).touch()
+
+
+@receiver(post_save, sender=Event, dispatch_uid='events_index_event')
+def index_event(sender, instance, raw, update_fields=None, **kwargs) -> None:
+    """
+    Keeps the search index up to date with the saved event
+    (bulk operations require the `rebuild_search_index` command).
+    """
+
+    if update_fields is not None and not set(update_fields) & set(get_search_backend().search_fields):
+        return
+    get_search_backend().index(instance)
+
+
+@receiver(post_delete, sender=Event, dispatch_uid='events_unindex_event')
+def unindex_event(sender, instance, **kwargs) -> None:
+    get_search_backend().remove(instance)
+
+
+@receiver(post_save, sender=Event, dispatch_uid='events_invalidate_list_on_event_save')
+@receiver(post_delete, sender=Event, dispatch_uid='events_invalidate_list_on_event_delete')
+@receiver(post_delete, sender=Category, dispatch_uid='events_invalidate_list_on_category_delete')
+@receiver(m2m_changed, sender=Event.categories.through, dispatch_uid='events_invalidate_list_on_categories')
+@receiver(m2m_changed, sender=Event.attendees.through, dispatch_uid='events_invalidate_list_on_attendees')
+@receiver(attendees_changed, sender=Event, dispatch_uid='events_invalidate_list_on_registration')
+def invalidate_list_cache(sender, action=None, **kwargs) -> None:
+    """
+    Invalidates the cached list responses on every change of events
+    that can affect them (fields, categories and attendees).
+    """
+
+    if sender in (Event.categories.through, Event.attendees.through) and not action.startswith('post_'):
+        return
+    bump_list_version()
+
+
+@receiver(attendees_changed, sender=Event, dispatch_uid='events_publish_seats_on_registration')
+def publish_seats_on_registration(sender, event, **kwargs) -> None:
+    publish_seats([event.pk, ])
+
+
+@receiver(m2m_changed, sender=Event.attendees.through, dispatch_uid='events_publish_seats_on_attendees')
+def publish_seats_on_attendees_change(sender, instance, action, reverse, pk_set, using, **kwargs) -> None:
+    """
+    Publishes the seats availability of events whose attendees changed through the related managers.
+    """
+
+    if action == 'pre_clear' and reverse:
+        instance._seats_event_ids = list(
+            sender.objects.using(using).filter(user_id=instance.pk).values_list('event_id', flat=True)
+        )
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        publish_seats([instance.pk, ], using=using)
+        return
+
+    event_ids = instance.__dict__.pop('_seats_event_ids', []) if action == 'post_clear' else pk_set
+    if event_ids:
+        publish_seats(list(event_ids), using=using)
+
+
+@receiver(post_save, sender=Event, dispatch_uid='events_publish_seats_on_event_save')
+def publish_seats_on_event_save(sender, instance, created, raw, using, update_fields=None, **kwargs) -> None:
+    """
+    Publishes the seats availability of updated events, whose capacity may have changed.
+    """
+
+    if created or raw or (update_fields is not None and 'capacity' not in update_fields):
+        return
+    publish_seats([instance.pk, ], using=using)
+
+
+@receiver(post_save, sender=Event, dispatch_uid='events_invalidate_registration_state_on_save')
+@receiver(post_delete, sender=Event, dispatch_uid='events_invalidate_registration_state_on_delete')
+def invalidate_registration_state_on_change(sender, instance, using, created=False, raw=False, **kwargs) -> None:
+    """
+    Drops the cached registration state of changed events (e.g. published, postponed or resized).
+    """
+
+    if created or raw:
+        return
+    invalidate_registration_state([instance.pk, ], using=using)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='events_invalidate_cached_user_on_save')
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid='events_invalidate_cached_user_on_delete')
+def invalidate_cached_user_on_change(sender, instance, update_fields=None, **kwargs) -> None:
+    """
+    Drops the user cached by `CachedJWTAuthentication` on every change (e.g. deactivation, password change),
+    now and once the transaction commits (not to cache it again in between),
+    but for the `last_login` updates of token fetches.
+    """
+
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    invalidate_cached_user(instance.pk)
+    transaction.on_commit(lambda: invalidate_cached_user(instance.pk))
+
+
+@receiver(connection_created, dispatch_uid='events_count_queries')
+def install_query_counter(sender, connection, **kwargs) -> None:
+    """
+    Installs the query counter of the instrumentation middleware on the new database connections
+    (a no-op for the queries run outside of instrumented requests).
+    """
+
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_queries)
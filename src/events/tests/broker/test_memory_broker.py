@@ -0,0 +1,54 @@
+import asyncio
+import threading
+
+from django.test import SimpleTestCase
+
+from events.broker.memory_broker import InMemoryBroker
+
+
+class InMemoryBrokerTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.broker = InMemoryBroker()
+
+    async def test_fans_out_to_all_subscriptions(self):
+        s1 = self.broker.subscribe()
+        s2 = self.broker.subscribe()
+
+        self.broker.publish({'id': 1})
+
+        self.assertEqual(await s1.get(timeout=1), {'id': 1})
+        self.assertEqual(await s2.get(timeout=1), {'id': 1})
+
+    async def test_publish_from_another_thread(self):
+        subscription = self.broker.subscribe()
+
+        thread = threading.Thread(target=self.broker.publish, args=({'id': 1}, ))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(await subscription.get(timeout=1), {'id': 1})
+
+    async def test_get_times_out(self):
+        subscription = self.broker.subscribe()
+
+        self.assertIsNone(await subscription.get(timeout=0.01))
+
+    async def test_closed_subscription_is_not_fed(self):
+        subscription = self.broker.subscribe()
+        subscription.close()
+
+        self.broker.publish({'id': 1})
+        await asyncio.sleep(0)
+
+        self.assertTrue(subscription.queue.empty())
+
+    async def test_slow_subscription_drops_oldest_messages(self):
+        subscription = self.broker.subscribe()
+        subscription.queue = asyncio.Queue(maxsize=2)
+
+        for i in range(3):
+            self.broker.publish({'id': i})
+        await asyncio.sleep(0)
+
+        self.assertEqual(await subscription.get(timeout=1), {'id': 1})
+        self.assertEqual(await subscription.get(timeout=1), {'id': 2})
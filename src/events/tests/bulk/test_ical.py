@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+
+from django.test import TestCase
+from model_bakery import baker
+
+from events.bulk import export_calendar
+from events.models import Event
+
+
+class ExportCalendarTests(TestCase):
+    def test_export(self):
+        event = baker.make(
+            Event,
+            title='Meetup; with, specials',
+            place='Athens',
+            description='line 1\nline 2',
+            timestamp=datetime(2050, 1, 2, 10, 30).replace(tzinfo=timezone.utc),
+        )
+
+        content = ''.join(export_calendar(Event.objects.all(), 'My events', 'example.com'))
+
+        self.assertTrue(content.startswith('BEGIN:VCALENDAR\r\nVERSION:2.0\r\n'))
+        self.assertTrue(content.endswith('END:VEVENT\r\nEND:VCALENDAR\r\n'))
+        self.assertIn('X-WR-CALNAME:My events\r\n', content)
+        self.assertIn(f'UID:event-{event.pk}@example.com\r\n', content)
+        self.assertIn('DTSTART:20500102T103000Z\r\n', content)
+        self.assertIn('SUMMARY:Meetup\\; with\\, specials\r\n', content)
+        self.assertIn('LOCATION:Athens\r\n', content)
+        self.assertIn('DESCRIPTION:line 1\\nline 2\r\n', content)
+
+    def test_long_lines_are_folded(self):
+        baker.make(Event, title='é' * 100, description='')
+
+        content = ''.join(export_calendar(Event.objects.all(), 'My events', 'example.com'))
+
+        lines = content.split('\r\n')
+        self.assertTrue(all(len(line.encode()) <= 75 for line in lines))
+        summary = next(index for index, line in enumerate(lines) if line.startswith('SUMMARY:'))
+        self.assertEqual(
+            lines[summary][len('SUMMARY:'):] + ''.join(line[1:] for line in lines[summary + 1:summary + 3]),
+            'é' * 100,
+        )
@@ -0,0 +1,63 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from model_bakery import baker
+
+from events.models import ArchivedEvent, Category, Event, WaitlistEntry
+
+
+class ArchiveEventsCommandTests(TestCase):
+    def setUp(self) -> None:
+        now = timezone.now()
+        self.u1, self.u2 = baker.make(User, _quantity=2)
+        self.category = baker.make(Category)
+
+        self.old_evt = baker.make(Event, organizer=self.u1, timestamp=now - timedelta(days=40), capacity=5)
+        self.old_evt.attendees.add(self.u1, self.u2)
+        self.old_evt.categories.add(self.category)
+        baker.make(WaitlistEntry, event=self.old_evt)
+        self.old_evt.refresh_from_db()
+
+        self.recent_evt = baker.make(Event, timestamp=now - timedelta(days=2))
+        self.future_evt = baker.make(Event, timestamp=now + timedelta(days=2))
+        self.future_evt.attendees.add(self.u1)
+
+    def test_archives_older_events(self):
+        out = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('archive_events', '--older-than-days', '30', '--batch-size', '1', stdout=out)
+
+        self.assertIn('Archived 1 event(s)', out.getvalue())
+        self.assertEqual(set(Event.objects.values_list('pk', flat=True)), {self.recent_evt.pk, self.future_evt.pk})
+        self.assertFalse(Event.attendees.through.objects.filter(event_id=self.old_evt.pk).exists())
+        self.assertFalse(WaitlistEntry.objects.exists())
+
+        archived = ArchivedEvent.objects.get()
+        for field in ('id', 'title', 'organizer_id', 'status', 'place', 'timestamp', 'description',
+                      'capacity', 'attendees_count', 'created_at', 'updated_at'):
+            self.assertEqual(getattr(archived, field), getattr(self.old_evt, field), field)
+        self.assertEqual(set(archived.attendees.all()), {self.u1, self.u2})
+        self.assertEqual(list(archived.categories.all()), [self.category, ])
+        # Attendees of the other events are left as they were
+        self.assertEqual(list(self.future_evt.attendees.all()), [self.u1, ])
+
+    def test_archives_in_batches(self):
+        call_command('archive_events', '--older-than-days', '0', '--batch-size', '1', stdout=StringIO())
+
+        self.assertEqual(ArchivedEvent.objects.count(), 2)
+        self.assertEqual(list(Event.objects.all()), [self.future_evt, ])
+
+    @override_settings(EVENTS={'ARCHIVE_AFTER_DAYS': 1})
+    def test_horizon_from_settings(self):
+        call_command('archive_events', stdout=StringIO())
+
+        self.assertEqual(ArchivedEvent.objects.count(), 2)
+
+    def test_disabled(self):
+        with self.assertRaises(CommandError):
+            call_command('archive_events', stdout=StringIO())
+        self.assertFalse(ArchivedEvent.objects.exists())
@@ -0,0 +1,36 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from model_bakery import baker
+
+from events.models import Event
+
+
+class ImportEventsCommandTests(TestCase):
+    def setUp(self) -> None:
+        self.organizer = baker.make(User, username='organizer')
+
+    def test_imports_csv_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'events.csv'
+            path.write_text(
+                'title,place,timestamp\n'
+                'e1,Athens,2050-01-01T10:00:00Z\n'
+                'e2,Athens,not-a-date\n'
+                'e3,Athens,2050-01-03T10:00:00Z\n'
+            )
+            out, err = StringIO(), StringIO()
+
+            call_command('import_events', str(path), organizer='organizer', chunk_size=1, stdout=out, stderr=err)
+
+        self.assertEqual(sorted(Event.objects.values_list('title', flat=True)), ['e1', 'e3'])
+        self.assertIn('Imported 2 event(s), 1 failed', out.getvalue())
+        self.assertIn('Row 2', err.getvalue())
+
+    def test_unknown_organizer(self):
+        with self.assertRaises(CommandError):
+            call_command('import_events', 'events.csv', organizer='nobody')
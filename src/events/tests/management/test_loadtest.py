@@ -0,0 +1,59 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TransactionTestCase
+
+from events.loadtest import parse_mix
+from events.models import Event
+
+
+class ParseMixTests(SimpleTestCase):
+    def test_parse(self):
+        self.assertEqual(parse_mix('list=3, register=1'), {'list': 3, 'register': 1})
+
+    def test_invalid(self):
+        for value in ('unknown=1', 'list=x', 'list=0'):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_mix(value)
+
+
+class LoadTestCommandTests(TransactionTestCase):
+    """
+    Virtual users run on threads with their own database connections, so the data has to be committed.
+    """
+
+    def _loadtest(self, *args):
+        out = StringIO()
+        call_command(
+            'loadtest', '--users', '3', '--duration', '0.5', '--seed', '1', *args, stdout=out, stderr=StringIO(),
+        )
+        return out.getvalue()
+
+    def test_wsgi_threads(self):
+        out = self._loadtest('--mix', 'list=1,register=1,create=1,update=1')
+
+        self.assertIn('total', out)
+        self.assertIn('Lock contention', out)
+        self.assertIn('consistent', out)
+        self.assertNotIn('INCONSISTENT', out)
+        # The data of the run is cleaned up
+        self.assertFalse(Event.objects.exists())
+        self.assertFalse(User.objects.exists())
+
+    def test_asgi_asyncio(self):
+        out = self._loadtest('--target', 'asgi', '--mix', 'register=1', '--hot-capacity', '1')
+
+        self.assertIn('register', out)
+        self.assertIn('(capacity 1) - consistent', out)
+
+    def test_keep_data(self):
+        self._loadtest('--mix', 'list=1', '--keep-data')
+
+        self.assertEqual(User.objects.count(), 3)
+        self.assertEqual(Event.objects.count(), 1)
+
+    def test_invalid_options(self):
+        for args in (('--mix', 'unknown=1'), ('--target', 'wsgi', '--model', 'asyncio'), ('--users', '0')):
+            with self.subTest(args=args), self.assertRaises(CommandError):
+                self._loadtest(*args)
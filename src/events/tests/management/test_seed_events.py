@@ -0,0 +1,52 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.db.models import Count, F
+from django.test import TestCase
+
+from events.models import Category, Event
+
+
+class SeedEventsCommandTests(TestCase):
+    def _seed(self, **options):
+        out = StringIO()
+        options = {'events': 300, 'users': 50, 'categories': 10, 'seed': 1, 'batch_size': 100, **options}
+        call_command('seed_events', stdout=out, **options)
+        return out.getvalue()
+
+    def test_seeds_dataset(self):
+        out = self._seed()
+
+        self.assertEqual(Event.objects.count(), 300)
+        self.assertEqual(User.objects.filter(username__startswith='seed-').count(), 50)
+        self.assertEqual(Category.objects.count(), 10)
+        self.assertTrue(Event.categories.through.objects.exists())
+        self.assertIn('300 event(s)', out)
+
+    def test_attendees_match_counters_and_capacities(self):
+        self._seed()
+
+        self.assertTrue(Event.attendees.through.objects.exists())
+        self.assertFalse(
+            Event.objects.annotate(attendees_total=Count('attendees')).exclude(
+                attendees_count=F('attendees_total'),
+            ).exists()
+        )
+        self.assertFalse(Event.objects.filter(capacity__lt=F('attendees_count')).exists())
+
+    def test_seed_is_reproducible(self):
+        self._seed()
+        first = list(Event.objects.order_by('pk').values_list('title', 'place', 'capacity', 'attendees_count'))
+        Event.objects.all().delete()
+
+        self._seed(username_prefix='again-')
+
+        second = list(Event.objects.order_by('pk').values_list('title', 'place', 'capacity', 'attendees_count'))
+        self.assertEqual(first, second)
+
+    def test_existing_prefix(self):
+        self._seed(events=0)
+
+        with self.assertRaises(CommandError):
+            self._seed(events=0)
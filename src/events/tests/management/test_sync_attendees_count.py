@@ -0,0 +1,34 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from model_bakery import baker
+
+from events.models import Event
+
+
+class SyncAttendeesCountCommandTests(TestCase):
+    def setUp(self) -> None:
+        self.e1 = baker.make(Event)
+        self.e2 = baker.make(Event)
+        self.e1.attendees.add(baker.make(User), baker.make(User))
+        Event.objects.update(attendees_count=7)
+
+    def test_syncs_all_events(self):
+        out = StringIO()
+        call_command('sync_attendees_count', stdout=out)
+
+        self.e1.refresh_from_db()
+        self.e2.refresh_from_db()
+        self.assertEqual(self.e1.attendees_count, 2)
+        self.assertEqual(self.e2.attendees_count, 0)
+        self.assertIn('2 event(s)', out.getvalue())
+
+    def test_syncs_given_events_only(self):
+        call_command('sync_attendees_count', self.e1.id, stdout=StringIO())
+
+        self.e1.refresh_from_db()
+        self.e2.refresh_from_db()
+        self.assertEqual(self.e1.attendees_count, 2)
+        self.assertEqual(self.e2.attendees_count, 7)
@@ -2,7 +2,7 @@ from django.contrib.auth.models import User
 from django.test import TestCase
 from model_bakery import baker
 
-from events.models import Event
+from events.models import Category, Event
 
 
 class EventTests(TestCase):
@@ -35,3 +35,120 @@ class EventTests(TestCase):
         actual = obj.attendees_count
         expected = 0
         self.assertEqual(actual, expected)
+
+    def test_attendees_count_after_remove(self):
+        obj = baker.make(Event)
+        attendees = [baker.make(User), baker.make(User), ]
+        obj.attendees.add(*attendees)
+
+        obj.attendees.remove(attendees[0])
+
+        self.assertEqual(obj.attendees_count, 1)
+        self.assertEqual(Event.objects.get(pk=obj.pk).attendees_count, 1)
+
+    def test_attendees_count_after_clear(self):
+        obj = baker.make(Event)
+        obj.attendees.add(baker.make(User), baker.make(User))
+
+        obj.attendees.clear()
+
+        self.assertEqual(Event.objects.get(pk=obj.pk).attendees_count, 0)
+
+    def test_attendees_count_ignores_already_added(self):
+        obj = baker.make(Event)
+        user = baker.make(User)
+        obj.attendees.add(user)
+
+        obj.attendees.add(user)
+
+        self.assertEqual(Event.objects.get(pk=obj.pk).attendees_count, 1)
+
+    def test_attendees_count_from_user_side(self):
+        e1, e2 = baker.make(Event), baker.make(Event)
+        user = baker.make(User)
+
+        user.events.add(e1, e2)
+        self.assertEqual(Event.objects.get(pk=e1.pk).attendees_count, 1)
+        self.assertEqual(Event.objects.get(pk=e2.pk).attendees_count, 1)
+
+        user.events.remove(e1)
+        self.assertEqual(Event.objects.get(pk=e1.pk).attendees_count, 0)
+
+        user.events.clear()
+        self.assertEqual(Event.objects.get(pk=e2.pk).attendees_count, 0)
+
+    def test_sync_attendees_count(self):
+        obj = baker.make(Event)
+        obj.attendees.add(baker.make(User), baker.make(User))
+        Event.objects.filter(pk=obj.pk).update(attendees_count=10)
+
+        updated = Event.objects.filter(pk=obj.pk).sync_attendees_count()
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(Event.objects.get(pk=obj.pk).attendees_count, 2)
+
+    def test_register_attendee(self):
+        obj = baker.make(Event, capacity=2)
+        user = baker.make(User)
+
+        obj.register_attendee(user)
+
+        obj.refresh_from_db()
+        self.assertEqual(obj.attendees_count, 1)
+        self.assertTrue(obj.attendees.filter(pk=user.pk).exists())
+
+    def test_register_attendee_already_registered(self):
+        obj = baker.make(Event)
+        user = baker.make(User)
+        obj.register_attendee(user)
+
+        with self.assertRaises(Event.AlreadyRegistered):
+            obj.register_attendee(user)
+
+        obj.refresh_from_db()
+        self.assertEqual(obj.attendees_count, 1)
+
+    def test_register_attendee_is_full(self):
+        obj = baker.make(Event, capacity=1)
+        obj.register_attendee(baker.make(User))
+        user = baker.make(User)
+
+        with self.assertRaises(Event.IsFull):
+            obj.register_attendee(user)
+
+        obj.refresh_from_db()
+        self.assertEqual(obj.attendees_count, 1)
+        self.assertFalse(obj.attendees.filter(pk=user.pk).exists())
+
+    def test_un_register_attendee(self):
+        obj = baker.make(Event)
+        user = baker.make(User)
+        obj.register_attendee(user)
+
+        obj.un_register_attendee(user)
+
+        obj.refresh_from_db()
+        self.assertEqual(obj.attendees_count, 0)
+        self.assertFalse(obj.attendees.filter(pk=user.pk).exists())
+
+    def test_un_register_attendee_not_registered(self):
+        obj = baker.make(Event)
+
+        with self.assertRaises(Event.NotRegistered):
+            obj.un_register_attendee(baker.make(User))
+
+    def test_categories_change_touches_updated_at(self):
+        obj = baker.make(Event)
+        Event.objects.filter(pk=obj.pk).update(updated_at=None)
+
+        obj.categories.add(baker.make(Category))
+
+        self.assertIsNotNone(Event.objects.get(pk=obj.pk).updated_at)
+
+    def test_register_attendee_touches_updated_at(self):
+        obj = baker.make(Event)
+        Event.objects.filter(pk=obj.pk).update(updated_at=None)
+
+        obj.register_attendee(baker.make(User))
+
+        self.assertIsNotNone(Event.objects.get(pk=obj.pk).updated_at)
@@ -0,0 +1,90 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from model_bakery import baker
+
+from events.models import Event, WaitlistEntry
+
+
+class WaitlistEntryTests(TestCase):
+    def test_can_create_obj(self):
+        obj = baker.make(WaitlistEntry)
+
+        self.assertIsInstance(obj.id, int)
+
+    def test_position(self):
+        event = baker.make(Event)
+        entries = [baker.make(WaitlistEntry, event=event) for _ in range(3)]
+        baker.make(WaitlistEntry)
+
+        self.assertEqual([entry.position for entry in entries], [1, 2, 3])
+
+    def test_join_waitlist_of_full_event(self):
+        event = baker.make(Event, capacity=1)
+        event.register_attendee(baker.make(User))
+
+        position = event.join_waitlist(baker.make(User))
+
+        self.assertEqual(position, 1)
+        self.assertEqual(event.waitlist_entries.count(), 1)
+
+    def test_promote_waitlist_drops_entries_of_registered_users(self):
+        event = baker.make(Event, capacity=1)
+        event.register_attendee(baker.make(User))
+        registered, waiting = baker.make(User, _quantity=2)
+        event.join_waitlist(registered)
+        event.join_waitlist(waiting)
+        event.attendees.add(registered)
+
+        promoted = event.promote_waitlist()
+
+        self.assertEqual(promoted, [])
+        entries = list(event.waitlist_entries.all())
+        self.assertEqual([entry.user for entry in entries], [waiting, ])
+        self.assertEqual(entries[0].position, 1)
+
+    def test_join_waitlist_of_not_full_event_registers(self):
+        event = baker.make(Event, capacity=1)
+        user = baker.make(User)
+
+        position = event.join_waitlist(user)
+
+        self.assertIsNone(position)
+        self.assertTrue(event.attendees.filter(pk=user.pk).exists())
+
+    def test_join_waitlist_twice(self):
+        event = baker.make(Event, capacity=1)
+        event.register_attendee(baker.make(User))
+        user = baker.make(User)
+        event.join_waitlist(user)
+
+        with self.assertRaises(Event.AlreadyWaitlisted):
+            event.join_waitlist(user)
+
+    def test_un_register_promotes_first_waiting_user(self):
+        event = baker.make(Event, capacity=1)
+        attendee, first, second = baker.make(User, _quantity=3)
+        event.register_attendee(attendee)
+        event.join_waitlist(first)
+        event.join_waitlist(second)
+
+        event.un_register_attendee(attendee)
+
+        event.refresh_from_db()
+        self.assertEqual(list(event.attendees.all()), [first, ])
+        self.assertEqual(event.attendees_count, 1)
+        self.assertEqual([entry.user for entry in event.waitlist_entries.all()], [second, ])
+
+    def test_promote_waitlist_fills_free_seats(self):
+        event = baker.make(Event, capacity=1)
+        event.register_attendee(baker.make(User))
+        waiting = baker.make(User, _quantity=3)
+        for user in waiting:
+            event.join_waitlist(user)
+        Event.objects.filter(pk=event.pk).update(capacity=3)
+
+        promoted = event.promote_waitlist()
+
+        event.refresh_from_db()
+        self.assertEqual(promoted, [waiting[0].pk, waiting[1].pk])
+        self.assertEqual(event.attendees_count, 3)
+        self.assertEqual(event.waitlist_entries.count(), 1)
@@ -0,0 +1,20 @@
+from django.test import TestCase, override_settings
+from model_bakery import baker
+
+from events.models import Event
+from events.search import get_search_backend
+from events.search.icontains_backend import IContainsSearchBackend
+
+
+class IContainsSearchBackendTests(TestCase):
+    def test_search_with_all_terms(self):
+        e1 = baker.make(Event, title='Rock festival', place='Athens')
+        baker.make(Event, title='Rock festival', place='Patras')
+
+        actual = list(IContainsSearchBackend().search(Event.objects.all(), 'ock ATH'))
+
+        self.assertEqual(actual, [e1, ])
+
+    @override_settings(EVENTS={'SEARCH_BACKEND': 'events.search.icontains_backend.IContainsSearchBackend'})
+    def test_can_be_configured(self):
+        self.assertIsInstance(get_search_backend(), IContainsSearchBackend)
@@ -0,0 +1,31 @@
+from django.test import TestCase
+from model_bakery import baker
+
+from events.models import Event
+from events.search.sqlite_backend import SqliteSearchBackend
+
+
+class SqliteSearchBackendTests(TestCase):
+    def setUp(self) -> None:
+        self.backend = SqliteSearchBackend()
+
+    def test_to_match_expression(self):
+        actual = SqliteSearchBackend.to_match_expression('rock "and" roll-festival')
+        expected = '"rock"* "and"* "roll"* "festival"*'
+        self.assertEqual(actual, expected)
+
+    def test_search_annotates_rank(self):
+        baker.make(Event, title='Rock festival')
+
+        obj = self.backend.search(Event.objects.all(), 'rock').get()
+
+        self.assertGreater(obj.search_rank, 0)
+
+    def test_rebuild(self):
+        e1 = baker.make(Event, title='Rock festival')
+        Event.objects.bulk_create([Event(title='Rock concert', place='Athens', timestamp=e1.timestamp)])
+        self.assertEqual(self.backend.search(Event.objects.all(), 'rock').count(), 1)
+
+        self.backend.rebuild()
+
+        self.assertEqual(self.backend.search(Event.objects.all(), 'rock').count(), 2)
@@ -0,0 +1,30 @@
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from events.models import Event
+from events.serializers import EventListSerializer
+
+
+class EventListSerializerTests(APITestCase):
+    def test_can_serialize_objects(self):
+        objs = [
+            baker.make(Event, id=1, title='e1'),
+        ]
+        serializer = EventListSerializer(objs, many=True)
+
+        self.assertEqual(
+            sorted(list(serializer.data[0].keys())),
+            sorted([
+                'id', 'title', 'organizer', 'status', 'place', 'timestamp', 'description', 'capacity',
+                'attendees_count', 'is_registered', 'categories', 'created_at', 'updated_at',
+            ])
+        )
+
+    def test_serializes_is_registered_annotation(self):
+        baker.make(Event, id=1, title='e1')
+        obj = Event.objects.get(id=1)
+        obj.is_registered = True
+
+        serializer = EventListSerializer(obj)
+
+        self.assertTrue(serializer.data['is_registered'])
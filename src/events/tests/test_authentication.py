@@ -0,0 +1,77 @@
+from django.contrib.auth.models import User, update_last_login
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.authentication import USER_CACHE_KEY, CachedJWTAuthentication, StatelessJWTAuthentication
+
+TEST_USER_PASS = 'test-12345'
+
+
+@override_settings(EVENTS={'AUTH_USER_CACHE_TIMEOUT': 30})
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.request = APIRequestFactory().get(
+            '/', HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(self.u1).access_token}',
+        )
+        self.cache_key = USER_CACHE_KEY.format(user_id=self.u1.pk)
+
+    def _authenticate(self):
+        user, _ = CachedJWTAuthentication().authenticate(self.request)
+        return user
+
+    def test_user_is_cached(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self._authenticate(), self.u1)
+        with self.assertNumQueries(0):
+            self.assertEqual(self._authenticate(), self.u1)
+
+    @override_settings(EVENTS={'AUTH_USER_CACHE_TIMEOUT': 0})
+    def test_cache_disabled(self):
+        self._authenticate()
+
+        with self.assertNumQueries(1):
+            self._authenticate()
+
+    def test_deactivation_invalidates_cached_user(self):
+        self._authenticate()
+
+        self.u1.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.u1.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_password_change_invalidates_cached_user(self):
+        self._authenticate()
+
+        self.u1.set_password('changed-12345')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.u1.save()
+
+        self.assertIsNone(cache.get(self.cache_key))
+        self.assertTrue(self._authenticate().check_password('changed-12345'))
+
+    def test_last_login_update_keeps_cached_user(self):
+        self._authenticate()
+
+        update_last_login(None, self.u1)
+
+        self.assertIsNotNone(cache.get(self.cache_key))
+
+
+class StatelessJWTAuthenticationTests(TestCase):
+    def test_user_is_not_queried(self):
+        u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(u1).access_token}')
+
+        with self.assertNumQueries(0):
+            user, _ = StatelessJWTAuthentication().authenticate(request)
+
+        self.assertIsInstance(user, TokenUser)
+        self.assertEqual(str(user.pk), str(u1.pk))
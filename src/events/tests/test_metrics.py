@@ -0,0 +1,129 @@
+import re
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.metrics import Histogram, render_metrics, reset_metrics
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+class HistogramTests(SimpleTestCase):
+    def test_collect(self):
+        histogram = Histogram('latency_seconds', 'Latency', ('route', ), (0.1, 1))
+        histogram.observe('a"b', value=0.05)
+        histogram.observe('a"b', value=0.5)
+        histogram.observe('a"b', value=5)
+
+        self.assertEqual(histogram.collect(), [
+            'latency_seconds_bucket{route="a\\"b",le="0.1"} 1',
+            'latency_seconds_bucket{route="a\\"b",le="1"} 2',
+            'latency_seconds_bucket{route="a\\"b",le="+Inf"} 3',
+            'latency_seconds_sum{route="a\\"b"} 5.55',
+            'latency_seconds_count{route="a\\"b"} 3',
+        ])
+
+
+@override_settings(EVENTS={'METRICS_ENABLED': True, 'LIST_CACHE_TIMEOUT': 30})
+class InstrumentationMiddlewareTests(APITestCase):
+    def setUp(self) -> None:
+        reset_metrics()
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(self.u1).access_token}')
+        self.event = baker.make(Event, timestamp=timezone.now() + timedelta(days=1))
+
+    def _sample(self, name: str, **labels) -> float:
+        metrics = render_metrics()
+        label_pattern = ','.join(f'{label}="{value}"' for label, value in labels.items())
+        label_pattern = label_pattern and f'{{{label_pattern}}}'
+        match = re.search(rf'^{name}{re.escape(label_pattern)} (\S+)$', metrics, re.MULTILINE)
+        self.assertIsNotNone(match, metrics)
+        return float(match.group(1))
+
+    def test_requests_are_recorded_per_route(self):
+        # The list cache counters are not reset between tests
+        cache_hits = self._sample('events_list_cache_requests_total', result='hit')
+        cache_misses = self._sample('events_list_cache_requests_total', result='miss')
+
+        for _ in range(2):
+            self.assertEqual(self.u1_client.get('/api/v1/events/').status_code, status.HTTP_200_OK)
+        response = self.u1_client.post(f'/api/v1/events/{self.event.pk}/register/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        list_labels = {'route': 'events-list', 'method': 'GET'}
+        self.assertEqual(self._sample('http_requests_total', **list_labels, status=200), 2)
+        self.assertEqual(self._sample('http_request_duration_seconds_count', **list_labels), 2)
+        self.assertGreater(self._sample('http_request_duration_seconds_sum', **list_labels), 0)
+        self.assertGreater(self._sample('http_response_size_bytes_sum', **list_labels), 0)
+
+        register_labels = {'route': 'events-register', 'method': 'POST'}
+        self.assertEqual(self._sample('http_requests_total', **register_labels, status=204), 1)
+        self.assertGreater(self._sample('db_queries_per_request_sum', **register_labels), 0)
+        self.assertGreater(self._sample('db_query_duration_seconds_per_request_sum', **register_labels), 0)
+
+        # The second list request was served from the cache
+        self.assertEqual(self._sample('events_list_cache_requests_total', result='hit'), cache_hits + 1)
+        self.assertEqual(self._sample('events_list_cache_requests_total', result='miss'), cache_misses + 1)
+        self.assertGreater(self._sample('events_list_cache_hit_ratio'), 0)
+
+    def test_queries_are_counted(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.u1_client.get(f'/api/v1/events/{self.event.pk}/')
+
+        self.assertEqual(
+            self._sample('db_queries_per_request_sum', route='events-detail', method='GET'), len(queries),
+        )
+
+    async def test_async_requests(self):
+        response = await self.async_client.get(
+            f'/api/v1/async/events/{self.event.pk}/',
+            headers={'authorization': f'JWT {RefreshToken.for_user(self.u1).access_token}'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        labels = {'route': 'async-events-detail', 'method': 'GET'}
+        self.assertEqual(self._sample('http_requests_total', **labels, status=200), 1)
+        # The queries run in threads are counted too
+        self.assertGreater(self._sample('db_queries_per_request_sum', **labels), 0)
+
+    def test_unmatched_route(self):
+        self.client.get('/nowhere/')
+
+        self.assertEqual(self._sample('http_requests_total', route='unmatched', method='GET', status=404), 1)
+
+    def test_metrics_endpoint(self):
+        self.u1_client.get('/api/v1/events/')
+
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn('# TYPE http_request_duration_seconds histogram', response.content.decode())
+
+    @override_settings(EVENTS={'METRICS_ENABLED': True, 'METRICS_TOKEN': 'secret'})
+    def test_metrics_endpoint_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(
+            self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code,
+            status.HTTP_401_UNAUTHORIZED,
+        )
+        self.assertEqual(
+            self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret').status_code, status.HTTP_200_OK,
+        )
+
+    @override_settings(EVENTS={'METRICS_ENABLED': False})
+    def test_disabled(self):
+        self.u1_client.get('/api/v1/events/')
+
+        self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn('http_requests_total{', render_metrics())
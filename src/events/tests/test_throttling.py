@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+
+from events.throttling import TokenBucketThrottle
+
+
+class FakeThrottle(TokenBucketThrottle):
+    scope = 'fake'
+    now = 1000.0
+
+    def timer(self) -> float:
+        return self.now
+
+    def get_ident_key(self, request, view) -> str:
+        return 'ident'
+
+
+@override_settings(REST_FRAMEWORK={'DEFAULT_THROTTLE_RATES': {'fake': '2/min'}})
+class TokenBucketThrottleTests(SimpleTestCase):
+    def _allow(self, now: float) -> tuple[bool, float]:
+        FakeThrottle.now = now
+        throttle = FakeThrottle()
+        return throttle.allow_request(SimpleNamespace(), None), throttle.wait()
+
+    def test_burst_then_refill(self):
+        self.assertEqual(self._allow(1000), (True, None))
+        self.assertEqual(self._allow(1000), (True, None))
+
+        allowed, wait = self._allow(1015)
+        self.assertFalse(allowed)
+        # A token every 30s, half of it refilled already
+        self.assertAlmostEqual(wait, 15)
+
+        self.assertEqual(self._allow(1030), (True, None))
+        self.assertFalse(self._allow(1030)[0])
+
+    @override_settings(REST_FRAMEWORK={'DEFAULT_THROTTLE_RATES': {}})
+    def test_disabled_without_rate(self):
+        for _ in range(10):
+            self.assertTrue(self._allow(1000)[0])
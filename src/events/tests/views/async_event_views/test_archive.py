@@ -0,0 +1,61 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@override_settings(EVENTS={'ARCHIVE_AFTER_DAYS': 30})
+class AsyncArchivedEventsTests(TestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.headers = {'authorization': f'JWT {RefreshToken.for_user(self.u1).access_token}'}
+
+        now = timezone.now()
+        self.category = baker.make(Category)
+        self.archived_evt = baker.make(Event, title='old gig', organizer=self.u1, timestamp=now - timedelta(days=60))
+        self.archived_evt.attendees.add(self.u1)
+        self.archived_evt.categories.add(self.category)
+        self.recent_evt = baker.make(Event, title='recent gig', timestamp=now - timedelta(days=1))
+
+        call_command('archive_events', stdout=StringIO())
+
+    async def test_list(self):
+        response = await self.async_client.get('/api/v1/async/events/?only_past=true', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()['results']
+        self.assertEqual([r['id'] for r in results], [self.recent_evt.id, self.archived_evt.id])
+        self.assertEqual(results[1]['categories'], [self.category.id, ])
+        self.assertEqual([r['is_registered'] for r in results], [False, True])
+
+    async def test_detail_falls_back_to_the_archive(self):
+        response = await self.async_client.get(f'/api/v1/async/events/{self.archived_evt.id}/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['title'], 'old gig')
+        self.assertEqual(response.json()['categories'], [self.category.id, ])
+        self.assertTrue(response.json()['is_registered'])
+
+    async def test_register_rejects_archived_events(self):
+        response = await self.async_client.post(
+            f'/api/v1/async/events/{self.archived_evt.id}/register/', headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'ACTION_NOT_ALLOWED_ON_PAST_EVENT')
+
+    @override_settings(EVENTS={'ARCHIVE_AFTER_DAYS': None})
+    async def test_disabled(self):
+        response = await self.async_client.get(f'/api/v1/async/events/{self.archived_evt.id}/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
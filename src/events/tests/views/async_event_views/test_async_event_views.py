@@ -0,0 +1,148 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+class AsyncEventViewsTests(TestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        self.headers = {'authorization': f'JWT {RefreshToken.for_user(self.u1).access_token}'}
+
+        self.c1 = baker.make(Category, name='c1')
+        self.c2 = baker.make(Category, name='c2')
+
+        t_future = timezone.now() + timedelta(days=1)
+        self.e1 = baker.make(Event, title='e1', organizer=self.u1, timestamp=t_future - timedelta(hours=1))
+        self.e2 = baker.make(Event, title='e2', organizer=self.u2, timestamp=t_future, capacity=1)
+        self.e1.categories.set([self.c1, self.c2])
+        self.e2.attendees.add(self.u1)
+
+    async def test_list_requires_authentication(self):
+        response = await self.async_client.get('/api/v1/async/events/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('WWW-Authenticate', response)
+
+    async def test_list_matches_sync_list(self):
+        response = await self.async_client.get('/api/v1/async/events/', headers=self.headers)
+        sync_response = await self.async_client.get('/api/v1/events/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response.json()['results'][0]['is_registered'], True)
+        self.assertEqual(response.json()['results'][1]['categories'], [self.c2.pk, self.c1.pk])
+
+    async def test_list_filters_and_pagination(self):
+        response = await self.async_client.get(
+            '/api/v1/async/events/', {'only_mine': 'true'}, headers=self.headers,
+        )
+        self.assertEqual([event['id'] for event in response.json()['results']], [self.e1.pk])
+
+        response = await self.async_client.get('/api/v1/async/events/', {'page_size': 1}, headers=self.headers)
+        self.assertEqual(response.json()['count'], 2)
+        self.assertEqual(response.json()['previous'], None)
+        self.assertEqual(
+            response.json()['next'],
+            'http://testserver/api/v1/async/events/?page=2&page_size=1',
+        )
+
+        response = await self.async_client.get(
+            '/api/v1/async/events/', {'page_size': 1, 'page': 2}, headers=self.headers,
+        )
+        self.assertEqual([event['id'] for event in response.json()['results']], [self.e1.pk])
+        self.assertEqual(response.json()['next'], None)
+        self.assertEqual(response.json()['previous'], 'http://testserver/api/v1/async/events/?page_size=1')
+
+        response = await self.async_client.get('/api/v1/async/events/', {'page': 3}, headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_list_invalid_filter(self):
+        response = await self.async_client.get('/api/v1/async/events/', {'status': 'NOPE'}, headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('status', response.json())
+
+    @override_settings(EVENTS={'LIST_VALIDATORS': True})
+    async def test_list_not_modified(self):
+        response = await self.async_client.get('/api/v1/async/events/', headers=self.headers)
+
+        response = await self.async_client.get(
+            '/api/v1/async/events/', headers={**self.headers, 'if-none-match': response['ETag']},
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_detail(self):
+        response = await self.async_client.get(f'/api/v1/async/events/{self.e1.pk}/', headers=self.headers)
+        sync_response = await self.async_client.get(f'/api/v1/events/{self.e1.pk}/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+
+        response = await self.async_client.get(
+            f'/api/v1/async/events/{self.e1.pk}/', headers={**self.headers, 'if-none-match': response['ETag']},
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_detail_not_found(self):
+        response = await self.async_client.get('/api/v1/async/events/0/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_register(self):
+        response = await self.async_client.post(f'/api/v1/async/events/{self.e1.pk}/register/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        await self.e1.arefresh_from_db()
+        self.assertEqual(self.e1.attendees_count, 1)
+
+        response = await self.async_client.post(f'/api/v1/async/events/{self.e1.pk}/register/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT')
+
+    async def test_register_to_full_event(self):
+        headers = {'authorization': f'JWT {RefreshToken.for_user(self.u2).access_token}'}
+        response = await self.async_client.post(f'/api/v1/async/events/{self.e2.pk}/register/', headers=headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'EVENT_IS_FULL')
+
+    @override_settings(EVENTS={'REGISTRATION_STATE_CACHE_TIMEOUT': 30, 'AUTH_USER_CACHE_TIMEOUT': 30})
+    async def test_register_to_full_event_is_rejected_from_the_cache(self):
+        headers = {'authorization': f'JWT {RefreshToken.for_user(self.u2).access_token}'}
+        await self.async_client.post(f'/api/v1/async/events/{self.e2.pk}/register/', headers=headers)
+        # Freeing a seat behind the cache's back (`update` sends no signal): the cached state still rejects
+        await Event.objects.filter(pk=self.e2.pk).aupdate(capacity=None)
+
+        response = await self.async_client.post(f'/api/v1/async/events/{self.e2.pk}/register/', headers=headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'EVENT_IS_FULL')
+
+    @override_settings(REST_FRAMEWORK={
+        'DEFAULT_AUTHENTICATION_CLASSES': ('events.authentication.CachedJWTAuthentication', ),
+        'DEFAULT_THROTTLE_RATES': {'registration_user': '1/min', 'registration_event': '10/min'},
+    })
+    async def test_register_is_throttled(self):
+        response = await self.async_client.post(f'/api/v1/async/events/{self.e1.pk}/register/', headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = await self.async_client.post(f'/api/v1/async/events/{self.e1.pk}/register/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+
+    async def test_register_method_not_allowed(self):
+        response = await self.async_client.get(f'/api/v1/async/events/{self.e1.pk}/register/', headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
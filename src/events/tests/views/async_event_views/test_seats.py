@@ -0,0 +1,102 @@
+import asyncio
+import json
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.broker import get_broker
+from events.models import Event
+from events.views.async_event_views import AsyncEventSeatsView
+
+TEST_USER_PASS = 'test-12345'
+
+
+class AsyncEventSeatsViewTests(TestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.headers = {'authorization': f'JWT {RefreshToken.for_user(self.u1).access_token}'}
+
+        t_future = timezone.now() + timedelta(days=1)
+        self.e1 = baker.make(Event, title='e1', organizer=self.u1, timestamp=t_future, capacity=2)
+        self.e2 = baker.make(Event, title='e2', organizer=self.u1, timestamp=t_future)
+        self.e3 = baker.make(Event, title='e3', organizer=self.u1, timestamp=t_future)
+
+    @staticmethod
+    async def _next_message(content) -> dict:
+        chunk = await asyncio.wait_for(anext(content), timeout=1)
+        chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+        event, data = chunk.strip().split('\n')
+        assert event == 'event: seats'
+        return json.loads(data.removeprefix('data: '))
+
+    def _register(self, event: Event) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            event.register_attendee(self.u1)
+
+    async def test_stream_current_state_then_changes(self):
+        response = await self.async_client.get(
+            '/api/v1/async/events/seats/', {'ids': f'{self.e1.pk},{self.e2.pk}'}, headers=self.headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        content = aiter(response.streaming_content)
+        self.assertEqual(await anext(content), b'retry: 1000\n\n')
+
+        messages = [await self._next_message(content), await self._next_message(content)]
+        self.assertEqual(
+            sorted(messages, key=lambda message: message['id']),
+            [
+                {'id': self.e1.pk, 'capacity': 2, 'attendees_count': 0, 'seats_left': 2},
+                {'id': self.e2.pk, 'capacity': None, 'attendees_count': 0, 'seats_left': None},
+            ],
+        )
+
+        # Changes of events out of the requested ones are filtered out
+        await sync_to_async(self._register)(self.e3)
+        await sync_to_async(self._register)(self.e1)
+
+        self.assertEqual(
+            await self._next_message(content),
+            {'id': self.e1.pk, 'capacity': 2, 'attendees_count': 1, 'seats_left': 1},
+        )
+        await content.aclose()
+
+    @mock.patch.object(AsyncEventSeatsView, 'max_lifetime', 0.1)
+    async def test_stream_ends_after_its_lifetime(self):
+        response = await self.async_client.get(
+            '/api/v1/async/events/seats/', {'ids': f'{self.e1.pk}'}, headers=self.headers,
+        )
+        self.assertEqual(len(get_broker()._subscriptions), 1)
+
+        chunks = [chunk async for chunk in response.streaming_content]
+
+        self.assertEqual(chunks[0], b'retry: 1000\n\n')
+        self.assertTrue(chunks[1].startswith(b'event: seats\n'))
+        # The subscription is dropped from the broker once the stream ends
+        self.assertEqual(len(get_broker()._subscriptions), 0)
+
+    async def test_invalid_ids(self):
+        response = await self.async_client.get('/api/v1/async/events/seats/', {'ids': 'a,b'}, headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'INVALID_EVENT_IDS')
+
+    async def test_too_many_ids(self):
+        response = await self.async_client.get(
+            '/api/v1/async/events/seats/', {'ids': ','.join(map(str, range(1, 200)))}, headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'TOO_MANY_EVENTS')
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get('/api/v1/async/events/seats/', {'ids': '1'})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
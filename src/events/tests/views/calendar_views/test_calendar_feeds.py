@@ -0,0 +1,136 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@override_settings(EVENTS={'CALENDAR_CACHE_TIMEOUT': 60})
+class CalendarFeedsTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(self.u1).access_token}')
+
+        self.category = baker.make(Category, name='music')
+        t_future = timezone.now() + timedelta(days=1)
+        self.e1 = baker.make(Event, title='e1', timestamp=t_future)
+        self.e2 = baker.make(Event, title='e2', timestamp=t_future)
+        self.e3 = baker.make(Event, title='e3', timestamp=t_future, status=Event.Status.HIDDEN)
+        # Out of the window of the feeds
+        self.e4 = baker.make(Event, title='e4', timestamp=timezone.now() - timedelta(days=60))
+        self.e1.attendees.add(self.u1)
+        self.e4.attendees.add(self.u1)
+        for event in (self.e2, self.e3, self.e4):
+            event.categories.add(self.category)
+
+    def _feed_url(self, **params) -> str:
+        response = self.u1_client.get('/api/v1/me/events/calendar/', params, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()['url']
+
+    def _get(self, url: str, **headers):
+        # Calendar apps do not authenticate with JWT
+        response = self.client.get(url, **headers)
+        if response.status_code == status.HTTP_200_OK:
+            response.text = b''.join(response.streaming_content if response.streaming else [response.content])
+        return response
+
+    def test_events_feed(self):
+        response = self._get(self._feed_url())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        self.assertIn(b'SUMMARY:e1\r\n', response.text)
+        self.assertNotIn(b'SUMMARY:e4\r\n', response.text)
+        self.assertEqual(response.text.count(b'BEGIN:VEVENT'), 1)
+
+    def test_category_feed(self):
+        response = self._get(self._feed_url(category=self.category.pk))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b'X-WR-CALNAME:music\r\n', response.text)
+        self.assertIn(b'SUMMARY:e2\r\n', response.text)
+        self.assertEqual(response.text.count(b'BEGIN:VEVENT'), 1)
+
+    def test_unknown_category(self):
+        response = self.u1_client.get('/api/v1/me/events/calendar/', {'category': 0}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_token(self):
+        url = self._feed_url()
+
+        self.assertEqual(self._get(url.replace('/events.ics', 'x/events.ics')).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_not_modified(self):
+        url = self._feed_url()
+        etag = self._get(url)['ETag']
+
+        # Token check + feed state
+        with self.assertNumQueries(2):
+            response = self._get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_cached_feed_follows_changes(self):
+        url = self._feed_url()
+        self._get(url)
+
+        with self.assertNumQueries(2):
+            response = self._get(url)
+        self.assertFalse(response.streaming)
+        self.assertIn(b'SUMMARY:e1\r\n', response.text)
+
+        self.e2.attendees.add(self.u1)
+        response = self._get(url)
+        self.assertIn(b'SUMMARY:e2\r\n', response.text)
+
+    def test_category_feed_ignores_registrations(self):
+        url = self._feed_url(category=self.category.pk)
+        etag = self._get(url)['ETag']
+
+        self.e2.register_attendee(self.u1)
+        response = self._get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.e2.title = 'changed'
+        self.e2.save()
+        response = self._get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b'SUMMARY:changed\r\n', response.text)
+
+    def test_category_feed_is_cached_for_every_user(self):
+        self._get(self._feed_url(category=self.category.pk))
+
+        u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(u2).access_token}')
+        response = self._get(self._feed_url(category=self.category.pk))
+
+        self.assertFalse(response.streaming)
+        self.assertIn(b'SUMMARY:e2\r\n', response.text)
+
+    def test_rotated_token_is_revoked(self):
+        url = self._feed_url()
+
+        response = self.u1_client.post('/api/v1/me/events/calendar/', format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        new_url = response.json()['url']
+
+        self.assertNotEqual(new_url, url)
+        self.assertEqual(self._get(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self._get(new_url).status_code, status.HTTP_200_OK)
+
+    def test_inactive_user(self):
+        url = self._feed_url()
+        self.u1.is_active = False
+        self.u1.save()
+
+        self.assertEqual(self._get(url).status_code, status.HTTP_404_NOT_FOUND)
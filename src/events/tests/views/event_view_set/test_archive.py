@@ -0,0 +1,116 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@override_settings(EVENTS={'ARCHIVE_AFTER_DAYS': 30})
+class ArchivedEventsTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+
+        now = timezone.now()
+        self.category = baker.make(Category)
+        self.archived_evt = baker.make(Event, title='old gig', organizer=self.u1, timestamp=now - timedelta(days=60))
+        self.archived_evt.attendees.add(self.u1)
+        self.archived_evt.categories.add(self.category)
+        self.other_archived_evt = baker.make(Event, title='older gig', timestamp=now - timedelta(days=90))
+        self.recent_evt = baker.make(Event, title='recent gig', timestamp=now - timedelta(days=1))
+        self.hot_evt = baker.make(Event, organizer=self.u1, timestamp=now + timedelta(days=1))
+
+        call_command('archive_events', stdout=StringIO())
+
+    def test_only_past_lists_the_recent_and_archived_events(self):
+        response = self.u1_client.get('/api/v1/events/?only_past=true', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 3)
+        results = response.json()['results']
+        self.assertEqual(
+            [r['id'] for r in results], [self.recent_evt.id, self.archived_evt.id, self.other_archived_evt.id],
+        )
+        self.assertEqual(results[1]['categories'], [self.category.id, ])
+        self.assertEqual(results[1]['attendees_count'], 1)
+        self.assertEqual([r['is_registered'] for r in results], [False, True, False])
+
+    def test_only_past_filters_and_search(self):
+        for query, expected in (
+            ('only_mine=true', [self.archived_evt.id, ]),
+            (f'categories={self.category.id}', [self.archived_evt.id, ]),
+            ('search=gig', [self.recent_evt.id, self.archived_evt.id, self.other_archived_evt.id]),
+            ('search=older', [self.other_archived_evt.id, ]),
+            (f'timestamp__lte={(timezone.now() - timedelta(days=45)).date().isoformat()}',
+             [self.archived_evt.id, self.other_archived_evt.id]),
+        ):
+            with self.subTest(query=query):
+                response = self.u1_client.get(f'/api/v1/events/?only_past=true&{query}', format='json')
+                self.assertEqual([r['id'] for r in response.json()['results']], expected)
+
+        response = self.u1_client.get('/api/v1/events/facets/?only_past=true', format='json')
+        self.assertEqual(response.json()['count'], 3)
+        self.assertEqual(response.json()['categories'], [{'id': self.category.id, 'count': 1}])
+
+        response = self.u1_client.get('/api/v1/events/export/?only_past=true&file_format=ndjson')
+        content = b''.join(response.streaming_content).decode()
+        self.assertEqual(len(content.splitlines()), 3)
+        self.assertIn('"old gig"', content)
+
+    def test_only_past_keyset_pagination_runs_through_both_tables(self):
+        ids = []
+        url = '/api/v1/events/?only_past=true&pagination=cursor&page_size=1'
+        while url:
+            response = self.u1_client.get(url, format='json').json()
+            ids += [r['id'] for r in response['results']]
+            url = response['next']
+
+        self.assertEqual(ids, [self.recent_evt.id, self.archived_evt.id, self.other_archived_evt.id])
+
+    def test_other_lists_read_the_events_table(self):
+        response = self.u1_client.get('/api/v1/events/', format='json')
+
+        self.assertEqual([r['id'] for r in response.json()['results']], [self.hot_evt.id, self.recent_evt.id])
+
+    def test_detail_lookup_falls_back_to_the_archive(self):
+        response = self.u1_client.get(f'/api/v1/events/{self.archived_evt.id}/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['title'], 'old gig')
+        self.assertTrue(response.json()['is_registered'])
+
+        response = self.u1_client.get(f'/api/v1/events/{self.archived_evt.id}/attendees/', format='json')
+        self.assertEqual(response.json()['results'], [{'id': self.u1.id}])
+
+    def test_archived_events_are_read_only(self):
+        response = self.u1_client.post(f'/api/v1/events/{self.archived_evt.id}/un-register/', format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'detail': 'ACTION_NOT_ALLOWED_ON_PAST_EVENT'})
+
+        response = self.u1_client.put(
+            f'/api/v1/events/{self.archived_evt.id}/',
+            {'title': 'changed', 'place': 'place', 'timestamp': timezone.now() + timedelta(days=1)},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(EVENTS={'ARCHIVE_AFTER_DAYS': None})
+    def test_disabled(self):
+        response = self.u1_client.get(f'/api/v1/events/{self.archived_evt.id}/', format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.u1_client.get('/api/v1/events/?only_past=true', format='json')
+        self.assertEqual([r['id'] for r in response.json()['results']], [self.recent_evt.id, ])
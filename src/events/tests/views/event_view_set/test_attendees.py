@@ -0,0 +1,54 @@
+from django.contrib.auth.models import User
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+class ListEventAttendeesTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        self.u3 = User.objects.create_user(username='u3', password=TEST_USER_PASS)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+
+        self.e1 = baker.make(Event, title='e1', organizer=self.u1)
+        self.e1.attendees.add(self.u1, self.u2, self.u3)
+
+    def test_user_can_list_attendees_of_event(self):
+        response = self.u1_client.get(
+            f'/api/v1/events/{self.e1.id}/attendees/',
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 3)
+        self.assertEqual(
+            response.json()['results'],
+            [{'id': self.u1.id}, {'id': self.u2.id}, {'id': self.u3.id}, ],
+        )
+
+    def test_user_can_list_attendees_of_event_paginated(self):
+        response = self.u1_client.get(
+            f'/api/v1/events/{self.e1.id}/attendees/?page_size=2&page=2',
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['results'], [{'id': self.u3.id}, ])
+
+    def test_non_auth_user_cannot_list_attendees_of_event(self):
+        response = self.client.get(
+            f'/api/v1/events/{self.e1.id}/attendees/',
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,78 @@
+import json
+
+from django.contrib.auth.models import User
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+class BulkImportEventsTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+
+        self.c1 = baker.make(Category)
+        self.c2 = baker.make(Category)
+
+    def _import(self, body: str, content_type: str):
+        return self.u1_client.generic('POST', '/api/v1/events/import/', body, content_type=content_type)
+
+    def test_user_can_import_csv(self):
+        body = (
+            'title,place,timestamp,capacity,categories\n'
+            f'e1,Athens,2050-01-01T10:00:00Z,10,{self.c1.id}|{self.c2.id}\n'
+            'e2,Patras,2050-01-02T10:00:00Z,,\n'
+        )
+
+        response = self._import(body, 'text/csv')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json(), {'created': 2, 'failed': 0, 'errors': []})
+        e1 = Event.objects.get(title='e1')
+        self.assertEqual(e1.organizer, self.u1)
+        self.assertEqual(e1.capacity, 10)
+        self.assertEqual(set(e1.categories.values_list('id', flat=True)), {self.c1.id, self.c2.id})
+        self.assertIsNone(Event.objects.get(title='e2').capacity)
+
+    def test_user_can_import_ndjson_skipping_invalid_rows(self):
+        body = '\n'.join([
+            json.dumps({'title': 'e1', 'place': 'Athens', 'timestamp': '2050-01-01T10:00:00Z'}),
+            json.dumps({'title': 'e2', 'place': 'Athens'}),
+            '{not json',
+            json.dumps({'title': 'e3', 'place': 'Athens', 'timestamp': '2050-01-01T10:00:00Z', 'categories': [999]}),
+        ])
+
+        response = self._import(body, 'application/x-ndjson')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['created'], 1)
+        self.assertEqual(response.json()['failed'], 3)
+        self.assertEqual([error['row'] for error in response.json()['errors']], [2, 3, 4])
+        self.assertIn('timestamp', response.json()['errors'][0]['errors'])
+        self.assertIn('categories', response.json()['errors'][2]['errors'])
+        self.assertEqual(list(Event.objects.values_list('title', flat=True)), ['e1'])
+
+    def test_imported_events_are_searchable(self):
+        self._import('title,place,timestamp\nJazz night,Athens,2050-01-01T10:00:00Z\n', 'text/csv')
+
+        response = self.u1_client.get('/api/v1/events/?search=jazz', format='json')
+
+        self.assertEqual(response.json()['count'], 1)
+
+    def test_import_unsupported_media_type(self):
+        response = self._import('{}', 'application/xml')
+
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+    def test_non_auth_user_cannot_import(self):
+        response = self.client.generic('POST', '/api/v1/events/import/', '', content_type='text/csv')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,146 @@
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from freezegun import freeze_time
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@freeze_time('2024-03-16 00:00:00')
+class BulkRegisterToEventTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        u2_refresh = RefreshToken.for_user(self.u2)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+        self.u2_client = APIClient()
+        self.u2_client.credentials(HTTP_AUTHORIZATION=f'JWT {u2_refresh.access_token}')
+
+        self.users = baker.make(User, _quantity=3)
+        self.user_ids = [user.id for user in self.users]
+
+        t_past = datetime(2024, 3, 15, 0, 0, 0).replace(tzinfo=timezone.utc)
+        t_future = datetime(2024, 3, 17, 0, 0, 0).replace(tzinfo=timezone.utc)
+
+        self.past_evt = baker.make(Event, title='e1', organizer=self.u1, timestamp=t_past)
+        self.future_evt = baker.make(Event, title='e2', organizer=self.u1, timestamp=t_future, capacity=3)
+
+    def _bulk_register(self, event: Event, client: APIClient = None, **data):
+        return (client or self.u1_client).post(
+            f'/api/v1/events/{event.id}/bulk-register/',
+            format='json',
+            data=data,
+        )
+
+    def test_organizer_can_bulk_register_users(self):
+        response = self._bulk_register(self.future_evt, user_ids=self.user_ids)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            [{'user_id': user_id, 'detail': 'REGISTERED'} for user_id in self.user_ids],
+        )
+        self.future_evt.refresh_from_db()
+        self.assertEqual(self.future_evt.attendees_count, 3)
+        self.assertEqual(set(self.future_evt.attendees.values_list('id', flat=True)), set(self.user_ids))
+
+    def test_bulk_register_is_all_or_nothing(self):
+        self.future_evt.attendees.add(self.users[0])
+
+        response = self._bulk_register(self.future_evt, user_ids=[*self.user_ids, 999])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'BULK_REGISTRATION_FAILED')
+        self.assertEqual(
+            response.json()['results'],
+            [
+                {'user_id': self.user_ids[0], 'detail': 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT'},
+                {'user_id': 999, 'detail': 'USER_DOES_NOT_EXIST'},
+            ],
+        )
+        self.future_evt.refresh_from_db()
+        self.assertEqual(self.future_evt.attendees_count, 1)
+
+    def test_bulk_register_partial(self):
+        self.future_evt.attendees.add(self.u2)
+
+        response = self._bulk_register(self.future_evt, user_ids=self.user_ids, allow_partial=True)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result['detail'] for result in response.json()],
+            ['REGISTERED', 'REGISTERED', 'EVENT_IS_FULL'],
+        )
+        self.future_evt.refresh_from_db()
+        self.assertEqual(self.future_evt.attendees_count, 3)
+
+    def test_bulk_register_checks_capacity_for_whole_batch(self):
+        response = self._bulk_register(self.future_evt, user_ids=[*self.user_ids, self.u2.id])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['results'], [{'user_id': self.u2.id, 'detail': 'EVENT_IS_FULL'}])
+        self.assertEqual(self.future_evt.attendees.count(), 0)
+
+    def test_organizer_can_bulk_un_register_users(self):
+        self.future_evt.attendees.add(*self.users[:2])
+
+        response = self.u1_client.post(
+            f'/api/v1/events/{self.future_evt.id}/bulk-un-register/',
+            format='json',
+            data={'user_ids': self.user_ids, 'allow_partial': True},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result['detail'] for result in response.json()],
+            ['UN_REGISTERED', 'UN_REGISTERED', 'WAS_NOT_REGISTERED_TO_THIS_EVENT'],
+        )
+        self.future_evt.refresh_from_db()
+        self.assertEqual(self.future_evt.attendees_count, 0)
+
+    def test_bulk_un_register_is_all_or_nothing(self):
+        self.future_evt.attendees.add(self.users[0])
+
+        response = self.u1_client.post(
+            f'/api/v1/events/{self.future_evt.id}/bulk-un-register/',
+            format='json',
+            data={'user_ids': self.user_ids[:2]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.future_evt.attendees.count(), 1)
+
+    def test_organizer_cannot_bulk_register_to_past_event(self):
+        response = self._bulk_register(self.past_evt, user_ids=self.user_ids)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'ACTION_NOT_ALLOWED_ON_PAST_EVENT')
+
+    def test_bulk_register_validates_request(self):
+        response = self._bulk_register(self.future_evt, user_ids=[])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('user_ids', response.json())
+
+    def test_non_organizer_cannot_bulk_register(self):
+        response = self._bulk_register(self.future_evt, client=self.u2_client, user_ids=self.user_ids)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_staff_can_bulk_register(self):
+        self.u2.is_staff = True
+        self.u2.save()
+
+        response = self._bulk_register(self.future_evt, client=self.u2_client, user_ids=self.user_ids)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,130 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+from django.utils.http import http_date
+from freezegun import freeze_time
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@override_settings(EVENTS={'LIST_VALIDATORS': True})
+class ConditionalGetEventsTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        u2_refresh = RefreshToken.for_user(self.u2)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+        self.u2_client = APIClient()
+        self.u2_client.credentials(HTTP_AUTHORIZATION=f'JWT {u2_refresh.access_token}')
+
+        self.e1 = baker.make(Event, title='e1', organizer=self.u1, timestamp=timezone.now() + timedelta(days=1))
+        self.e2 = baker.make(Event, title='e2', organizer=self.u2)
+
+    def _get(self, url: str, client: APIClient = None, **headers):
+        return (client or self.u1_client).get(url, format='json', **headers)
+
+    def test_list_not_modified(self):
+        response = self._get('/api/v1/events/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertIn('Last-Modified', response)
+
+        response = self._get('/api/v1/events/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_not_modified_since(self):
+        response = self._get('/api/v1/events/')
+
+        response = self._get('/api/v1/events/', HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_modified_since(self):
+        response = self._get('/api/v1/events/', HTTP_IF_MODIFIED_SINCE=http_date(0))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_etag_depends_on_query_and_user(self):
+        etag = self._get('/api/v1/events/')['ETag']
+
+        self.assertNotEqual(self._get('/api/v1/events/?page_size=1')['ETag'], etag)
+        self.assertNotEqual(self._get('/api/v1/events/', client=self.u2_client)['ETag'], etag)
+
+    def test_list_etag_changes_on_event_changes(self):
+        etags = {self._get('/api/v1/events/')['ETag']}
+
+        # The version of the lists moves once the changes are committed
+        with self.captureOnCommitCallbacks(execute=True):
+            self.e1.title = 'changed'
+            self.e1.save()
+        etags.add(self._get('/api/v1/events/')['ETag'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.e1.categories.add(baker.make(Category))
+        etags.add(self._get('/api/v1/events/')['ETag'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.u2_client.post(f'/api/v1/events/{self.e1.id}/register/', format='json')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        etags.add(self._get('/api/v1/events/')['ETag'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.e2.delete()
+        etags.add(self._get('/api/v1/events/')['ETag'])
+
+        self.assertEqual(len(etags), 5)
+
+    def test_time_relative_list_etag_changes_once_the_next_event_starts(self):
+        soon_evt = baker.make(Event, timestamp=timezone.now() + timedelta(minutes=1))
+        response = self._get('/api/v1/events/?only_future=true')
+        self.assertEqual(response.json()['count'], 2)
+        self.assertNotIn('Last-Modified', response)
+        etag = response['ETag']
+
+        response = self._get('/api/v1/events/?only_future=true', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # No change of the events, the list version stays the same
+        with freeze_time(soon_evt.timestamp + timedelta(seconds=1)):
+            response = self._get('/api/v1/events/?only_future=true', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 1)
+
+    @override_settings(EVENTS={})
+    def test_no_list_validators_with_a_process_local_cache(self):
+        response = self._get('/api/v1/events/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
+
+    def test_retrieve(self):
+        self.e1.attendees.add(self.u1)
+
+        response = self._get(f'/api/v1/events/{self.e1.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['id'], self.e1.id)
+        self.assertEqual(response.json()['attendees_count'], 1)
+        self.assertTrue(response.json()['is_registered'])
+
+    def test_retrieve_not_modified(self):
+        etag = self._get(f'/api/v1/events/{self.e1.id}/')['ETag']
+
+        response = self._get(f'/api/v1/events/{self.e1.id}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.e1.attendees.add(self.u2)
+        response = self._get(f'/api/v1/events/{self.e1.id}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,56 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+class ExportEventsTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+
+        timestamp = datetime(2050, 1, 1, 0, 0, 0).replace(tzinfo=timezone.utc)
+        c1 = baker.make(Category)
+        self.e1 = baker.make(Event, title='e1', organizer=self.u1, timestamp=timestamp, categories=[c1, ])
+        self.e2 = baker.make(Event, title='e2', organizer=self.u1, timestamp=timestamp, status=Event.Status.HIDDEN)
+
+    def _export(self, query: str = '') -> tuple:
+        response = self.u1_client.get(f'/api/v1/events/export/{query}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_user_can_export_csv(self):
+        response, content = self._export()
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual([row['title'] for row in rows], ['e1', 'e2'])
+        self.assertEqual(rows[0]['categories'], str(self.e1.categories.get().id))
+        self.assertEqual(rows[0]['timestamp'], '2050-01-01T00:00:00+00:00')
+
+    def test_user_can_export_filtered_ndjson(self):
+        response, content = self._export('?file_format=ndjson&status=HIDDEN')
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.e2.id])
+        self.assertEqual(rows[0]['categories'], [])
+
+    def test_export_invalid_format(self):
+        response = self.u1_client.get('/api/v1/events/export/?file_format=xml')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from freezegun import freeze_time
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@freeze_time('2024-03-16 00:00:00')
+class EventFacetsTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+
+        self.music, self.tech = baker.make(Category, _quantity=2)
+
+        def at(month: int, day: int) -> datetime:
+            return datetime(2024, month, day, 0, 0, 0).replace(tzinfo=timezone.utc)
+
+        self.e_past = baker.make(Event, organizer=self.u1, timestamp=at(3, 1))
+        self.e_week = baker.make(Event, organizer=self.u2, timestamp=at(3, 20))
+        self.e_month = baker.make(Event, organizer=self.u2, timestamp=at(4, 1), status=Event.Status.HIDDEN)
+        self.e_later = baker.make(Event, organizer=self.u1, timestamp=at(6, 1))
+
+        self.e_past.categories.add(self.music)
+        self.e_week.categories.add(self.music, self.tech)
+        self.e_later.categories.add(self.music)
+
+    def _facets(self, query: str = ''):
+        response = self.u1_client.get(f'/api/v1/events/facets/{query}', format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_facets(self):
+        # The requester user and the facets
+        with self.assertNumQueries(2):
+            response = self._facets()
+
+        self.assertEqual(response.json(), {
+            'count': 4,
+            'categories': [{'id': self.music.id, 'count': 3}, {'id': self.tech.id, 'count': 1}],
+            'status': [{'value': 'PUBLISHED', 'count': 3}, {'value': 'HIDDEN', 'count': 1}],
+            'timestamp': [
+                {'value': 'past', 'count': 1},
+                {'value': 'next_week', 'count': 1},
+                {'value': 'next_month', 'count': 1},
+                {'value': 'later', 'count': 1},
+            ],
+        })
+
+    def test_facets_under_filters(self):
+        data = self._facets(f'?categories={self.music.id}&only_future=true').json()
+
+        self.assertEqual(data['count'], 2)
+        # Categories of the filtered events, not only the filtered category
+        self.assertEqual(data['categories'], [{'id': self.music.id, 'count': 2}, {'id': self.tech.id, 'count': 1}])
+        self.assertEqual(data['status'], [{'value': 'PUBLISHED', 'count': 2}, {'value': 'HIDDEN', 'count': 0}])
+        self.assertEqual([bucket['count'] for bucket in data['timestamp']], [0, 1, 0, 1])
+
+        data = self._facets('?only_mine=true&status=PUBLISHED').json()
+        self.assertEqual(data['count'], 2)
+        self.assertEqual(data['categories'], [{'id': self.music.id, 'count': 2}])
+
+    def test_facets_under_multiple_categories(self):
+        query = f'?categories={self.music.id}&categories={self.tech.id}'
+        data = self._facets(query).json()
+
+        # The event in both categories is counted once, as in the list
+        list_count = self.u1_client.get(f'/api/v1/events/{query}', format='json').json()['count']
+        self.assertEqual(data['count'], list_count)
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(data['status'], [{'value': 'PUBLISHED', 'count': 3}, {'value': 'HIDDEN', 'count': 0}])
+        self.assertEqual([bucket['count'] for bucket in data['timestamp']], [1, 1, 0, 1])
+        self.assertEqual(data['categories'], [{'id': self.music.id, 'count': 3}, {'id': self.tech.id, 'count': 1}])
+
+    @override_settings(EVENTS={'LIST_CACHE_TIMEOUT': 30})
+    def test_facets_are_cached_as_the_list(self):
+        self.assertEqual(self._facets('?status=PUBLISHED')['X-Cache'], 'MISS')
+        with self.assertNumQueries(1):
+            self.assertEqual(self._facets('?status=PUBLISHED')['X-Cache'], 'HIT')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.e_month.categories.add(self.tech)
+
+        response = self._facets('?status=PUBLISHED')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        # Not shared with the list of the same query
+        list_response = self.u1_client.get('/api/v1/events/?status=PUBLISHED', format='json')
+        self.assertEqual(list_response['X-Cache'], 'MISS')
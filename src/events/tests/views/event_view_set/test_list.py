@@ -29,7 +29,7 @@ class ListEventsTests(APITestCase):
         c1 = baker.make(Category, id=1)
         baker.make(Category, id=2)
 
-        baker.make(Event, title='e1', organizer=self.u1, timestamp=t_future, categories=[c1, ])
+        self.e1 = baker.make(Event, title='e1', organizer=self.u1, timestamp=t_future, categories=[c1, ])
         baker.make(Event, title='e2', organizer=self.u1, timestamp=t_future)
         baker.make(Event, title='e3', organizer=self.u2, timestamp=t_past)
 
@@ -42,6 +42,32 @@ class ListEventsTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.json()['count'], 3)
 
+    def test_user_can_list_compact_events(self):
+        self.e1.attendees.add(self.u1, self.u2)
+
+        response = self.u1_client.get(
+            '/api/v1/events/?categories=1',
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.json()['results'][0]
+        self.assertNotIn('attendees', result)
+        self.assertEqual(result['attendees_count'], 2)
+        self.assertEqual(result['categories'], [1, ])
+        self.assertTrue(result['is_registered'])
+
+    def test_user_can_list_events_not_registered(self):
+        self.e1.attendees.add(self.u2)
+
+        response = self.u1_client.get(
+            '/api/v1/events/?categories=1',
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.json()['results'][0]['is_registered'])
+
     def test_user_can_list_filtering_by_categories(self):
         response = self.u1_client.get(
             '/api/v1/events/?categories=1&categories=2',
@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from freezegun import freeze_time
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.cache import get_list_cache_stats
+from events.models import Category, Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@freeze_time('2024-03-16 00:00:00')
+@override_settings(EVENTS={'LIST_CACHE_TIMEOUT': 30})
+class ListEventsCacheTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        u2_refresh = RefreshToken.for_user(self.u2)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+        self.u2_client = APIClient()
+        self.u2_client.credentials(HTTP_AUTHORIZATION=f'JWT {u2_refresh.access_token}')
+
+        t_future = datetime(2024, 3, 17, 0, 0, 0).replace(tzinfo=timezone.utc)
+        self.e1 = baker.make(Event, title='e1', organizer=self.u1, timestamp=t_future)
+        self.e2 = baker.make(Event, title='e2', organizer=self.u2, timestamp=t_future)
+
+    def _list(self, client: APIClient, query: str = ''):
+        response = client.get(f'/api/v1/events/{query}', format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_list_is_served_from_cache(self):
+        stats_before = get_list_cache_stats()
+
+        self.assertEqual(self._list(self.u1_client, '?status=PUBLISHED&page=1')['X-Cache'], 'MISS')
+        self.assertEqual(self._list(self.u1_client, '?page=1&status=PUBLISHED')['X-Cache'], 'HIT')
+
+        stats_after = get_list_cache_stats()
+        self.assertEqual(stats_after['hits'] - stats_before['hits'], 1)
+        self.assertEqual(stats_after['misses'] - stats_before['misses'], 1)
+
+    def test_cached_list_is_shared_with_user_dependent_registration(self):
+        self.e1.attendees.add(self.u2)
+
+        u1_response = self._list(self.u1_client)
+        u2_response = self._list(self.u2_client)
+
+        self.assertEqual(u2_response['X-Cache'], 'HIT')
+        self.assertEqual([r['is_registered'] for r in u1_response.json()['results']], [False, False])
+        self.assertEqual(
+            {r['id']: r['is_registered'] for r in u2_response.json()['results']},
+            {self.e1.id: True, self.e2.id: False},
+        )
+
+    def test_cached_list_is_not_shared_for_only_mine(self):
+        u1_response = self._list(self.u1_client, '?only_mine=true')
+        u2_response = self._list(self.u2_client, '?only_mine=true')
+
+        self.assertEqual(u2_response['X-Cache'], 'MISS')
+        self.assertEqual([r['id'] for r in u1_response.json()['results']], [self.e1.id, ])
+        self.assertEqual([r['id'] for r in u2_response.json()['results']], [self.e2.id, ])
+
+    def test_cache_is_invalidated_on_event_change(self):
+        self._list(self.u1_client)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.e1.title = 'changed'
+            self.e1.save()
+
+        response = self._list(self.u1_client)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn('changed', [r['title'] for r in response.json()['results']])
+
+    def test_cache_is_invalidated_on_categories_change(self):
+        self._list(self.u1_client)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.e1.categories.add(baker.make(Category))
+
+        self.assertEqual(self._list(self.u1_client)['X-Cache'], 'MISS')
+
+    def test_cache_is_invalidated_on_registration(self):
+        self._list(self.u1_client)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.u2_client.post(f'/api/v1/events/{self.e1.id}/register/', format='json')
+
+        response = self._list(self.u1_client)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual({r['id']: r['attendees_count'] for r in response.json()['results']}[self.e1.id], 1)
+
+    @override_settings(EVENTS={'LIST_CACHE_TIMEOUT': 0})
+    def test_cache_can_be_disabled(self):
+        self._list(self.u1_client)
+
+        self.assertNotIn('X-Cache', self._list(self.u1_client))
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+from django.contrib.auth.models import User
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+class ListEventsCursorTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+
+        self.t = datetime(2050, 1, 1, 0, 0, 0).replace(tzinfo=timezone.utc)
+        # Two events share each timestamp, so that ties are broken by id
+        self.events = [
+            baker.make(Event, title=f'e{i}', timestamp=self.t + timedelta(days=i // 2))
+            for i in range(5)
+        ]
+        self.expected_ids = [
+            e.id for e in sorted(self.events, key=lambda e: (e.timestamp, e.id), reverse=True)
+        ]
+
+    def _get_ids(self, url: str) -> tuple[list[int], dict]:
+        response = self.u1_client.get(url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [result['id'] for result in response.json()['results']], response.json()
+
+    def test_user_can_walk_all_pages_forward_and_backward(self):
+        ids_1, page_1 = self._get_ids('/api/v1/events/?pagination=cursor&page_size=2')
+        ids_2, page_2 = self._get_ids(page_1['next'])
+        ids_3, page_3 = self._get_ids(page_2['next'])
+
+        self.assertNotIn('count', page_1)
+        self.assertIsNone(page_1['previous'])
+        self.assertIsNone(page_3['next'])
+        self.assertEqual(ids_1 + ids_2 + ids_3, self.expected_ids)
+
+        previous_ids, previous_page = self._get_ids(page_3['previous'])
+        self.assertEqual(previous_ids, ids_2)
+        self.assertIsNotNone(previous_page['next'])
+
+        first_ids, first_page = self._get_ids(previous_page['previous'])
+        self.assertEqual(first_ids, ids_1)
+        self.assertIsNone(first_page['previous'])
+
+    def test_pages_are_stable_under_inserts(self):
+        ids_1, page_1 = self._get_ids('/api/v1/events/?pagination=cursor&page_size=2')
+
+        baker.make(Event, title='newest', timestamp=self.t + timedelta(days=10))
+
+        ids_2, _ = self._get_ids(page_1['next'])
+        self.assertEqual(ids_2, self.expected_ids[2:4])
+
+    def test_cursor_pagination_keeps_filters(self):
+        ids, page = self._get_ids('/api/v1/events/?pagination=cursor&page_size=1&timestamp=2050-01-01T00:00:00Z')
+        next_ids, next_page = self._get_ids(page['next'])
+
+        self.assertEqual(ids + next_ids, self.expected_ids[3:])
+        self.assertIsNone(next_page['next'])
+
+    def test_invalid_cursor(self):
+        response = self.u1_client.get('/api/v1/events/?pagination=cursor&cursor=foo', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.contrib.auth.models import User
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Category, Event
+
+# Authenticated user + count + page + categories prefetch + registration state
+LIST_QUERIES = 5
+# Registration state (authenticated user cached by a previous request, validators from the cache)
+CACHED_LIST_QUERIES = 1
+# None (authenticated user cached by a previous request, validators from the cache)
+NOT_MODIFIED_LIST_QUERIES = 0
+
+
+@pytest.fixture
+def u1_client() -> APIClient:
+    u1 = baker.make(User)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(u1).access_token}')
+    return client
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('events_count', [1, 10, 100])
+def test_list_query_count_does_not_depend_on_page_size(u1_client, django_assert_num_queries, events_count):
+    categories = baker.make(Category, _quantity=3)
+    users = baker.make(User, _quantity=3)
+    timestamp = datetime(2050, 1, 1, 0, 0, 0).replace(tzinfo=timezone.utc)
+    for event in baker.make(Event, timestamp=timestamp, _quantity=events_count):
+        event.categories.add(*categories)
+        event.attendees.add(*users)
+
+    with django_assert_num_queries(LIST_QUERIES):
+        response = u1_client.get(f'/api/v1/events/?page_size={events_count}', format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()['results']) == events_count
+    assert all(result['attendees_count'] == 3 for result in response.json()['results'])
+    assert all(len(result['categories']) == 3 for result in response.json()['results'])
+
+
+@pytest.mark.django_db
+def test_cached_list_query_count(u1_client, django_assert_num_queries, settings):
+    settings.EVENTS = {'LIST_CACHE_TIMEOUT': 30, 'AUTH_USER_CACHE_TIMEOUT': 30}
+    baker.make(Event, _quantity=10)
+    u1_client.get('/api/v1/events/', format='json')
+
+    with django_assert_num_queries(CACHED_LIST_QUERIES):
+        response = u1_client.get('/api/v1/events/', format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['X-Cache'] == 'HIT'
+    assert len(response.json()['results']) == 10
+
+
+@pytest.mark.django_db
+def test_cursor_list_query_count(u1_client, django_assert_num_queries):
+    baker.make(Event, _quantity=10)
+
+    # No total count in cursor mode
+    with django_assert_num_queries(LIST_QUERIES - 1):
+        response = u1_client.get('/api/v1/events/?pagination=cursor', format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'count' not in response.json()
+
+
+@pytest.mark.django_db
+def test_not_modified_list_query_count(u1_client, django_assert_num_queries, settings):
+    settings.EVENTS = {**settings.EVENTS, 'LIST_VALIDATORS': True}
+    baker.make(Event, _quantity=10)
+    etag = u1_client.get('/api/v1/events/', format='json')['ETag']
+
+    with django_assert_num_queries(NOT_MODIFIED_LIST_QUERIES):
+        response = u1_client.get('/api/v1/events/', format='json', HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_cached_user_list_query_count(u1_client, django_assert_num_queries):
+    baker.make(Event, _quantity=10)
+    u1_client.get('/api/v1/events/', format='json')
+
+    with django_assert_num_queries(LIST_QUERIES - 1):
+        response = u1_client.get('/api/v1/events/?page_size=5', format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_stateless_list_query_count(u1_client, django_assert_num_queries, settings):
+    settings.EVENTS = {**settings.EVENTS, 'AUTH_STATELESS_READS': True}
+    baker.make(Event, _quantity=10)
+
+    with django_assert_num_queries(LIST_QUERIES - 1):
+        response = u1_client.get('/api/v1/events/', format='json')
+
+    assert response.status_code == status.HTTP_200_OK
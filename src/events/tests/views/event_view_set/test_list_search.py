@@ -0,0 +1,53 @@
+from django.contrib.auth.models import User
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+class SearchEventsTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+
+        self.e1 = baker.make(Event, title='Jazz night', place='Athens', description='Live guitar music')
+        self.e2 = baker.make(Event, title='Guitar workshop', place='Patras', description='Bring your own')
+        self.e3 = baker.make(Event, title='Python meetup', place='Athens', description='Talks')
+
+    def _search(self, query: str) -> list[int]:
+        response = self.u1_client.get(f'/api/v1/events/?search={query}', format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [result['id'] for result in response.json()['results']]
+
+    def test_user_can_search_events_ranked(self):
+        self.assertEqual(self._search('guitar'), [self.e2.id, self.e1.id, ])
+
+    def test_user_can_search_events_by_prefix(self):
+        self.assertEqual(self._search('pyth'), [self.e3.id, ])
+
+    def test_user_can_search_events_with_all_terms(self):
+        self.assertEqual(self._search('athens jazz'), [self.e1.id, ])
+
+    def test_user_can_search_events_with_explicit_ordering(self):
+        response = self.u1_client.get('/api/v1/events/?search=guitar&ordering=id', format='json')
+
+        self.assertEqual([result['id'] for result in response.json()['results']], [self.e1.id, self.e2.id, ])
+
+    def test_search_index_follows_event_changes(self):
+        self.e3.title = 'Rust meetup'
+        self.e3.save()
+        self.e2.delete()
+
+        self.assertEqual(self._search('python'), [])
+        self.assertEqual(self._search('rust'), [self.e3.id, ])
+        self.assertEqual(self._search('guitar'), [self.e1.id, ])
+
+    def test_search_without_terms(self):
+        self.assertEqual(self._search('%2B%2B'), [])
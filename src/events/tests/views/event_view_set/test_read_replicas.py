@@ -0,0 +1,108 @@
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@override_settings(EVENTS={'READ_REPLICAS': ['replica'], 'REPLICA_STICKINESS': 5})
+class ReadReplicasTests(TransactionTestCase):
+    """
+    Runs on two distinct SQLite databases, so that the database serving each request shows in the data.
+    """
+
+    databases = {'default', 'replica'}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        connections.settings['replica'] = connections.configure_settings({
+            'default': connections.settings['default'],
+            'replica': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': Path(cls.tmp_dir.name) / 'replica.sqlite3'},
+        })['replica']
+        call_command('migrate', database='replica', verbosity=0)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+        cls.tmp_dir.cleanup()
+
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        User.objects.using('replica').create(pk=self.u1.pk, username='u1')
+
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(self.u1).access_token}')
+
+        # Same event on both databases, the replica lagging behind
+        timestamp = timezone.now() + timedelta(days=1)
+        self.event = baker.make(Event, title='up to date', organizer=self.u1, timestamp=timestamp)
+        baker.make(Event, pk=self.event.pk, title='stale', organizer=self.u1, timestamp=timestamp, _using='replica')
+
+    def _titles(self) -> list[str]:
+        response = self.client.get('/api/v1/events/', format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [event['title'] for event in response.json()['results']]
+
+    def test_safe_requests_read_replica(self):
+        self.assertEqual(self._titles(), ['stale'])
+
+        response = self.client.get(f'/api/v1/events/{self.event.pk}/', format='json')
+        self.assertEqual(response.json()['title'], 'stale')
+
+    def test_writes_go_to_primary_and_pin_reads(self):
+        response = self.client.post(f'/api/v1/events/{self.event.pk}/register/', format='json')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertTrue(self.event.attendees.filter(pk=self.u1.pk).exists())
+        self.assertFalse(Event.attendees.through.objects.using('replica').exists())
+
+        # Reading its own writes, until the stickiness window ends
+        self.assertEqual(self._titles(), ['up to date'])
+        cache.clear()
+        self.assertEqual(self._titles(), ['stale'])
+
+    @override_settings(EVENTS={'READ_REPLICAS': ['replica'], 'REPLICA_STICKINESS': 5, 'LIST_CACHE_TIMEOUT': 30})
+    def test_pinned_reads_skip_the_list_cache(self):
+        u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        User.objects.using('replica').create(pk=u2.pk, username='u2')
+        u2_client = APIClient()
+        u2_client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(u2).access_token}')
+
+        response = self.client.post(f'/api/v1/events/{self.event.pk}/register/', format='json')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        # Page of the lagging replica, cached under the version bumped by the write
+        response = u2_client.get('/api/v1/events/', format='json')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual([event['title'] for event in response.json()['results']], ['stale'])
+
+        response = self.client.get('/api/v1/events/', format='json')
+        self.assertNotIn('X-Cache', response)
+        self.assertEqual([event['title'] for event in response.json()['results']], ['up to date'])
+
+    def test_failed_writes_do_not_pin_reads(self):
+        response = self.client.post('/api/v1/events/0/register/', format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.assertEqual(self._titles(), ['stale'])
+
+    def test_reads_outside_requests_use_primary(self):
+        self.assertEqual(Event.objects.get(pk=self.event.pk).title, 'up to date')
@@ -37,6 +37,8 @@ class RegisterToEventTests(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.future_evt_2.refresh_from_db()
+        self.assertEqual(self.future_evt_2.attendees_count, 1)
 
     def test_user_can_register_to_event_that_organized(self):
         response = self.u1_client.post(
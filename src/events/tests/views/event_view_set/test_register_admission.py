@@ -0,0 +1,153 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+def _client(user: User) -> APIClient:
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(user).access_token}')
+    return client
+
+
+@override_settings(EVENTS={'REGISTRATION_STATE_CACHE_TIMEOUT': 30, 'AUTH_USER_CACHE_TIMEOUT': 30})
+class RegistrationFastRejectTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        self.u1_client = _client(self.u1)
+        self.u2_client = _client(self.u2)
+
+        t_future = timezone.now() + timedelta(days=1)
+        self.full_evt = baker.make(Event, organizer=self.u1, timestamp=t_future, capacity=1)
+        self.full_evt.attendees.add(self.u1)
+        self.past_evt = baker.make(Event, organizer=self.u1, timestamp=timezone.now() - timedelta(days=1))
+        self.hidden_evt = baker.make(Event, organizer=self.u1, timestamp=t_future, status=Event.Status.HIDDEN)
+
+        # Warming up the cached users
+        self.u1_client.get(f'/api/v1/events/{self.past_evt.id}/')
+        self.u2_client.get(f'/api/v1/events/{self.past_evt.id}/')
+
+    def _register(self, client: APIClient, event: Event, action: str = 'register'):
+        return client.post(f'/api/v1/events/{event.id}/{action}/', format='json')
+
+    def test_full_event_is_rejected_from_the_cache(self):
+        response = self._register(self.u2_client, self.full_evt)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'detail': 'EVENT_IS_FULL'})
+
+        # Registration state of the user only
+        with self.assertNumQueries(1):
+            response = self._register(self.u2_client, self.full_evt)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'detail': 'EVENT_IS_FULL'})
+
+    def test_registered_user_of_a_cached_full_event(self):
+        self._register(self.u2_client, self.full_evt)
+
+        with self.assertNumQueries(1):
+            response = self._register(self.u1_client, self.full_evt)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'detail': 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT'})
+
+    def test_past_and_hidden_events_are_rejected_from_the_cache(self):
+        for event, detail in (
+            (self.past_evt, 'ACTION_NOT_ALLOWED_ON_PAST_EVENT'),
+            (self.hidden_evt, 'ACTION_NOT_ALLOWED_ON_NON_PUBLISHED_EVENT'),
+        ):
+            for action in ('register', 'un-register'):
+                with self.subTest(event=event.title, action=action):
+                    self._register(self.u2_client, event, action)
+
+                    with self.assertNumQueries(0):
+                        response = self._register(self.u2_client, event, action)
+
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                    self.assertEqual(response.json(), {'detail': detail})
+
+    def test_un_registration_frees_the_cached_full_event(self):
+        self._register(self.u2_client, self.full_evt)
+
+        # Un-registering from a full event is not rejected
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self._register(self.u1_client, self.full_evt, 'un-register')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = self._register(self.u2_client, self.full_evt)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_event_update_drops_the_cached_state(self):
+        self._register(self.u2_client, self.hidden_evt)
+
+        self.hidden_evt.status = Event.Status.PUBLISHED
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hidden_evt.save()
+
+        response = self._register(self.u2_client, self.hidden_evt)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    @override_settings(EVENTS={'REGISTRATION_STATE_CACHE_TIMEOUT': 0})
+    def test_disabled(self):
+        self._register(self.u2_client, self.full_evt)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._register(self.u2_client, self.full_evt)
+
+        self.assertEqual(response.json(), {'detail': 'EVENT_IS_FULL'})
+        self.assertTrue(any('UPDATE' in query['sql'] for query in queries))
+
+
+@override_settings(REST_FRAMEWORK={
+    'DEFAULT_AUTHENTICATION_CLASSES': ('events.authentication.CachedJWTAuthentication', ),
+    'DEFAULT_THROTTLE_RATES': {'registration_user': '2/min', 'registration_event': '3/min'},
+})
+class RegistrationThrottlingTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        self.u1_client = _client(self.u1)
+        self.u2_client = _client(self.u2)
+
+        t_future = timezone.now() + timedelta(days=1)
+        self.e1 = baker.make(Event, timestamp=t_future)
+        self.e2 = baker.make(Event, timestamp=t_future)
+
+    def test_user_rate(self):
+        self.assertEqual(self.u1_client.post(f'/api/v1/events/{self.e1.id}/register/').status_code, 204)
+        self.assertEqual(self.u1_client.post(f'/api/v1/events/{self.e1.id}/un-register/').status_code, 204)
+
+        response = self.u1_client.post(f'/api/v1/events/{self.e2.id}/register/')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+        # Other users are not limited
+        self.assertEqual(self.u2_client.post(f'/api/v1/events/{self.e2.id}/register/').status_code, 204)
+
+    def test_event_rate(self):
+        self.u1_client.post(f'/api/v1/events/{self.e1.id}/register/')
+        self.u1_client.post(f'/api/v1/events/{self.e1.id}/un-register/')
+        self.assertEqual(self.u2_client.post(f'/api/v1/events/{self.e1.id}/register/').status_code, 204)
+
+        response = self.u2_client.post(f'/api/v1/events/{self.e1.id}/un-register/')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        # Other events are not limited (for users within their own limit)
+        u3_client = _client(User.objects.create_user(username='u3', password=TEST_USER_PASS))
+        self.assertEqual(u3_client.post(f'/api/v1/events/{self.e2.id}/register/').status_code, 204)
+
+    def test_other_actions_are_not_limited(self):
+        for _ in range(5):
+            self.assertEqual(self.u1_client.get(f'/api/v1/events/{self.e1.id}/').status_code, 200)
@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+THREADS = 200
+CAPACITY = 50
+MAX_ATTEMPTS = 100
+
+
+class ConcurrentRegisterToEventTests(TransactionTestCase):
+    def setUp(self) -> None:
+        self.users = User.objects.bulk_create(User(username=f'u{i}') for i in range(THREADS))
+        self.event = baker.make(Event, timestamp=timezone.now() + timedelta(days=1), capacity=CAPACITY)
+
+    def _register(self, user: User) -> str:
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(user).access_token}')
+
+        try:
+            for _ in range(MAX_ATTEMPTS):
+                try:
+                    response = client.post(f'/api/v1/events/{self.event.id}/register/', format='json')
+                except OperationalError:
+                    # SQLite (file-based test database) raises "database is locked" once its busy timeout expires
+                    continue
+                if response.status_code == 204:
+                    return 'REGISTERED'
+                return response.json()['detail']
+            return 'GAVE_UP'
+        finally:
+            connection.close()
+
+    def test_concurrent_registrations_never_exceed_capacity(self):
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            outcomes = list(executor.map(self._register, self.users))
+
+        self.event.refresh_from_db()
+        self.assertEqual(outcomes.count('REGISTERED'), CAPACITY)
+        self.assertEqual(outcomes.count('EVENT_IS_FULL'), THREADS - CAPACITY)
+        self.assertEqual(self.event.attendees_count, CAPACITY)
+        self.assertEqual(self.event.attendees.count(), CAPACITY)
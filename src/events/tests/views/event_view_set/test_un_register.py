@@ -38,6 +38,8 @@ class UnRegisterFromEventTests(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.future_evt.refresh_from_db()
+        self.assertEqual(self.future_evt.attendees_count, 0)
 
     def test_user_cannot_unregister_from_past_event(self):
         self.future_evt.attendees.add(self.u1)
@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from freezegun import freeze_time
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+@freeze_time('2024-03-16 00:00:00')
+class EventWaitlistTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        u1_refresh = RefreshToken.for_user(self.u1)
+
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+        u2_refresh = RefreshToken.for_user(self.u2)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {u1_refresh.access_token}')
+        self.u2_client = APIClient()
+        self.u2_client.credentials(HTTP_AUTHORIZATION=f'JWT {u2_refresh.access_token}')
+
+        t_past = datetime(2024, 3, 15, 0, 0, 0).replace(tzinfo=timezone.utc)
+        t_future = datetime(2024, 3, 17, 0, 0, 0).replace(tzinfo=timezone.utc)
+
+        self.past_evt = baker.make(Event, title='e1', organizer=self.u1, timestamp=t_past, capacity=1)
+        self.full_evt = baker.make(Event, title='e2', organizer=self.u1, timestamp=t_future, capacity=1)
+        self.full_evt.attendees.add(self.u2)
+
+    def test_user_can_join_waitlist_of_full_event(self):
+        response = self.u1_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json(), {'position': 1})
+
+        response = self.u1_client.get(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+        self.assertEqual(response.json(), {'position': 1})
+
+    def test_user_is_registered_when_event_is_not_full(self):
+        self.full_evt.attendees.clear()
+
+        response = self.u1_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(self.full_evt.attendees.filter(pk=self.u1.pk).exists())
+
+    def test_user_cannot_join_waitlist_twice(self):
+        self.u1_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        response = self.u1_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'WAS_ALREADY_IN_WAITLIST_OF_THIS_EVENT')
+
+    def test_registered_user_cannot_join_waitlist(self):
+        response = self.u2_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT')
+
+    def test_user_cannot_join_waitlist_of_past_event(self):
+        response = self.u1_client.post(f'/api/v1/events/{self.past_evt.id}/waitlist/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'ACTION_NOT_ALLOWED_ON_PAST_EVENT')
+
+    def test_user_can_leave_waitlist(self):
+        self.u1_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        response = self.u1_client.delete(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        response = self.u1_client.get(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+        self.assertEqual(response.json(), {'position': None})
+
+    def test_user_cannot_leave_waitlist_never_joined(self):
+        response = self.u1_client.delete(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['detail'], 'WAS_NOT_IN_WAITLIST_OF_THIS_EVENT')
+
+    def test_un_register_promotes_waiting_user(self):
+        self.u1_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        response = self.u2_client.post(f'/api/v1/events/{self.full_evt.id}/un-register/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(list(self.full_evt.attendees.all()), [self.u1, ])
+        self.assertEqual(self.full_evt.waitlist_entries.count(), 0)
+
+    def test_capacity_increase_promotes_waiting_user(self):
+        self.u1_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        response = self.u1_client.put(
+            f'/api/v1/events/{self.full_evt.id}/',
+            format='json',
+            data={
+                'title': 'e2',
+                'place': 'any place',
+                'timestamp': '2024-03-17T00:00:00Z',
+                'capacity': 2,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(self.full_evt.attendees.filter(pk=self.u1.pk).exists())
+
+    def test_capacity_increase_of_hidden_event_does_not_promote(self):
+        self.u1_client.post(f'/api/v1/events/{self.full_evt.id}/waitlist/', format='json')
+
+        response = self.u1_client.put(
+            f'/api/v1/events/{self.full_evt.id}/',
+            format='json',
+            data={
+                'title': 'e2',
+                'place': 'any place',
+                'timestamp': '2024-03-17T00:00:00Z',
+                'capacity': 2,
+                'status': Event.Status.HIDDEN,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(self.full_evt.attendees.filter(pk=self.u1.pk).exists())
+        self.assertEqual(self.full_evt.waitlist_entries.count(), 1)
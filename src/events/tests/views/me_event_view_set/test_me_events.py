@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from events.models import Event
+
+TEST_USER_PASS = 'test-12345'
+
+
+class MeEventsTests(APITestCase):
+    def setUp(self) -> None:
+        self.u1 = User.objects.create_user(username='u1', password=TEST_USER_PASS)
+        self.u2 = User.objects.create_user(username='u2', password=TEST_USER_PASS)
+
+        self.u1_client = APIClient()
+        self.u1_client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(self.u1).access_token}')
+
+        now = timezone.now()
+        self.organized = [
+            baker.make(Event, title=f'o{i}', organizer=self.u1, timestamp=now + timedelta(days=i))
+            for i in range(3)
+        ]
+        self.attending = [
+            baker.make(Event, title=f'a{i}', organizer=self.u2, timestamp=now + timedelta(days=i))
+            for i in range(3)
+        ]
+        for event in self.attending:
+            event.attendees.add(self.u1)
+        # Neither organized nor attended by u1
+        baker.make(Event, organizer=self.u2).attendees.add(self.u2)
+
+    def _ids(self, url: str) -> list[int]:
+        response = self.u1_client.get(url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [event['id'] for event in response.json()['results']]
+
+    def test_organized(self):
+        self.assertEqual(
+            self._ids('/api/v1/me/events/organized/'),
+            [event.pk for event in reversed(self.organized)],
+        )
+
+    def test_attending(self):
+        self.assertEqual(
+            self._ids('/api/v1/me/events/attending/'),
+            [event.pk for event in reversed(self.attending)],
+        )
+
+    def test_compact_representation(self):
+        response = self.u1_client.get('/api/v1/me/events/attending/?page_size=1', format='json')
+
+        self.assertEqual(
+            set(response.json()['results'][0]),
+            {'id', 'title', 'status', 'place', 'timestamp', 'capacity', 'attendees_count'},
+        )
+
+    def test_cursor_pagination(self):
+        response = self.u1_client.get('/api/v1/me/events/organized/?page_size=2', format='json')
+        self.assertEqual(len(response.json()['results']), 2)
+        self.assertIsNone(response.json()['previous'])
+
+        response = self.u1_client.get(response.json()['next'], format='json')
+        self.assertEqual([event['id'] for event in response.json()['results']], [self.organized[0].pk])
+        self.assertIsNone(response.json()['next'])
+
+    def test_requires_authentication(self):
+        response = self.client.get('/api/v1/me/events/organized/', format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(EVENTS={'LIST_CACHE_TIMEOUT': 30})
+    def test_cache_is_per_user_and_invalidated(self):
+        response = self.u1_client.get('/api/v1/me/events/attending/', format='json')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        response = self.u1_client.get('/api/v1/me/events/attending/', format='json')
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+        u2_client = APIClient()
+        u2_client.credentials(HTTP_AUTHORIZATION=f'JWT {RefreshToken.for_user(self.u2).access_token}')
+        response = u2_client.get('/api/v1/me/events/attending/', format='json')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.json()['results']), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.organized[0].attendees.add(self.u1)
+        self.assertEqual(len(self._ids('/api/v1/me/events/attending/')), 4)
@@ -0,0 +1,84 @@
+import math
+import time
+
+from django.core.cache import cache as default_cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token bucket throttle, stored in Django's cache (shared by the server processes),
+    with the rate of its scope in `REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']` (e.g. `10/min`):
+    the bucket holds up to `num` tokens (the allowed burst) and refills at `num` per period.
+    Disabled when its scope has no rate.
+    Reads and writes of the bucket are not atomic: concurrent requests may overdraw it slightly.
+    """
+
+    scope = None
+    cache = default_cache
+    cache_format = 'events:throttle:{scope}:{ident}'
+
+    def __init__(self):
+        # Read per instance (not per class as DRF's throttles), so that settings overrides apply
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        self.capacity, self.period = self.parse_rate(rate) if rate else (None, None)
+        self.wait_seconds = None
+
+    @staticmethod
+    def parse_rate(rate: str) -> tuple[int, int]:
+        num, period = rate.split('/')
+        return int(num), PERIODS[period[0]]
+
+    def timer(self) -> float:
+        return time.time()
+
+    def get_ident_key(self, request, view) -> str | None:
+        raise NotImplementedError
+
+    def allow_request(self, request, view) -> bool:
+        if self.capacity is None:
+            return True
+
+        ident = self.get_ident_key(request, view)
+        if ident is None:
+            return True
+
+        key = self.cache_format.format(scope=self.scope, ident=ident)
+        now = self.timer()
+        tokens, updated_at = self.cache.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.capacity / self.period)
+        if tokens < 1:
+            self.wait_seconds = (1 - tokens) * self.period / self.capacity
+            return False
+
+        # An untouched bucket is full again after a period, so it can expire by then
+        self.cache.set(key, (tokens - 1, now), math.ceil(self.period))
+        return True
+
+    def wait(self) -> float | None:
+        return self.wait_seconds
+
+
+class RegistrationUserThrottle(TokenBucketThrottle):
+    """
+    Limits the (un-)registrations of each user, whatever the event.
+    """
+
+    scope = 'registration_user'
+
+    def get_ident_key(self, request, view) -> str | None:
+        return str(request.user.pk) if request.user and request.user.is_authenticated else None
+
+
+class RegistrationEventThrottle(TokenBucketThrottle):
+    """
+    Limits the (un-)registrations to each event, whatever the user, shedding the load of registration storms.
+    """
+
+    scope = 'registration_event'
+
+    def get_ident_key(self, request, view) -> str | None:
+        return view.kwargs.get(view.lookup_url_kwarg or view.lookup_field)
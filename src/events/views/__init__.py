@@ -1 +1,10 @@
+from events.views.async_event_views import (
+    AsyncEventDetailView,
+    AsyncEventListView,
+    AsyncEventRegisterView,
+    AsyncEventSeatsView,
+)
+from events.views.calendar_views import CategoryCalendarFeedView, EventsCalendarFeedView
 from events.views.event_view_set import EventViewSet
+from events.views.me_event_view_set import MeEventViewSet
+from events.views.metrics_view import MetricsView
@@ -0,0 +1,332 @@
+import asyncio
+import json
+import math
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AbstractBaseUser
+from django.db.models import QuerySet
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, NotAuthenticated, NotFound, Throttled, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from events.admission import set_registration_state
+from events.authentication import CachedJWTAuthentication, StatelessJWTAuthentication
+from events.broker import Subscription, get_broker
+from events.conf import get_setting
+from events.models import Event
+from events.replicas import pin_to_primary
+from events.seats import SEATS_FIELDS, get_seats
+from events.serializers import EventAsyncListSerializer
+from events.views.conditional import (
+    aget_list_validators,
+    get_event_validators,
+    get_not_modified_response,
+    set_validators,
+)
+from events.views.event_view_set import (
+    REGISTRATION_THROTTLE_CLASSES,
+    EventResultsPagination,
+    EventViewSet,
+    _fast_reject_registration,
+    _validate_registration,
+)
+
+
+async def _aauthenticate(request: Request) -> AbstractBaseUser:
+    """
+    Resolves the requester user from the JWT authorization header.
+    Decoding the token is CPU only, the user lookup is the single (thread offloaded) query,
+    skipped for reads when `EVENTS['AUTH_STATELESS_READS']` is on.
+    """
+
+    if request.method == 'GET' and get_setting('AUTH_STATELESS_READS'):
+        authentication = StatelessJWTAuthentication()
+    else:
+        authentication = CachedJWTAuthentication()
+    header = authentication.get_header(request)
+    raw_token = header and authentication.get_raw_token(header)
+    if raw_token is None:
+        raise NotAuthenticated()
+
+    validated_token = authentication.get_validated_token(raw_token)
+    return await sync_to_async(authentication.get_user)(validated_token)
+
+
+def _get_queryset(request: Request, action: str, archive_lookup: bool = False) -> QuerySet[Event]:
+    """
+    Returns the queryset of the equivalent `EventViewSet` action, filters included,
+    so that both flavours of the API answer the same query params the same way
+    (reading the archived events with `archive_lookup`, as the fallback of the detail lookups).
+    Has to run in a thread, since validating the filters may query the database.
+    """
+
+    view = EventViewSet(
+        request=request, action=action, format_kwarg=None, args=(), kwargs={}, archive_lookup=archive_lookup,
+    )
+    return view.filter_queryset(view.get_queryset()).prefetch_related(None)
+
+
+async def _aset_category_ids(events: list[Event], model=Event) -> None:
+    """
+    Sets the categories ids of the given events (of the events or archive table), with a single query.
+    """
+
+    # Values are fetched at once (bounded by the page size), as `aiterator()` is limited to models in Django 4.2
+    category_ids = defaultdict(list)
+    event_field = model.categories.field.m2m_field_name()
+    through_rows = model.categories.through.objects.filter(
+        **{f'{event_field}_id__in': [event.pk for event in events]},
+    ).order_by('-category_id').values_list(f'{event_field}_id', 'category_id')
+    async for event_id, category_id in through_rows:
+        category_ids[event_id].append(category_id)
+
+    for event in events:
+        event.category_ids = category_ids[event.pk]
+
+
+async def _aset_is_registered(results: list[dict], user, model=Event) -> None:
+    """
+    Async version of the `EventViewSet` helper, setting the `is_registered` flag
+    of serialized events (of the events or archive table) for the given user with a single query.
+    """
+
+    if not results:
+        return
+
+    event_field = model.attendees.field.m2m_field_name()
+    registered_event_ids = {
+        event_id
+        async for event_id in model.attendees.through.objects.filter(
+            user_id=user.pk,
+            **{f'{event_field}_id__in': [result['id'] for result in results]},
+        ).values_list(f'{event_field}_id', flat=True)
+    }
+    for result in results:
+        result['is_registered'] = result['id'] in registered_event_ids
+
+
+async def _aget_event(request: Request, pk) -> Event:
+    """
+    Looks up the event as `EventViewSet.get_object` does,
+    falling back to the archived event when archiving is enabled.
+    """
+
+    queryset = await sync_to_async(_get_queryset)(request, 'retrieve')
+    try:
+        return await queryset.aget(pk=pk)
+    except Event.DoesNotExist:
+        if get_setting('ARCHIVE_AFTER_DAYS') is None:
+            raise NotFound('No Event matches the given query.')
+
+    queryset = await sync_to_async(_get_queryset)(request, 'retrieve', archive_lookup=True)
+    try:
+        return await queryset.aget(pk=pk)
+    except queryset.model.DoesNotExist:
+        raise NotFound('No Event matches the given query.')
+
+
+class AsyncEventView(View):
+    """
+    Base view for the async (ASGI native) flavour of the events API.
+    Mirrors the DRF stack of `EventViewSet` (JWT authentication, authenticated users only,
+    DRF errors and JSON rendering) without leaving the event loop but for the database queries.
+    """
+
+    renderer = JSONRenderer()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Authentication is token based only, as for the DRF views
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = Request(request)
+        try:
+            request.user = await _aauthenticate(request)
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            return self.handle_exception(request, exc)
+
+    def handle_exception(self, request: Request, exc: APIException) -> HttpResponse:
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        response = self.render(data, status=exc.status_code)
+        if exc.status_code == 401:
+            response['WWW-Authenticate'] = CachedJWTAuthentication().authenticate_header(request)
+        if getattr(exc, 'wait', None):
+            response['Retry-After'] = str(math.ceil(exc.wait))
+        return response
+
+    def render(self, data, status: int = 200) -> HttpResponse:
+        return HttpResponse(self.renderer.render(data), content_type='application/json', status=status)
+
+
+class AsyncEventListView(AsyncEventView):
+    """
+    Async version of the events list (`EventViewSet.list`),
+    with page number pagination and conditional requests (no response caching).
+    """
+
+    pagination_class = EventResultsPagination
+
+    async def get(self, request: Request):
+        validators = await aget_list_validators(request)
+        not_modified_response = get_not_modified_response(request, validators)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        queryset = await sync_to_async(_get_queryset)(request, 'list')
+
+        paginator = self.pagination_class()
+        page_size = paginator.get_page_size(request)
+        try:
+            page_number = int(request.query_params.get(paginator.page_query_param, 1))
+        except ValueError:
+            page_number = 0
+
+        count = await queryset.acount()
+        if not 1 <= page_number <= max(math.ceil(count / page_size), 1):
+            raise NotFound(paginator.invalid_page_message)
+
+        offset = (page_number - 1) * page_size
+        events = [event async for event in queryset[offset:offset + page_size].aiterator()]
+        await _aset_category_ids(events, queryset.model)
+
+        results = EventAsyncListSerializer(events, many=True).data
+        await _aset_is_registered(results, request.user, queryset.model)
+
+        url = request.build_absolute_uri()
+        response = self.render({
+            'count': count,
+            'next': (
+                replace_query_param(url, paginator.page_query_param, page_number + 1)
+                if offset + page_size < count else None
+            ),
+            'previous': (
+                None if page_number == 1
+                else remove_query_param(url, paginator.page_query_param) if page_number == 2
+                else replace_query_param(url, paginator.page_query_param, page_number - 1)
+            ),
+            'results': results,
+        })
+        return set_validators(response, validators)
+
+
+class AsyncEventDetailView(AsyncEventView):
+    """
+    Async version of the event detail (`EventViewSet.retrieve`), with conditional requests.
+    """
+
+    async def get(self, request: Request, pk):
+        event = await _aget_event(request, pk)
+
+        validators = get_event_validators(request, event)
+        not_modified_response = get_not_modified_response(request, validators)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        await _aset_category_ids([event, ], type(event))
+        data = EventAsyncListSerializer(event).data
+        await _aset_is_registered([data, ], request.user, type(event))
+        return set_validators(self.render(data), validators)
+
+
+class AsyncEventRegisterView(AsyncEventView):
+    """
+    Async version of the event registration (`EventViewSet.register`), with the same admission control
+    (rate limits and cached rejections). The registration itself runs in a thread,
+    as transactions are not available from async code.
+    """
+
+    throttle_classes = REGISTRATION_THROTTLE_CLASSES
+    # For `RegistrationEventThrottle`, as on the DRF views
+    lookup_field = 'pk'
+    lookup_url_kwarg = None
+
+    def check_throttles(self, request: Request) -> None:
+        """
+        Raises `Throttled` when any of the throttles denies the request, as DRF views do.
+        """
+
+        wait_times = [
+            throttle.wait()
+            for throttle in (throttle_class() for throttle_class in self.throttle_classes)
+            if not throttle.allow_request(request, self)
+        ]
+        if wait_times:
+            raise Throttled(max((wait for wait in wait_times if wait is not None), default=None))
+
+    async def post(self, request: Request, pk):
+        await sync_to_async(self.check_throttles)(request)
+        await sync_to_async(_fast_reject_registration)(pk, request.user, registering=True)
+
+        event = await _aget_event(request, pk)
+
+        await sync_to_async(_validate_registration)(event)
+
+        try:
+            await sync_to_async(event.register_attendee)(request.user)
+        except Event.AlreadyRegistered:
+            raise ValidationError({'detail': 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT'})
+        except Event.IsFull:
+            await sync_to_async(set_registration_state)(event, is_full=True)
+            raise ValidationError({'detail': 'EVENT_IS_FULL'})
+
+        await sync_to_async(pin_to_primary)(request.user)
+        return HttpResponse(status=204)
+
+
+class AsyncEventSeatsView(AsyncEventView):
+    """
+    Server-sent events stream of the seats availability of the events requested by ids
+    (`ids=1,2,3`): the current state of each event first, then every change,
+    as fanned out by the configured broker (see `events.seats.publish_seats`).
+    Streams end after `max_lifetime` seconds, the clients reconnecting after `retry_interval` milliseconds
+    (as Django does not notice the disconnected clients while streaming, this bounds their subscriptions).
+    """
+
+    max_events = 100
+    heartbeat_interval = 15
+    max_lifetime = 300
+    retry_interval = 1000
+
+    async def get(self, request: Request):
+        try:
+            event_ids = {int(event_id) for event_id in request.query_params.get('ids', '').split(',')}
+        except ValueError:
+            raise ValidationError({'detail': 'INVALID_EVENT_IDS'})
+        if len(event_ids) > self.max_events:
+            raise ValidationError({'detail': 'TOO_MANY_EVENTS'})
+
+        # Subscribing before reading the current state, so that no change is missed in between
+        subscription = get_broker().subscribe()
+        response = StreamingHttpResponse(self.stream(subscription, event_ids), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def stream(self, subscription: Subscription, event_ids: set[int]):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_lifetime
+        try:
+            yield f'retry: {self.retry_interval}\n\n'
+            async for values in Event.objects.filter(pk__in=event_ids).values(*SEATS_FIELDS):
+                yield self.format_message(get_seats(values))
+
+            while (remaining := deadline - loop.time()) > 0:
+                message = await subscription.get(timeout=min(self.heartbeat_interval, remaining))
+                if message is None:
+                    yield ': keep-alive\n\n'
+                elif message['id'] in event_ids:
+                    yield self.format_message(message)
+        finally:
+            subscription.close()
+
+    @staticmethod
+    def format_message(seats: dict) -> str:
+        return f'event: seats\ndata: {json.dumps(seats)}\n\n'
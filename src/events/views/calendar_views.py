@@ -0,0 +1,179 @@
+import hashlib
+from datetime import timedelta
+from typing import Iterator
+
+from django.core import signing
+from django.core.cache import cache
+from django.db.models import Count, F, Max, QuerySet
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, quote_etag
+from django.views import View
+
+from events.bulk import ICAL_CONTENT_TYPE, export_calendar
+from events.conf import get_setting
+from events.models import CalendarToken, Category, Event
+from events.views.conditional import Validators, get_not_modified_response, set_validators
+
+CALENDAR_CACHE_KEY = 'events:calendar:{feed}:{state}'
+
+_signer = signing.Signer(salt='events.calendar')
+
+
+def get_calendar_url(request, user, category: Category = None) -> str:
+    """
+    Returns the (absolute) URL of the calendar feed of the user, or of the category,
+    authenticated by a signed token of the user (with the current version of its tokens),
+    since calendar apps cannot send JWT headers.
+    """
+
+    calendar_token, _ = CalendarToken.objects.get_or_create(user=user)
+    token = _signer.sign(f'{user.pk}:{calendar_token.version}')
+    if category is None:
+        return request.build_absolute_uri(reverse('calendar-events', args=[token]))
+    return request.build_absolute_uri(reverse('calendar-category', args=[token, category.pk]))
+
+
+def rotate_calendar_token(user) -> None:
+    """
+    Moves to a new version of the calendar feed tokens of the user, revoking the URLs handed out so far.
+    """
+
+    CalendarToken.objects.get_or_create(user=user)
+    CalendarToken.objects.filter(user=user).update(version=F('version') + 1)
+
+
+def _get_token_user_id(token: str) -> int:
+    """
+    Returns the id of the user of a calendar feed token, raising `Http404` when the token is invalid,
+    revoked (older version) or its user is inactive.
+    """
+
+    try:
+        user_id, version = (int(value) for value in _signer.unsign(token).split(':'))
+    except (signing.BadSignature, ValueError):
+        raise Http404()
+
+    if not CalendarToken.objects.filter(user_id=user_id, version=version, user__is_active=True).exists():
+        raise Http404()
+    return user_id
+
+
+def _stream_and_cache(chunks: Iterator[str], cache_key: str, cache_timeout: int) -> Iterator[str]:
+    """
+    Yields the chunks, caching the whole content once streamed.
+    """
+
+    content = []
+    for chunk in chunks:
+        content.append(chunk)
+        yield chunk
+    cache.set(cache_key, ''.join(content), cache_timeout)
+
+
+class CalendarFeedView(View):
+    """
+    Base view of the iCalendar feeds of events (polled by calendar apps), from `past_days` ago on.
+    Answers conditional requests with `304 Not Modified`, then serves the feed from the cache
+    (keyed by the feed and the state of its events, so it never goes stale) or streams it from the database.
+    """
+
+    past_days = 30
+    # Last change of the events, as far as the feed is concerned
+    last_modified_field = 'details_updated_at'
+
+    def get_queryset(self, user_id: int, **kwargs) -> QuerySet[Event]:
+        raise NotImplementedError
+
+    def get_feed_key(self, user_id: int, **kwargs) -> str:
+        """
+        Returns the cache key fragment identifying the content of the feed.
+        """
+
+        raise NotImplementedError
+
+    def get_name(self) -> str:
+        raise NotImplementedError
+
+    def get(self, request, token: str, **kwargs):
+        user_id = _get_token_user_id(token)
+        queryset = self.get_queryset(user_id, **kwargs).filter(
+            timestamp__gte=timezone.now() - timedelta(days=self.past_days),
+        )
+
+        state = queryset.order_by().aggregate(last_modified=Max(self.last_modified_field), count=Count('pk'))
+        validators = self.get_validators(request, state)
+        not_modified_response = get_not_modified_response(request, validators)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        cache_timeout = get_setting('CALENDAR_CACHE_TIMEOUT')
+        cache_key = CALENDAR_CACHE_KEY.format(
+            feed=self.get_feed_key(user_id, **kwargs),
+            state=self._get_fingerprint(request.get_host(), state['last_modified'], state['count']),
+        )
+        content = cache.get(cache_key) if cache_timeout else None
+        if content is not None:
+            response = HttpResponse(content, content_type=ICAL_CONTENT_TYPE)
+        else:
+            chunks = export_calendar(queryset, self.get_name(), request.get_host())
+            if cache_timeout:
+                chunks = _stream_and_cache(chunks, cache_key, cache_timeout)
+            response = StreamingHttpResponse(chunks, content_type=ICAL_CONTENT_TYPE)
+
+        response['Content-Disposition'] = 'inline; filename="events.ics"'
+        patch_cache_control(response, private=True, no_cache=True)
+        return set_validators(response, validators)
+
+    @staticmethod
+    def _get_fingerprint(*fragments) -> str:
+        return hashlib.sha256('|'.join(str(fragment) for fragment in fragments).encode()).hexdigest()
+
+    def get_validators(self, request, state: dict) -> Validators:
+        """
+        Returns the ETag and last modification time of the feed, from the state of its events
+        (last modification and count). The host and path identify the feed (its token and category).
+        """
+
+        last_modified = state['last_modified']
+        fingerprint = self._get_fingerprint(
+            request.get_host(), request.path, last_modified and last_modified.isoformat(), state['count'],
+        )
+        return quote_etag(fingerprint), last_modified
+
+
+class EventsCalendarFeedView(CalendarFeedView):
+    """
+    iCalendar feed of the events the user is registered to.
+    """
+
+    # Registrations change the events of the feed, only touching `updated_at`
+    last_modified_field = 'updated_at'
+
+    def get_queryset(self, user_id: int, **kwargs) -> QuerySet[Event]:
+        return Event.objects.filter(attendees=user_id)
+
+    def get_feed_key(self, user_id: int, **kwargs) -> str:
+        return f'user:{user_id}'
+
+    def get_name(self) -> str:
+        return 'My events'
+
+
+class CategoryCalendarFeedView(CalendarFeedView):
+    """
+    iCalendar feed of the published events of a category.
+    """
+
+    def get_queryset(self, user_id: int, **kwargs) -> QuerySet[Event]:
+        self.category = get_object_or_404(Category, pk=kwargs['pk'])
+        return Event.objects.filter(categories=self.category, status=Event.Status.PUBLISHED)
+
+    def get_feed_key(self, user_id: int, **kwargs) -> str:
+        # Same content for every user
+        return f'category:{kwargs["pk"]}'
+
+    def get_name(self) -> str:
+        return self.category.name
@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponseBase
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from events.cache import get_list_last_modified, get_list_version, get_request_fingerprint
+from events.conf import get_setting
+from events.models import Event
+
+Validators = tuple[str, Optional[datetime]]
+
+# Query params whose result depends on the current time
+TIME_RELATIVE_PARAMS = (
+    'only_future',
+    'only_past',
+)
+
+
+def list_validators_enabled() -> bool:
+    """
+    Whether list responses carry validators, derived from the version of the events lists:
+    the version has to be shared by all the workers, not kept in a process local cache.
+    """
+
+    enabled = get_setting('LIST_VALIDATORS')
+    if enabled is None:
+        return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+    return enabled
+
+
+def get_list_validators(request) -> Optional[Validators]:
+    """
+    Returns the (strong) ETag and last modification time of a list response (`None` when disabled):
+    the version of the events lists (see `events.cache`) moves on every change of an event
+    (including attendees and categories) and deletions. The requester user is part of the ETag,
+    since the representation holds its registration state.
+    The lists relative to the current time also change when the next event starts: their ETag holds
+    the start of the next event (its single query), and they have no last modification time.
+    """
+
+    if not list_validators_enabled():
+        return None
+
+    fragments = [f'user:{request.user.pk}', f'version:{get_list_version()}']
+    last_modified = get_list_last_modified()
+    if any(request.query_params.get(param) == 'true' for param in TIME_RELATIVE_PARAMS):
+        next_timestamp = Event.objects.filter(
+            timestamp__gt=timezone.now(),
+        ).order_by('timestamp').values_list('timestamp', flat=True).first()
+        fragments.append(f'next:{next_timestamp and next_timestamp.isoformat()}')
+        last_modified = None
+
+    return quote_etag(get_request_fingerprint(request, *fragments)), last_modified
+
+
+async def aget_list_validators(request) -> Optional[Validators]:
+    """
+    Async version of `get_list_validators()` (the cache backends being sync).
+    """
+
+    return await sync_to_async(get_list_validators)(request)
+
+
+def get_event_validators(request, event: Event) -> Validators:
+    """
+    Returns the (strong) ETag and last modification time of an event response.
+    """
+
+    etag = get_request_fingerprint(
+        request,
+        f'user:{request.user.pk}',
+        event.updated_at and event.updated_at.isoformat(),
+    )
+    return quote_etag(etag), event.updated_at
+
+
+def get_not_modified_response(request, validators: Optional[Validators]) -> Optional[HttpResponseBase]:
+    """
+    Returns the `304 Not Modified` (or `412 Precondition Failed`) response
+    when the conditional headers of the request match the validators.
+    """
+
+    if validators is None:
+        return None
+
+    etag, last_modified = validators
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified and int(last_modified.timestamp()),
+    )
+
+
+def set_validators(response: HttpResponseBase, validators: Optional[Validators]) -> HttpResponseBase:
+    if validators is None:
+        return response
+
+    etag, last_modified = validators
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
@@ -1,18 +1,53 @@
-from django.db.models import QuerySet
+import base64
+import binascii
+import codecs
+import json
+from dataclasses import asdict
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models import Prefetch, Q, QuerySet
+from django.http import Http404, StreamingHttpResponse
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import mixins, permissions
 from rest_framework.decorators import action
-from rest_framework.exceptions import ValidationError
-from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound, UnsupportedMediaType, ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.viewsets import GenericViewSet
 
-from events.models import Event
-from events.serializers import EventSerializer
+from events.admission import get_registration_state, set_registration_state
+from events.authentication import StatelessJWTAuthentication
+from events.bulk import CONTENT_TYPES, CSV, FORMATS, export_events, import_events, read_rows
+from events.cache import get_list_cache_key, record_list_cache
+from events.conf import get_setting
+from events.facets import get_facets
+from events.filters import EventSearchFilter
+from events.models import ArchivedEvent, Category, CombinedEvent, Event, WaitlistEntry
+from events.replicas import choose_replica, is_pinned_to_primary, pin_to_primary, replica_reads
+from events.serializers import (
+    EventAttendeeSerializer,
+    EventBulkRegistrationResultSerializer,
+    EventBulkRegistrationSerializer,
+    EventFacetsSerializer,
+    EventListSerializer,
+    EventSerializer,
+)
+from events.throttling import RegistrationEventThrottle, RegistrationUserThrottle
+from events.views.conditional import (
+    get_event_validators,
+    get_list_validators,
+    get_not_modified_response,
+    set_validators,
+)
+
+# Rate limits of the (un-)registrations, per user and per event
+REGISTRATION_THROTTLE_CLASSES = [RegistrationUserThrottle, RegistrationEventThrottle, ]
 
 
 def _validate_event_generic_action(event: Event) -> None:
@@ -22,13 +57,75 @@ def _validate_event_generic_action(event: Event) -> None:
         - is not published
     """
 
-    if event.timestamp < timezone.now():
+    _validate_event_state(event.timestamp, event.status)
+
+
+def _validate_event_state(timestamp: datetime, status: str) -> None:
+    if timestamp < timezone.now():
         raise ValidationError({'detail': 'ACTION_NOT_ALLOWED_ON_PAST_EVENT'})
 
-    if event.status != Event.Status.PUBLISHED:
+    if status != Event.Status.PUBLISHED:
         raise ValidationError({'detail': 'ACTION_NOT_ALLOWED_ON_NON_PUBLISHED_EVENT'})
 
 
+def _fast_reject_registration(event_id, user, registering: bool) -> None:
+    """
+    Throws the DRF validation error of the (un-)registration of the user from the cached registration state
+    of the event (see `events.admission`), if any, without touching the database
+    but to tell the users already registered to a full event (a single indexed lookup),
+    so that they get the same error as from the database.
+    """
+
+    state = get_registration_state(event_id)
+    if state is None:
+        return
+
+    _validate_event_state(state['timestamp'], state['status'])
+    if registering and state['is_full']:
+        if Event.attendees.through.objects.filter(event_id=event_id, user_id=user.pk).exists():
+            raise ValidationError({'detail': 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT'})
+        raise ValidationError({'detail': 'EVENT_IS_FULL'})
+
+
+def _validate_registration(event: Event) -> None:
+    """
+    Validates the event of an (un-)registration, caching its state when rejected.
+    """
+
+    try:
+        _validate_event_generic_action(event)
+    except ValidationError:
+        set_registration_state(event)
+        raise
+
+
+def _set_is_registered(results: list[dict], user, model=Event) -> None:
+    """
+    Sets the `is_registered` flag of serialized events (of the events or archive table) for the given user,
+    with a single query.
+    """
+
+    if not results:
+        return
+
+    event_field = model.attendees.field.m2m_field_name()
+    registered_event_ids = set(
+        model.attendees.through.objects.filter(
+            user_id=user.pk,
+            **{f'{event_field}_id__in': [result['id'] for result in results]},
+        ).values_list(f'{event_field}_id', flat=True)
+    )
+    for result in results:
+        result['is_registered'] = result['id'] in registered_event_ids
+
+
+def _serialize_outcomes(outcomes: dict[int, str]) -> list[dict]:
+    return EventBulkRegistrationResultSerializer(
+        [{'user_id': user_id, 'detail': outcome} for user_id, outcome in outcomes.items()],
+        many=True,
+    ).data
+
+
 class EventResultsPagination(PageNumberPagination):
     """
     Custom pagination class to be used in Events View set
@@ -39,6 +136,107 @@ class EventResultsPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
 
 
+class EventCursorPagination(BasePagination):
+    """
+    Keyset pagination class to be used in Events View set, when requested with `pagination=cursor`.
+    Pages are keyed on (timestamp, id) in the default descending ordering,
+    so deep pages cost the same as the first one (no OFFSET, no total COUNT)
+    and stay stable under concurrent inserts.
+    """
+
+    page_size = EventResultsPagination.page_size
+    max_page_size = EventResultsPagination.max_page_size
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+    ordering = ('-timestamp', '-id', )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        if cursor is None:
+            queryset = queryset.order_by(*self.ordering)
+        else:
+            timestamp, pk, reverse = cursor
+            if reverse:
+                queryset = queryset.filter(
+                    Q(timestamp__gt=timestamp) | Q(timestamp=timestamp, pk__gt=pk),
+                ).order_by('timestamp', 'id')
+            else:
+                queryset = queryset.filter(
+                    Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, pk__lt=pk),
+                ).order_by(*self.ordering)
+
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        self.page = results[:page_size]
+
+        if cursor is not None and cursor[2]:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        return self.page
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            return datetime.fromisoformat(data['t']), int(data['i']), bool(data['r'])
+        except (binascii.Error, UnicodeError, TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, event: Event, reverse: bool) -> str:
+        data = {'t': event.timestamp.isoformat(), 'i': event.pk, 'r': int(reverse)}
+        encoded = base64.urlsafe_b64encode(json.dumps(data).encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+
+class EventAttendeesPagination(PageNumberPagination):
+    """
+    Custom pagination class to be used for the attendees of an event
+    """
+
+    page_size = 100
+    max_page_size = 1000
+    page_size_query_param = 'page_size'
+
+
 class IsEventOrganizer(permissions.BasePermission):
     """
     Allows access only to organizer of the event
@@ -49,11 +247,12 @@ class IsEventOrganizer(permissions.BasePermission):
 
 
 class EventViewSet(mixins.ListModelMixin,
+                   mixins.RetrieveModelMixin,
                    mixins.CreateModelMixin,
                    mixins.UpdateModelMixin,
                    GenericViewSet):
     """
-    View to list/create/update events
+    View to list/retrieve/create/update events
     """
 
     permission_classes = [permissions.IsAuthenticated, ]
@@ -63,7 +262,7 @@ class EventViewSet(mixins.ListModelMixin,
     filter_backends = (
         DjangoFilterBackend,
         OrderingFilter,
-        SearchFilter,
+        EventSearchFilter,
     )
     ordering_fields = '__all__'
     ordering = ('-timestamp', )
@@ -80,23 +279,143 @@ class EventViewSet(mixins.ListModelMixin,
         'categories': ('exact', ),
     }
 
+    # Read only actions, needing the id of the requester user only
+    stateless_actions = ('list', 'retrieve', 'attendees', 'facets', )
+    # Actions reading the archived events (see `events.archive`) along with the others for `only_past`,
+    # when enabled by `EVENTS['ARCHIVE_AFTER_DAYS']`
+    archive_list_actions = ('list', 'facets', 'export', )
+    # Detail actions looking up the archived events missing from the events table
+    # (the writing ones then reject them as past events, updates are not allowed)
+    archive_detail_actions = (
+        'retrieve', 'attendees', 'register', 'un_register', 'bulk_register', 'bulk_un_register', 'waitlist',
+    )
+    archive_lookup = False
+    # Whether the reads of the (safe) request go to the primary, the user having written recently
+    pinned_to_primary = False
+
+    def initialize_request(self, request, *args, **kwargs):
+        """
+        Extending inherited method, trusting the claims of the token
+        for the read only actions when `EVENTS['AUTH_STATELESS_READS']` is on.
+        """
+
+        request = super().initialize_request(request, *args, **kwargs)
+        if self.action in self.stateless_actions and get_setting('AUTH_STATELESS_READS'):
+            request.authenticators = [StatelessJWTAuthentication(), ]
+        return request
+
+    def initial(self, request, *args, **kwargs):
+        """
+        Extending inherited method, serving the reads of safe requests from a replica
+        (once the user is authenticated on the primary), unless the user wrote recently.
+        """
+
+        super().initial(request, *args, **kwargs)
+        if request.method not in permissions.SAFE_METHODS:
+            return
+        self.pinned_to_primary = is_pinned_to_primary(request.user)
+        if not self.pinned_to_primary:
+            self._replica_reads_token = replica_reads.set(choose_replica())
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Extending inherited method, restoring the reads to the primary after the request,
+        and pinning the reads of the user to the primary after a successful write.
+        """
+
+        if hasattr(self, '_replica_reads_token'):
+            replica_reads.reset(self._replica_reads_token)
+            del self._replica_reads_token
+        elif request.method not in permissions.SAFE_METHODS and response.status_code < 400:
+            pin_to_primary(request.user)
+        return super().finalize_response(request, response, *args, **kwargs)
+
     def get_permissions(self):
         """
-        Overriding pre-defined permissions, only in case of update,
-        where the requester user should be the event's organizer.
+        Overriding pre-defined permissions, in case of update,
+        where the requester user should be the event's organizer,
+        and of bulk (un-)registration, allowed to the event's organizer or staff users.
         """
 
         if self.action == 'update':
             return [*super().get_permissions(), IsEventOrganizer(), ]
+        if self.action in ('bulk_register', 'bulk_un_register'):
+            return [*super().get_permissions(), (IsEventOrganizer | permissions.IsAdminUser)(), ]
         return super().get_permissions()
 
+    @property
+    def paginator(self):
+        """
+        Switching to keyset pagination when the list is requested with `pagination=cursor`.
+        """
+
+        if not hasattr(self, '_paginator') and self.action == 'list' and self.request is not None:
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = EventCursorPagination()
+        return super().paginator
+
+    def get_serializer_class(self):
+        if self.action in ('list', 'retrieve'):
+            return EventListSerializer
+        return super().get_serializer_class()
+
+    def perform_update(self, serializer):
+        """
+        Extending inherited method, promoting waiting users when capacity of the event increases
+        (for published, future events only, where users can register).
+        """
+
+        super().perform_update(serializer)
+        event = serializer.instance
+        if event.status == Event.Status.PUBLISHED and event.timestamp > timezone.now():
+            event.promote_waitlist()
+
+    def get_object(self):
+        """
+        Extending inherited method, looking up the archived event
+        when the event is missing from the events table.
+        """
+
+        try:
+            return super().get_object()
+        except Http404:
+            if get_setting('ARCHIVE_AFTER_DAYS') is None or self.action not in self.archive_detail_actions:
+                raise
+
+        self.archive_lookup = True
+        return super().get_object()
+
+    def get_events_model(self):
+        """
+        Returns the model the events are read from: the archive table for the detail lookups falling back to it,
+        the union of the events and archive tables (`CombinedEvent`) for the `only_past` lists
+        when archiving is enabled, and the events table otherwise.
+        """
+
+        if self.archive_lookup:
+            return ArchivedEvent
+        if (
+            get_setting('ARCHIVE_AFTER_DAYS') is not None
+            and self.action in self.archive_list_actions
+            and self.request.query_params.get('only_past') == 'true'
+            and self.request.query_params.get('only_future') != 'true'
+        ):
+            return CombinedEvent
+        return Event
+
     def get_queryset(self) -> QuerySet[Event]:
-        queryset = Event.objects.all()
+        queryset = self.get_events_model().objects.all()
         current_user = self.request.user
 
+        if self.action == 'list':
+            # Fetching the categories ids of the whole page at once, instead of one query per event
+            queryset = queryset.prefetch_related(
+                Prefetch('categories', queryset=Category.objects.only('id')),
+            )
+
         only_mine_param = self.request.query_params.get('only_mine', None)
         if only_mine_param == 'true':
-            queryset = queryset.filter(organizer=current_user)
+            queryset = queryset.filter(organizer_id=current_user.pk)
 
         only_future_param = self.request.query_params.get('only_future', None)
         only_past_param = self.request.query_params.get('only_past', None)
@@ -125,19 +444,130 @@ class EventViewSet(mixins.ListModelMixin,
             ),
             OpenApiParameter(
                 name='only_past',
-                description='Filter only past events',
+                description='Filter only past events (archived ones included, when archiving is enabled)',
                 required=False,
                 location=OpenApiParameter.QUERY,
                 type=OpenApiTypes.BOOL,
             ),
+            OpenApiParameter(
+                name='pagination',
+                description=(
+                    'Use `cursor` for keyset pagination on the default ordering '
+                    '(follow the `next`/`previous` links; no `count`, `page` and `ordering`)'
+                ),
+                required=False,
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                enum=['cursor', ],
+            ),
+            OpenApiParameter(
+                name='cursor',
+                description='Cursor of keyset pagination, as returned in the `next`/`previous` links',
+                required=False,
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+            ),
         ]
     )
     def list(self, request, *args, **kwargs):
         """
-        Method provides same functionality as inherited.
-        Only purpose is to extend the schema of API document.
+        Extending inherited method:
+            - answering conditional requests (`If-None-Match`/`If-Modified-Since`)
+              with `304 Not Modified`, without serializing the page
+            - caching the (user independent) response when enabled by `EVENTS['LIST_CACHE_TIMEOUT']`
+            - filling in the registration state of the requester user for the events of the page
+        """
+
+        validators = get_list_validators(request)
+        not_modified_response = get_not_modified_response(request, validators)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        response = self._get_cached_response(
+            request,
+            lambda: super(EventViewSet, self).list(request, *args, **kwargs),
+        )
+        _set_is_registered(response.data['results'], request.user, self.get_queryset().model)
+        return set_validators(response, validators)
+
+    def _get_cached_response(self, request, get_response) -> Response:
+        """
+        Returns the (user independent) response of `get_response`, cached when enabled
+        by `EVENTS['LIST_CACHE_TIMEOUT']` (invalidated along with the events lists),
+        under the database alias serving it, as the replicas may lag behind the version of the lists.
+        Users pinned to the primary skip the cache, to read their own writes.
+        """
+
+        cache_timeout = get_setting('LIST_CACHE_TIMEOUT')
+        if not cache_timeout or self.pinned_to_primary:
+            return get_response()
+
+        cache_key = get_list_cache_key(request, f'db:{Event.objects.all().db}')
+        data = cache.get(cache_key)
+        if data is None:
+            response = get_response()
+            cache.set(cache_key, response.data, cache_timeout)
+        else:
+            response = Response(data)
+        record_list_cache(hit=data is not None)
+        response['X-Cache'] = 'MISS' if data is None else 'HIT'
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Extending inherited method, answering conditional requests with `304 Not Modified`
+        and filling in the registration state of the requester user.
+        """
+
+        event = self.get_object()
+
+        validators = get_event_validators(request, event)
+        not_modified_response = get_not_modified_response(request, validators)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        data = self.get_serializer(event).data
+        _set_is_registered([data, ], request.user, type(event))
+        return set_validators(Response(data), validators)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='only_mine',
+                description='Filter only events I organized',
+                required=False,
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+            ),
+            OpenApiParameter(
+                name='only_future',
+                description='Filter only future events (overrides only_past query param)',
+                required=False,
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+            ),
+            OpenApiParameter(
+                name='only_past',
+                description='Filter only past events (archived ones included, when archiving is enabled)',
+                required=False,
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+            ),
+        ],
+        responses=EventFacetsSerializer,
+    )
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        Custom action to count the events, filtered as the list, per category, status and time bucket
+        (in a single query), e.g. for the counts next to the filters of the list.
+        The response is cached as the list's, when enabled by `EVENTS['LIST_CACHE_TIMEOUT']`.
         """
-        return super().list(request, *args, **kwargs)
+
+        return self._get_cached_response(
+            request,
+            lambda: Response(get_facets(self.filter_queryset(self.get_queryset()))),
+        )
 
     @extend_schema(
         request={},
@@ -145,7 +575,7 @@ class EventViewSet(mixins.ListModelMixin,
             204: OpenApiResponse(description='Successfully registered'),
         },
     )
-    @action(detail=True, methods=['post'])
+    @action(detail=True, methods=['post'], throttle_classes=REGISTRATION_THROTTLE_CLASSES)
     def register(self, request, pk=None):
         """
         Custom action to register user to event.
@@ -154,20 +584,25 @@ class EventViewSet(mixins.ListModelMixin,
             - Event is not in published status
             - User is already registered to the event
             - Event is full of attendees
+        Rejections of past, non published and full events are answered from the cache for a while,
+        and registrations are rate limited per user and per event (Http Error 429).
         """
 
+        _fast_reject_registration(pk, request.user, registering=True)
+
         event = self.get_object()
         current_user = request.user
 
-        _validate_event_generic_action(event)
+        _validate_registration(event)
 
-        if current_user in event.attendees.all():
+        try:
+            event.register_attendee(current_user)
+        except Event.AlreadyRegistered:
             raise ValidationError({'detail': 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT'})
-
-        if event.capacity and event.attendees_count >= event.capacity:
+        except Event.IsFull:
+            set_registration_state(event, is_full=True)
             raise ValidationError({'detail': 'EVENT_IS_FULL'})
 
-        event.attendees.add(current_user)
         return Response(status=204)
 
     @extend_schema(
@@ -176,7 +611,12 @@ class EventViewSet(mixins.ListModelMixin,
             204: OpenApiResponse(description='Successfully un-registered'),
         },
     )
-    @action(detail=True, url_path='un-register', methods=['post'])
+    @action(
+        detail=True,
+        url_path='un-register',
+        methods=['post'],
+        throttle_classes=REGISTRATION_THROTTLE_CLASSES,
+    )
     def un_register(self, request, pk=None):
         """
         Custom action to un-register user to event.
@@ -184,15 +624,214 @@ class EventViewSet(mixins.ListModelMixin,
             - Event timestamp is past
             - Event is not in published status
             - User was not registered to the event
+        As for registrations, rejections are answered from the cache for a while, and rate limited.
         """
 
+        _fast_reject_registration(pk, request.user, registering=False)
+
         event = self.get_object()
         current_user = request.user
 
-        _validate_event_generic_action(event)
+        _validate_registration(event)
 
-        if current_user not in event.attendees.all():
+        try:
+            event.un_register_attendee(current_user)
+        except Event.NotRegistered:
             raise ValidationError({'detail': 'WAS_NOT_REGISTERED_TO_THIS_EVENT'})
 
-        event.attendees.remove(current_user)
         return Response(status=204)
+
+    @extend_schema(
+        responses=EventAttendeeSerializer(many=True),
+    )
+    @action(detail=True, methods=['get'], pagination_class=EventAttendeesPagination)
+    def attendees(self, request, pk=None):
+        """
+        Custom action to list (paginated) the attendees of event.
+        """
+
+        event = self.get_object()
+
+        queryset = event.attendees.only('id').order_by('id')
+        page = self.paginate_queryset(queryset)
+        serializer = EventAttendeeSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @extend_schema(
+        request=EventBulkRegistrationSerializer,
+        responses={
+            200: EventBulkRegistrationResultSerializer(many=True),
+        },
+    )
+    @action(detail=True, url_path='bulk-register', methods=['post'])
+    def bulk_register(self, request, pk=None):
+        """
+        Custom action to register many users to event at once (event's organizer or staff only),
+        reporting the outcome of each user.
+        Raises Http Error (400) when:
+            - Event timestamp is past
+            - Event is not in published status
+            - Not all users could be registered, unless `allow_partial` is requested
+              (`BULK_REGISTRATION_FAILED`, with the outcomes of the failed users)
+        """
+
+        return self._bulk_registration(request, Event.register_attendees)
+
+    @extend_schema(
+        request=EventBulkRegistrationSerializer,
+        responses={
+            200: EventBulkRegistrationResultSerializer(many=True),
+        },
+    )
+    @action(detail=True, url_path='bulk-un-register', methods=['post'])
+    def bulk_un_register(self, request, pk=None):
+        """
+        Custom action to un-register many users from event at once (event's organizer or staff only),
+        reporting the outcome of each user.
+        Raises Http Error (400) when:
+            - Event timestamp is past
+            - Event is not in published status
+            - Not all users could be un-registered, unless `allow_partial` is requested
+              (`BULK_REGISTRATION_FAILED`, with the outcomes of the failed users)
+        """
+
+        return self._bulk_registration(request, Event.un_register_attendees)
+
+    def _bulk_registration(self, request, method) -> Response:
+        event = self.get_object()
+
+        serializer = EventBulkRegistrationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        _validate_event_generic_action(event)
+
+        try:
+            outcomes = method(event, **serializer.validated_data)
+        except Event.BulkRegistrationFailed as exc:
+            return Response(
+                {'detail': 'BULK_REGISTRATION_FAILED', 'results': _serialize_outcomes(exc.outcomes)},
+                status=400,
+            )
+
+        return Response(_serialize_outcomes(outcomes))
+
+    @extend_schema(
+        request={content_type: OpenApiTypes.STR for content_type in CONTENT_TYPES.values()},
+        responses={
+            201: OpenApiResponse(description='Import report (`created`, `failed` and row `errors`)'),
+        },
+    )
+    @action(detail=False, url_path='import', methods=['post'])
+    def bulk_import(self, request):
+        """
+        Custom action to create many events at once (organized by the requester user),
+        from a CSV (`text/csv`, with header) or NDJSON (`application/x-ndjson`) body.
+        The body is read as a stream and validated/written in chunks;
+        invalid rows are skipped and reported.
+        """
+
+        content_type = request.content_type.split(';')[0].strip()
+        file_format = next((key for key, value in CONTENT_TYPES.items() if value == content_type), None)
+        if file_format is None:
+            raise UnsupportedMediaType(content_type)
+
+        lines = codecs.iterdecode(request._request, 'utf-8-sig')
+        result = import_events(read_rows(lines, file_format), organizer=request.user)
+        return Response(asdict(result), status=201)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='file_format',
+                description='Format of the exported file',
+                required=False,
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                enum=FORMATS,
+                default=CSV,
+            ),
+        ],
+        responses={
+            (200, content_type): OpenApiTypes.STR for content_type in CONTENT_TYPES.values()
+        },
+    )
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Custom action to export (streaming) the events, filtered as the list,
+        in CSV or NDJSON format.
+        """
+
+        file_format = request.query_params.get('file_format', CSV)
+        if file_format not in FORMATS:
+            raise ValidationError({'file_format': f'Should be one of: {", ".join(FORMATS)}'})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(export_events(queryset, file_format), content_type=CONTENT_TYPES[file_format])
+        response['Content-Disposition'] = f'attachment; filename="events.{file_format}"'
+        return response
+
+    @extend_schema(
+        methods=['GET'],
+        request=None,
+        responses={
+            200: OpenApiResponse(description='Position (1-based) of the requester user in the waitlist, or null'),
+        },
+    )
+    @extend_schema(
+        methods=['POST'],
+        request=None,
+        responses={
+            201: OpenApiResponse(description='Successfully queued, with the position in the waitlist'),
+            204: OpenApiResponse(description='Successfully registered, since the event was not full'),
+        },
+    )
+    @extend_schema(
+        methods=['DELETE'],
+        request=None,
+        responses={
+            204: OpenApiResponse(description='Successfully left the waitlist'),
+        },
+    )
+    @action(detail=True, methods=['get', 'post', 'delete'])
+    def waitlist(self, request, pk=None):
+        """
+        Custom action to manage the waitlist of a full event:
+            - GET: position of the requester user in the waitlist
+            - POST: registers user to the event if there is a free seat, or queues user
+              (waiting users are registered in FIFO order, as seats are freed)
+            - DELETE: removes user from the waitlist
+        Raises Http Error (400) when:
+            - Event timestamp is past (POST/DELETE)
+            - Event is not in published status (POST/DELETE)
+            - User is already registered to the event (POST)
+            - User is already in the waitlist of the event (POST)
+            - User was not in the waitlist of the event (DELETE)
+        """
+
+        event = self.get_object()
+        current_user = request.user
+
+        if request.method == 'GET':
+            entry = WaitlistEntry.objects.filter(event_id=event.pk, user_id=current_user.pk).first()
+            return Response({'position': entry.position if entry else None})
+
+        _validate_event_generic_action(event)
+
+        if request.method == 'DELETE':
+            try:
+                event.leave_waitlist(current_user)
+            except Event.NotWaitlisted:
+                raise ValidationError({'detail': 'WAS_NOT_IN_WAITLIST_OF_THIS_EVENT'})
+            return Response(status=204)
+
+        try:
+            position = event.join_waitlist(current_user)
+        except Event.AlreadyRegistered:
+            raise ValidationError({'detail': 'WAS_ALREADY_REGISTERED_TO_THIS_EVENT'})
+        except Event.AlreadyWaitlisted:
+            raise ValidationError({'detail': 'WAS_ALREADY_IN_WAITLIST_OF_THIS_EVENT'})
+
+        if position is None:
+            return Response(status=204)
+        return Response({'position': position}, status=201)
@@ -0,0 +1,116 @@
+from django.core.cache import cache
+from django.db.models import QuerySet
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
+from rest_framework import permissions, serializers
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from events.cache import get_list_cache_key, record_list_cache
+from events.conf import get_setting
+from events.models import Category, Event
+from events.serializers import EventCompactSerializer
+from events.views.calendar_views import get_calendar_url, rotate_calendar_token
+from events.views.event_view_set import EventCursorPagination
+
+
+class MeEventViewSet(GenericViewSet):
+    """
+    Views to list the events organized/attended by the requester user,
+    newest first, with keyset pagination
+    """
+
+    permission_classes = [permissions.IsAuthenticated, ]
+    serializer_class = EventCompactSerializer
+    pagination_class = EventCursorPagination
+    queryset = Event.objects.none()
+
+    def get_queryset(self) -> QuerySet[Event]:
+        user_id = self.request.user.pk
+
+        if self.action == 'organized':
+            # Keyset pagination on the (organizer, timestamp, id) index
+            queryset = Event.objects.filter(organizer_id=user_id)
+        elif self.action == 'attending':
+            # Join from the (indexed) user column of the attendees table
+            queryset = Event.objects.filter(attendees=user_id)
+        else:
+            return Event.objects.none()
+
+        return queryset.only(*EventCompactSerializer.Meta.fields)
+
+    @extend_schema(responses=EventCompactSerializer(many=True))
+    @action(detail=False, methods=['get'])
+    def organized(self, request):
+        """
+        Custom action to list (paginated) the events organized by the requester user.
+        """
+
+        return self._list(request)
+
+    @extend_schema(responses=EventCompactSerializer(many=True))
+    @action(detail=False, methods=['get'])
+    def attending(self, request):
+        """
+        Custom action to list (paginated) the events the requester user is registered to.
+        """
+
+        return self._list(request)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='category',
+                description='Id of the category to get the feed of, instead of the feed of my events',
+                required=False,
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+            ),
+        ],
+        responses=inline_serializer('CalendarFeed', fields={'url': serializers.URLField()}),
+    )
+    @action(detail=False, methods=['get', 'post'])
+    def calendar(self, request):
+        """
+        Custom action to get the URL of the iCalendar feed of the events the requester user is registered to,
+        or of the published events of a category, to subscribe to from calendar apps.
+        POST rotates the token of the feeds first, revoking every URL handed out so far.
+        """
+
+        category = None
+        category_id = request.query_params.get('category')
+        if category_id is not None:
+            category = get_object_or_404(Category, pk=category_id)
+
+        if request.method == 'POST':
+            rotate_calendar_token(request.user)
+
+        return Response({'url': get_calendar_url(request, request.user, category)})
+
+    def _list(self, request) -> Response:
+        """
+        Lists the events of the action, caching the response of the user
+        when enabled by `EVENTS['LIST_CACHE_TIMEOUT']` (invalidated along with the events list).
+        """
+
+        cache_timeout = get_setting('LIST_CACHE_TIMEOUT')
+        if not cache_timeout:
+            return self._get_list_response()
+
+        cache_key = get_list_cache_key(request, f'user:{request.user.pk}')
+        data = cache.get(cache_key)
+        if data is None:
+            response = self._get_list_response()
+            cache.set(cache_key, response.data, cache_timeout)
+        else:
+            response = Response(data)
+        record_list_cache(hit=data is not None)
+        response['X-Cache'] = 'MISS' if data is None else 'HIT'
+        return response
+
+    def _get_list_response(self) -> Response:
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
@@ -0,0 +1,28 @@
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views import View
+
+from events.conf import get_setting
+from events.metrics import render_metrics
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class MetricsView(View):
+    """
+    Prometheus (text format) endpoint of the instrumentation metrics of the process.
+    Only served when `EVENTS['METRICS_ENABLED']` is on, and to the bearer of
+    `EVENTS['METRICS_TOKEN']` if set (the scrapers cannot obtain JWT tokens).
+    """
+
+    def get(self, request):
+        if not get_setting('METRICS_ENABLED'):
+            raise Http404()
+
+        token = get_setting('METRICS_TOKEN')
+        if token and not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            response = HttpResponse(status=401)
+            response['WWW-Authenticate'] = 'Bearer realm="metrics"'
+            return response
+
+        return HttpResponse(render_metrics(), content_type=PROMETHEUS_CONTENT_TYPE)